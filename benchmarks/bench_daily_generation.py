@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк генерации ежедневных предсказаний.
+
+Сравнивает прежний выбор по строкам (pool + universal для каждого знака)
+с выбором по интернированным id. Выводит время и пиковое выделение памяти
+на одну генерацию дня и проверяет, что результаты совпадают.
+
+Запуск:
+    python benchmarks/bench_daily_generation.py [число_дней]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core.daily_manager import (  # noqa: E402
+    ALL_SIGNS_ORDER, DailyPredictionManager, get_general_text_index,
+)
+from core.prediction_catalog import get_prediction_catalog  # noqa: E402
+
+
+def legacy_generate_full_day(day_key):
+    """Прежний алгоритм: строковые пулы, склейка с универсальными."""
+    rng = DailyPredictionManager._rng_for_date(day_key)
+    catalog = get_prediction_catalog()
+    universal = list(catalog.get_universal_pool("general"))
+    rng.shuffle(universal)
+    candidates = {}
+    for s in ALL_SIGNS_ORDER:
+        pool = list(catalog.get_pool(s, "general"))
+        rng.shuffle(pool)
+        candidates[s] = pool + universal
+    picked = {}
+    used = set()
+    for s in ALL_SIGNS_ORDER:
+        for text in candidates[s]:
+            if text not in used:
+                picked[s] = text
+                used.add(text)
+                break
+        if s not in picked:
+            picked[s] = f"День приносит новые возможности для {s.lower()}. Сохраняйте уверенность и спокойствие."
+    return picked
+
+
+def measure(name, func, day_keys):
+    func(day_keys[0])  # прогрев
+    started = time.perf_counter()
+    for key in day_keys:
+        func(key)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    func(day_keys[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_day_us = elapsed / len(day_keys) * 1e6
+    print(f"{name:<10} {per_day_us:10.1f} мкс/день   пик памяти {peak / 1024:8.1f} КБ/день")
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    first = date(2025, 1, 1)
+    day_keys = [(first + timedelta(days=i)).isoformat() for i in range(days)]
+
+    get_general_text_index()  # корпус строится один раз для обоих вариантов
+    manager = DailyPredictionManager.__new__(DailyPredictionManager)
+
+    for key in day_keys:
+        assert legacy_generate_full_day(key) == manager._generate_full_day(key), key
+
+    print(f"Дней: {days}, результаты совпадают")
+    measure("строки", legacy_generate_full_day, day_keys)
+    measure("id", manager._generate_full_day, day_keys)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк генератора гороскопов по темам.
+
+Сравнивает прежний выбор фраз (SHA-256 на каждую тройку знак/дата/тема)
+с зерном даты blake2b и целочисленным перемешиванием, а также пакетный
+generate_for_dates.
+
+Запуск:
+    python benchmarks/bench_horoscope_engine.py [число_дней]
+"""
+
+import hashlib
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core.horoscope_engine import (  # noqa: E402
+    _date_seed, generate_daily_horoscope, generate_for_dates,
+)
+from core.zodiac_data import THEMES_TO_PHRASES, ZODIAC_SIGNS  # noqa: E402
+
+
+def legacy_generate_daily_horoscope(sign, for_date):
+    """Прежняя реализация: SHA-256 на каждую тему."""
+    result = {}
+    seed_base = f"{sign}|{for_date.isoformat()}"
+    for theme, phrases in THEMES_TO_PHRASES.items():
+        if not phrases:
+            continue
+        digest = hashlib.sha256(f"{seed_base}|{theme}".encode("utf-8")).digest()
+        idx = int.from_bytes(digest[:8], "big", signed=False) % len(phrases)
+        result[theme] = phrases[idx]
+    return result
+
+
+def measure(name, func, calls):
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<22} {elapsed / calls * 1e6:8.2f} мкс/гороскоп")
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    first = date(2025, 1, 1)
+    dates = [first + timedelta(days=i) for i in range(days)]
+    calls = days * len(ZODIAC_SIGNS)
+
+    def per_call(func):
+        return lambda: [func(sign, d) for d in dates for sign in ZODIAC_SIGNS]
+
+    def batch():
+        _date_seed.cache_clear()
+        return generate_for_dates(ZODIAC_SIGNS, dates)
+
+    print(f"Дней: {days}, знаков: {len(ZODIAC_SIGNS)}")
+    measure("sha256 на тему", per_call(legacy_generate_daily_horoscope), calls)
+    _date_seed.cache_clear()
+    measure("зерно даты", per_call(generate_daily_horoscope), calls)
+    measure("generate_for_dates", batch, calls)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк определения знака зодиака.
+
+Сравнивает прежнюю цепочку if/elif с табличным get_zodiac_sign и
+пакетным get_zodiac_signs. Проверяет, что для всех существующих дат
+результаты совпадают, а несуществующие даты отклоняются.
+
+Запуск:
+    python benchmarks/bench_zodiac_calculator.py [число_дат]
+"""
+
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core.zodiac_calculator import (  # noqa: E402
+    DAYS_IN_MONTH, UNKNOWN_SIGN, get_zodiac_sign, get_zodiac_signs,
+)
+
+
+def legacy_get_zodiac_sign(day, month):
+    """Прежняя реализация (if/elif, без проверки числа дней в месяце)."""
+    if not (1 <= day <= 31 and 1 <= month <= 12):
+        return "Не определено"
+    if (month == 3 and day >= 21) or (month == 4 and day <= 19):
+        return "Овен"
+    elif (month == 4 and day >= 20) or (month == 5 and day <= 20):
+        return "Телец"
+    elif (month == 5 and day >= 21) or (month == 6 and day <= 20):
+        return "Близнецы"
+    elif (month == 6 and day >= 21) or (month == 7 and day <= 22):
+        return "Рак"
+    elif (month == 7 and day >= 23) or (month == 8 and day <= 22):
+        return "Лев"
+    elif (month == 8 and day >= 23) or (month == 9 and day <= 22):
+        return "Дева"
+    elif (month == 9 and day >= 23) or (month == 10 and day <= 22):
+        return "Весы"
+    elif (month == 10 and day >= 23) or (month == 11 and day <= 21):
+        return "Скорпион"
+    elif (month == 11 and day >= 22) or (month == 12 and day <= 21):
+        return "Стрелец"
+    elif (month == 12 and day >= 22) or (month == 1 and day <= 19):
+        return "Козерог"
+    elif (month == 1 and day >= 20) or (month == 2 and day <= 18):
+        return "Водолей"
+    elif (month == 2 and day >= 19) or (month == 3 and day <= 20):
+        return "Рыбы"
+    else:
+        return "Не определено"
+
+
+def check():
+    for month in range(0, 14):
+        for day in range(-1, 33):
+            expected = legacy_get_zodiac_sign(day, month)
+            if 1 <= month <= 12 and day > DAYS_IN_MONTH[month]:
+                expected = UNKNOWN_SIGN
+            assert get_zodiac_sign(day, month) == expected, (day, month)
+
+
+def measure(name, func, count):
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<22} {elapsed / count * 1e9:8.1f} нс/дата")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    check()
+
+    rng = random.Random(1)
+    days = array('B', (rng.randint(1, 28) for _ in range(count)))
+    months = array('B', (rng.randint(1, 12) for _ in range(count)))
+    pairs = list(zip(days, months))
+
+    print(f"Дат: {count}, результаты совпадают")
+    measure("if/elif", lambda: [legacy_get_zodiac_sign(d, m) for d, m in pairs], count)
+    measure("таблица", lambda: [get_zodiac_sign(d, m) for d, m in pairs], count)
+    measure("get_zodiac_signs", lambda: get_zodiac_signs(days, months), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,9 +3,10 @@ title = ZODI
 package.name = zodi
 package.domain = com.zodi
 source.dir = .
-source.include_exts = py,png,jpg,kv,atlas,json,ttf
+source.include_exts = py,png,jpg,kv,atlas,json,ttf,zdb
+source.exclude_dirs = benchmarks
 version = 1.0.0
-requirements = python3,kivy==2.2.1,kivymd==1.1.1,plyer,schedule
+requirements = python3,kivy==2.2.1,kivymd==1.1.1,plyer
 
 [buildozer]
 log_level = 2
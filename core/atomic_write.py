@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Атомарная запись файлов
+
+Данные пишутся во временный файл в том же каталоге, сбрасываются на диск
+(fsync) и подменяют целевой файл через os.replace. Прерванная запись
+оставляет прежнюю версию файла нетронутой. По желанию хранятся
+резервные копии последних удачных версий: <файл>.bak1, <файл>.bak2, ...
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Callable, Iterator, Optional, Tuple
+
+
+def backup_path(path: str, n: int = 1) -> str:
+    """Путь к n-й резервной копии файла."""
+    return f"{path}.bak{n}"
+
+
+def _fsync_dir(directory: str) -> None:
+    # На POSIX переименование становится устойчивым только после fsync каталога
+    if os.name != 'posix':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _rotate_backups(path: str, backups: int) -> None:
+    """Сдвинуть резервные копии и сохранить текущий файл как .bak1"""
+    if not os.path.exists(path):
+        return
+    for n in range(backups - 1, 0, -1):
+        older = backup_path(path, n)
+        if os.path.exists(older):
+            os.replace(older, backup_path(path, n + 1))
+    newest = backup_path(path, 1)
+    if os.path.exists(newest):
+        os.remove(newest)
+    try:
+        # Жёсткая ссылка дешевле копирования и не трогает сам файл
+        os.link(path, newest)
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+def atomic_write_bytes(path: str, data: bytes, backups: int = 0) -> None:
+    """Атомарно записать байты в файл.
+
+    Args:
+        path: целевой файл
+        data: содержимое
+        backups: сколько прошлых версий хранить (.bak1 - самая свежая)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if backups > 0:
+            _rotate_backups(path, backups)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+def atomic_write_text(path: str, text: str, encoding: str = 'utf-8', backups: int = 0) -> None:
+    """Атомарно записать текст в файл (см. atomic_write_bytes)."""
+    atomic_write_bytes(path, text.encode(encoding), backups=backups)
+
+
+def iter_versions(path: str, backups: int) -> Iterator[str]:
+    """Файл и его резервные копии - от самой свежей версии к старой."""
+    yield path
+    for n in range(1, backups + 1):
+        yield backup_path(path, n)
+
+
+def read_first_valid(path: str, backups: int, parse: Callable[[str], Optional[object]],
+                     encoding: str = 'utf-8') -> Tuple[Optional[object], Optional[str]]:
+    """Прочитать первую версию файла, которую parse смог разобрать.
+
+    parse получает текст и возвращает результат или None (или бросает
+    исключение), если версия повреждена. Возвращает (результат, путь)
+    либо (None, None), если ни одна версия не подошла.
+    """
+    for candidate in iter_versions(path, backups):
+        try:
+            with open(candidate, 'r', encoding=encoding) as f:
+                result = parse(f.read())
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"Повреждённая версия файла {candidate}: {e}")
+            continue
+        if result is not None:
+            return result, candidate
+    return None, None
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Потоковая классификация дат рождения из CSV
+
+К каждой строке добавляются знак зодиака, его символ, элемент и
+планета-управитель. Строки читаются порциями, классифицируются по
+заранее построенной таблице и сразу пишутся в выходной файл, так что
+память не зависит от размера файла. Для больших файлов порции можно
+обрабатывать в пуле процессов.
+
+Запуск:
+    python -m core.birthdate_classifier input.csv output.csv [--date-column birth_date]
+        [--chunk-size 10000] [--workers N] [--delimiter ,]
+"""
+
+import argparse
+import csv
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from .zodiac_calculator import UNKNOWN_SIGN, ZODIAC_SIGN_NAMES, get_zodiac_ordinals
+from .zodiac_data import ZODIAC_DATA
+from .zodiac_symbols import ZodiacSymbols
+
+DEFAULT_DATE_COLUMN = 'birth_date'
+DEFAULT_CHUNK_SIZE = 10000
+OUTPUT_COLUMNS = ('zodiac_sign', 'zodiac_symbol', 'element', 'ruling_planet')
+
+
+def _build_classification_table() -> Tuple[Tuple[str, str, str, str], ...]:
+    """(знак, символ, элемент, планета) по номеру знака; индекс -1 - неверная дата"""
+    symbols = ZodiacSymbols()
+    rows = []
+    for sign in ZODIAC_SIGN_NAMES:
+        data = ZODIAC_DATA.get(sign, {})
+        rows.append((sign, symbols.get_symbol(sign),
+                     data.get('element', ''), data.get('ruling_planet', '')))
+    rows.append((UNKNOWN_SIGN, '', '', ''))
+    return tuple(rows)
+
+
+CLASSIFICATION = _build_classification_table()
+
+
+def parse_day_month(value: str) -> Tuple[int, int]:
+    """
+    Извлечь (день, месяц) из даты вида YYYY-MM-DD, DD-MM-YYYY, DD.MM.YYYY или DD/MM/YYYY
+
+    Порядок частей через '-' определяется по положению четырёхзначного года;
+    неоднозначные даты не угадываются.
+
+    Returns:
+        (день, месяц) или (0, 0), если дату не удалось разобрать
+    """
+    value = value.strip()
+    try:
+        if '-' in value:
+            parts = value.split('-')
+            if len(parts) == 3:
+                if len(parts[0]) == 4:
+                    # YYYY-MM-DD, возможно со временем после дня
+                    return int(parts[2][:2]), int(parts[1])
+                if len(parts[2]) == 4:
+                    return int(parts[0]), int(parts[1])
+        elif '.' in value or '/' in value:
+            parts = value.replace('/', '.').split('.')
+            if len(parts) >= 2:
+                return int(parts[0]), int(parts[1])
+    except ValueError:
+        pass
+    return 0, 0
+
+
+def classify_chunk(rows: Sequence[List[str]], date_index: int) -> List[List[str]]:
+    """Добавить к строкам порции колонки OUTPUT_COLUMNS"""
+    days = []
+    months = []
+    for row in rows:
+        day, month = parse_day_month(row[date_index]) if date_index < len(row) else (0, 0)
+        days.append(day)
+        months.append(month)
+    table = CLASSIFICATION
+    return [row + list(table[ordinal])
+            for row, ordinal in zip(rows, get_zodiac_ordinals(days, months))]
+
+
+def _chunks(rows: Iterable[List[str]], chunk_size: int) -> Iterator[List[List[str]]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_classified(rows: Iterable[List[str]], date_index: int,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 0) -> Iterator[List[str]]:
+    """
+    Генератор классифицированных строк (без заголовка)
+
+    Args:
+        rows: строки CSV (списки полей)
+        date_index: номер колонки с датой рождения
+        chunk_size: размер порции
+        workers: число процессов; 0 или 1 - в текущем процессе
+
+    Порядок строк сохраняется. В режиме пула в обработке одновременно не
+    больше 2 * workers порций.
+    """
+    chunks = _chunks(rows, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from classify_chunk(chunk, date_index)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(classify_chunk, chunk, date_index))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def classify_csv(input_path: str, output_path: str, date_column: str = DEFAULT_DATE_COLUMN,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 0,
+                 delimiter: str = ',', encoding: str = 'utf-8') -> int:
+    """
+    Классифицировать CSV-файл с заголовком и записать результат
+
+    Returns:
+        Число записанных строк (без заголовка)
+    """
+    written = 0
+    with open(input_path, 'r', encoding=encoding, newline='') as src, \
+            open(output_path, 'w', encoding=encoding, newline='') as dst:
+        reader = csv.reader(src, delimiter=delimiter)
+        writer = csv.writer(dst, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        if date_column not in header:
+            raise ValueError(f"В файле нет колонки {date_column}")
+        writer.writerow(header + list(OUTPUT_COLUMNS))
+
+        # Короткие строки дополняются, чтобы новые колонки не съезжали
+        width = len(header)
+        rows = (row if len(row) >= width else row + [''] * (width - len(row)) for row in reader)
+        batch = []
+        for row in iter_classified(rows, header.index(date_column), chunk_size, workers):
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                writer.writerows(batch)
+                written += len(batch)
+                batch = []
+        writer.writerows(batch)
+        written += len(batch)
+    return written
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Добавить знак зодиака к датам рождения в CSV")
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--date-column', default=DEFAULT_DATE_COLUMN)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=0)
+    parser.add_argument('--delimiter', default=',')
+    args = parser.parse_args(argv)
+
+    try:
+        count = classify_csv(args.input, args.output, args.date_column,
+                             max(1, args.chunk_size), args.workers, args.delimiter)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка классификации: {e}")
+        return 1
+    print(f"Обработано строк: {count}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Ограниченная история записей профиля
+
+Кольцевой буфер (deque с maxlen): добавление и вытеснение самой старой
+записи за O(1), последние N записей - без копирования всего списка.
+Сериализуется компактно: имена полей один раз, строки - списки значений,
+знаки зодиака - номерами, даты - целым числом микросекунд от 1970-01-01.
+
+Даты кодируются без потерь: время берётся «как записано» (без перевода
+через часовой пояс устройства), микросекунды сохраняются, поэтому смена
+пояса или переход на летнее время не сдвигают историю. Строки, которые
+нельзя восстановить в точности (например, со смещением пояса), хранятся
+как есть.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+try:
+    from .zodiac_data import ZODIAC_SIGNS
+except ImportError:
+    from zodiac_data import ZODIAC_SIGNS
+
+HISTORY_FORMAT = 2
+# Формат 1: даты - секунды epoch в локальном поясе (только чтение)
+LEGACY_EPOCH_FORMAT = 1
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Номер знака в компактной записи - позиция в ZODIAC_SIGNS
+SIGN_ORDER = tuple(ZODIAC_SIGNS)
+_SIGN_INDEX = {sign: i for i, sign in enumerate(SIGN_ORDER)}
+
+# Поля записей: (имя, вид); вид 'sign' - номер знака, 'epoch' - дата в секундах
+FAVORITE_FIELDS = (('type', 'str'), ('text', 'str'), ('date', 'epoch'))
+COMPATIBILITY_FIELDS = (('sign1', 'sign'), ('sign2', 'sign'), ('relationship_type', 'str'),
+                        ('score', 'int'), ('description', 'str'), ('date', 'epoch'))
+
+
+def _encode_date(value: str) -> Any:
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if moment.tzinfo is not None:
+        return value
+    encoded = (moment - _EPOCH) // _MICROSECOND
+    # Сжимается только то, что восстанавливается в ту же строку
+    return encoded if _decode_date(encoded) == value else value
+
+
+def _decode_date(value: int) -> str:
+    return (_EPOCH + value * _MICROSECOND).isoformat()
+
+
+def _encode_value(kind: str, value: Any) -> Any:
+    # Значения, которые нельзя сжать, хранятся как есть
+    if kind == 'sign':
+        return _SIGN_INDEX.get(value, value)
+    if kind == 'epoch' and isinstance(value, str):
+        return _encode_date(value)
+    return value
+
+
+def _decode_value(kind: str, value: Any, history_format: int = HISTORY_FORMAT) -> Any:
+    if kind == 'sign' and isinstance(value, int) and 0 <= value < len(SIGN_ORDER):
+        return SIGN_ORDER[value]
+    if kind == 'epoch' and isinstance(value, int):
+        if history_format == LEGACY_EPOCH_FORMAT:
+            return datetime.fromtimestamp(value).isoformat()
+        return _decode_date(value)
+    return value
+
+
+class BoundedHistory:
+    """История фиксированной длины: самые старые записи вытесняются."""
+
+    __slots__ = ('maxlen', 'fields', '_items')
+
+    def __init__(self, maxlen: int, fields: Sequence[Tuple[str, str]],
+                 items: Iterable[Dict[str, Any]] = ()) -> None:
+        self.maxlen = maxlen
+        self.fields = tuple(fields)
+        self._items = deque(items, maxlen=maxlen)
+
+    # ---------------------------- public API ----------------------------
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Добавить запись (самая старая вытесняется при переполнении)."""
+        self._items.append(entry)
+
+    def last(self, n: int) -> List[Dict[str, Any]]:
+        """Последние n записей, от старых к новым."""
+        if n <= 0:
+            return []
+        if n >= len(self._items):
+            return list(self._items)
+        tail = list(islice(reversed(self._items), n))
+        tail.reverse()
+        return tail
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Все записи обычным списком (для экспорта)."""
+        return list(self._items)
+
+    def to_compact(self) -> Dict[str, Any]:
+        """Компактное представление для JSON."""
+        return {
+            'format': HISTORY_FORMAT,
+            'fields': [name for name, _ in self.fields],
+            'rows': [[_encode_value(kind, entry.get(name)) for name, kind in self.fields]
+                     for entry in self._items],
+        }
+
+    @classmethod
+    def from_serialized(cls, data: Any, maxlen: int,
+                        fields: Sequence[Tuple[str, str]]) -> 'BoundedHistory':
+        """Восстановить из компактного представления или прежнего списка словарей."""
+        history_format = data.get('format') if isinstance(data, dict) else None
+        if history_format in (HISTORY_FORMAT, LEGACY_EPOCH_FORMAT):
+            names = data.get('fields', [])
+            kinds = dict(fields)
+            items = ({name: _decode_value(kinds.get(name, 'str'), value, history_format)
+                      for name, value in zip(names, row)}
+                     for row in data.get('rows', []))
+            return cls(maxlen, fields, items)
+        if isinstance(data, (list, BoundedHistory)):
+            return cls(maxlen, fields, (entry for entry in data if isinstance(entry, dict)))
+        return cls(maxlen, fields)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
@@ -7,10 +7,100 @@ ZODI - Калькулятор совместимости знаков зодиа
 
 import json
 import os
-from typing import Dict, List, Tuple, Literal
+from array import array
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Literal
+
+from .compatibility_engine import (
+    RELATIONSHIP_ORDER, SIGN_ELEMENTS, TYPE_ADJUSTMENTS, ZODIAC_ORDER,
+    CompatibilityScoringEngine, element_compatibility_label, fallback_element_bonus,
+)
+
+# Совместимые пары планет (проверка за O(1))
+COMPATIBLE_PLANETS = frozenset({
+    ('Солнце', 'Луна'), ('Луна', 'Солнце'),
+    ('Меркурий', 'Венера'), ('Венера', 'Меркурий'),
+    ('Марс', 'Юпитер'), ('Юпитер', 'Марс')
+})
+
+
+def _freeze(value: Any) -> Any:
+    """Сделать результат неизменяемым: dict -> MappingProxyType, list -> tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Обратное к _freeze: обычные dict и list (например, для JSON)"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+class CompatibilityResult(Mapping):
+    """Результат совместимости с ленивыми текстовыми разделами
+
+    Баллы и тип отношений известны сразу. Описание, сильные стороны,
+    сложности, рекомендации и анализ элементов/планет строятся при первом
+    обращении (result['description'] или result.description) и кешируются.
+    Объект только для чтения: списки - кортежи, словари - MappingProxyType.
+    """
+    
+    KEYS = ('score', 'love_score', 'friendship_score', 'business_score', 'intellectual_score',
+            'description', 'strengths', 'challenges', 'element_analysis', 'planet_influence',
+            'recommendations', 'relationship_type')
+    
+    __slots__ = ('_values', '_builders')
+    
+    def __init__(self, values: Dict[str, Any], builders: Dict[str, Callable[[], Any]]):
+        self._values = values
+        self._builders = builders
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        builder = self._builders.get(key)
+        if builder is None:
+            raise KeyError(key)
+        value = _freeze(builder())
+        # Гонка потоков безвредна: оба построят одинаковое значение
+        self._values[key] = value
+        return value
+    
+    def __getattr__(self, name: str) -> Any:
+        if name in CompatibilityResult.KEYS:
+            return self[name]
+        raise AttributeError(name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def __repr__(self) -> str:
+        return f"CompatibilityResult(score={self._values['score']}, relationship_type={self._values['relationship_type']!r})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Полный результат обычным словарём (строит все разделы)"""
+        return {key: _thaw(self[key]) for key in self.KEYS}
+
 
 class CompatibilityCalculator:
-    """Класс для расчета совместимости знаков зодиака"""
+    """Класс для расчета совместимости знаков зодиака
+
+    Все 12 x 12 x 4 результата рассчитываются один раз при создании и
+    отдаются из неизменяемой таблицы: повторные вызовы calculate_compatibility
+    не строят словари и списки заново. Текстовые разделы результата
+    (CompatibilityResult) строятся только при обращении к ним.
+    """
     
     def __init__(self):
         self.compatibility_matrix = self._load_compatibility_matrix()
@@ -22,6 +112,10 @@ class CompatibilityCalculator:
             'business': 'Деловые отношения',
             'family': 'Семейные отношения'
         }
+        self.engine = CompatibilityScoringEngine(self.compatibility_matrix, self.elements)
+        self._raw_matrix = self._build_raw_matrix()
+        self._score_matrix = self._build_score_matrix()
+        self._result_table = self._build_result_table()
     
     def _load_compatibility_matrix(self) -> Dict:
         """Загрузить матрицу совместимости"""
@@ -53,12 +147,7 @@ class CompatibilityCalculator:
     
     def _get_elements_mapping(self) -> Dict[str, str]:
         """Получить соответствие знаков элементам"""
-        return {
-            "Овен": "Огонь", "Лев": "Огонь", "Стрелец": "Огонь",
-            "Телец": "Земля", "Дева": "Земля", "Козерог": "Земля",
-            "Близнецы": "Воздух", "Весы": "Воздух", "Водолей": "Воздух",
-            "Рак": "Вода", "Скорпион": "Вода", "Рыбы": "Вода"
-        }
+        return dict(SIGN_ELEMENTS)
     
     def _get_planets_mapping(self) -> Dict[str, str]:
         """Получить соответствие знаков планетам"""
@@ -104,117 +193,188 @@ class CompatibilityCalculator:
         return min(100, max(0, base + bonus))
     
     def calculate_compatibility(self, sign1: str, sign2: str, 
-                               relationship_type: Literal['romantic', 'friendship', 'business', 'family'] = 'romantic') -> Dict:
-        """Рассчитать совместимость между двумя знаками"""
-        
-        # Многоуровневый анализ
-        love_score = self.calculate_love_compatibility(sign1, sign2)
-        friendship_score = self.calculate_friendship_compatibility(sign1, sign2)
-        business_score = self.calculate_business_compatibility(sign1, sign2)
-        intellectual_score = self.calculate_intellectual_compatibility(sign1, sign2)
-        
-        # Взвешенный итоговый балл
-        final_score = int(
-            love_score * 0.40 +
-            friendship_score * 0.25 +
-            business_score * 0.20 +
-            intellectual_score * 0.15
-        )
-        
-        # Базовый балл совместимости
+                               relationship_type: Literal['romantic', 'friendship', 'business', 'family'] = 'romantic') -> Mapping:
+        """Рассчитать совместимость между двумя знаками
+
+        Для известных знаков возвращается общий неизменяемый результат из
+        таблицы (списки - кортежи, словари - MappingProxyType). Доступ как
+        к словарю сохраняется; текстовые разделы строятся лениво.
+        """
+        result = self._result_table.get((sign1, sign2, relationship_type))
+        if result is not None:
+            return result
+        return self._compute_compatibility(sign1, sign2, relationship_type)
+    
+    def rank_partners(self, sign: str, relationship_type: str = 'romantic',
+                      top_k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Партнёры знака по убыванию итогового балла
+
+        Берётся только целочисленная матрица баллов - описания и рекомендации
+        для кандидатов не строятся. Пары с одинаковым баллом (обычно 100)
+        упорядочиваются по сумме до ограничения 0..100; при полном равенстве
+        сохраняется порядок знаков зодиака.
+
+        Returns:
+            Список (знак, балл); пустой для неизвестного знака или типа отношений
+        """
+        row = self._score_row(sign, relationship_type)
+        if row is None:
+            return []
+        raw_row = self._score_row(sign, relationship_type, self._raw_matrix)
+        order = sorted(range(len(ZODIAC_ORDER)), key=lambda j: -raw_row[j])
+        ranked = [(ZODIAC_ORDER[j], row[j]) for j in order]
+        if top_k is not None:
+            ranked = ranked[:max(0, top_k)]
+        return ranked
+    
+    def all_pairs_matrix(self, relationship_type: str = 'romantic') -> List[List[int]]:
+        """Матрица 12 x 12 итоговых баллов (строки и столбцы - ZODIAC_ORDER)"""
+        t = self.engine.type_index.get(relationship_type)
+        if t is None:
+            return []
+        size = len(ZODIAC_ORDER)
+        start = t * size * size
+        return [self._score_matrix[start + i * size:start + (i + 1) * size].tolist()
+                for i in range(size)]
+    
+    def _score_row(self, sign: str, relationship_type: str,
+                   matrix: Optional[array] = None) -> Optional[array]:
+        i = self.engine.sign_index.get(sign)
+        t = self.engine.type_index.get(relationship_type)
+        if i is None or t is None:
+            return None
+        size = len(ZODIAC_ORDER)
+        start = (t * size + i) * size
+        matrix = self._score_matrix if matrix is None else matrix
+        return matrix[start:start + size]
+    
+    def _build_score_matrix(self) -> array:
+        """Итоговые баллы в плоском массиве [тип][знак1][знак2]"""
+        return array('B', (min(100, max(0, raw)) for raw in self._raw_matrix))
+    
+    def _build_raw_matrix(self) -> array:
+        """Баллы до ограничения 0..100 (для упорядочивания равных) [тип][знак1][знак2]"""
+        size = len(ZODIAC_ORDER)
+        return array('h', (self.engine.raw_score(i, j, t)
+                           for t in range(len(RELATIONSHIP_ORDER))
+                           for i in range(size)
+                           for j in range(size)))
+    
+    def _final_score(self, sign1: str, sign2: str, relationship_type: str, element_bonus: int) -> int:
+        """Итоговый балл: база + корректировка типа отношений + бонус элементов"""
         base_score = self._get_base_compatibility_score(sign1, sign2)
-        
-        # Корректировки по типу отношений
         relationship_adjustment = self._get_relationship_adjustment(sign1, sign2, relationship_type)
+        return min(100, max(0, base_score + relationship_adjustment + element_bonus))
+    
+    def _build_result_table(self) -> Mapping[Tuple[str, str, str], CompatibilityResult]:
+        """Рассчитать баллы всех 576 результатов один раз"""
+        signs = self.get_all_signs()
+        table = {}
+        for sign1 in signs:
+            for sign2 in signs:
+                for relationship_type in self.relationship_types:
+                    table[(sign1, sign2, relationship_type)] = self._compute_compatibility(
+                        sign1, sign2, relationship_type)
+        return MappingProxyType(table)
+    
+    def _compute_compatibility(self, sign1: str, sign2: str, relationship_type: str) -> CompatibilityResult:
+        """Расчет совместимости (без таблицы): баллы сразу, тексты - лениво"""
+        element_bonus = self._element_bonus(sign1, sign2)
+        planet_bonus = self._planet_bonus(sign1, sign2)
+        base_score = self._get_base_compatibility_score(sign1, sign2)
         
-        # Анализ элементов
-        element_analysis = self._analyze_elements(sign1, sign2)
-        
-        # Анализ планет
-        planet_analysis = self._analyze_planets(sign1, sign2)
-        
-        # Итоговый балл
-        final_score = min(100, max(0, base_score + relationship_adjustment + element_analysis['bonus']))
-        
-        # Генерация описания и рекомендаций
-        description = self._generate_compatibility_description(sign1, sign2, final_score, relationship_type)
-        strengths = self._get_relationship_strengths(sign1, sign2, relationship_type)
-        challenges = self._get_relationship_challenges(sign1, sign2, relationship_type)
-        recommendations = self._get_recommendations(sign1, sign2, relationship_type, final_score)
+        # Итоговый балл с корректировкой по типу отношений
+        final_score = self._final_score(sign1, sign2, relationship_type, element_bonus)
         
-        return {
+        values = {
             'score': final_score,
-            'love_score': love_score,
-            'friendship_score': friendship_score,
-            'business_score': business_score,
-            'intellectual_score': intellectual_score,
-            'description': description,
-            'strengths': strengths,
-            'challenges': challenges,
-            'element_analysis': element_analysis,
-            'planet_influence': planet_analysis,
-            'recommendations': recommendations,
+            # Многоуровневый анализ
+            'love_score': min(100, max(0, base_score + element_bonus + planet_bonus + 5)),
+            'friendship_score': min(100, max(0, base_score + element_bonus + 10)),
+            'business_score': min(100, max(0, base_score + 5)),
+            'intellectual_score': self.calculate_intellectual_compatibility(sign1, sign2),
             'relationship_type': self.relationship_types[relationship_type]
         }
+        builders = {
+            'description': lambda: self._generate_compatibility_description(
+                sign1, sign2, final_score, relationship_type),
+            'strengths': lambda: self._get_relationship_strengths(sign1, sign2, relationship_type),
+            'challenges': lambda: self._get_relationship_challenges(sign1, sign2, relationship_type),
+            'element_analysis': lambda: self._analyze_elements(sign1, sign2),
+            'planet_influence': lambda: self._analyze_planets(sign1, sign2),
+            'recommendations': lambda: self._get_recommendations(
+                sign1, sign2, relationship_type, final_score)
+        }
+        return CompatibilityResult(values, builders)
     
     def _get_base_compatibility_score(self, sign1: str, sign2: str) -> int:
         """Получить базовый балл совместимости"""
+        i = self.engine.sign_index.get(sign1)
+        j = self.engine.sign_index.get(sign2)
+        if i is not None and j is not None:
+            return self.engine.base_score(i, j)
         if 'base_compatibility' in self.compatibility_matrix:
             return self.compatibility_matrix['base_compatibility'].get(sign1, {}).get(sign2, 50)
         return 50
     
     def _get_relationship_adjustment(self, sign1: str, sign2: str, relationship_type: str) -> int:
-        """Получить корректировку по типу отношений"""
-        adjustments = {
-            'romantic': 0,      # Базовые настройки
-            'friendship': 5,    # Дружба обычно легче
-            'business': -5,     # Деловые отношения могут быть сложнее
-            'family': 10        # Семейные узы сильнее
-        }
-        return adjustments.get(relationship_type, 0)
+        """Получить корректировку по типу отношений
+
+        Парная поправка из relationship_adjustments, а для пар без записи
+        в JSON - общая поправка типа (TYPE_ADJUSTMENTS).
+        """
+        i = self.engine.sign_index.get(sign1)
+        j = self.engine.sign_index.get(sign2)
+        t = self.engine.type_index.get(relationship_type)
+        if i is not None and j is not None and t is not None:
+            return self.engine.relationship_adjustment(i, j, t)
+        return TYPE_ADJUSTMENTS.get(relationship_type, 0)
+    
+    def _element_bonus(self, sign1: str, sign2: str) -> int:
+        """Бонус элементов пары (без построения текста анализа)"""
+        i = self.engine.sign_index.get(sign1)
+        j = self.engine.sign_index.get(sign2)
+        if i is not None and j is not None:
+            return self.engine.element_pair_bonus(i, j)
+        return fallback_element_bonus(self.elements.get(sign1, "Неизвестно"),
+                                      self.elements.get(sign2, "Неизвестно"))
+    
+    def _planet_bonus(self, sign1: str, sign2: str) -> int:
+        """Бонус планет пары (без построения текста анализа)"""
+        planet1 = self.planets.get(sign1, "Неизвестно")
+        planet2 = self.planets.get(sign2, "Неизвестно")
+        return 5 if (planet1, planet2) in COMPATIBLE_PLANETS else 0
     
     def _analyze_elements(self, sign1: str, sign2: str) -> Dict:
-        """Анализ совместимости элементов"""
+        """Анализ совместимости элементов
+
+        Оценка и описание берутся из той же записи element_compatibility,
+        что и бонус; встроенные тексты - если описания в JSON нет.
+        """
         element1 = self.elements.get(sign1, "Неизвестно")
         element2 = self.elements.get(sign2, "Неизвестно")
+        bonus = self._element_bonus(sign1, sign2)
+        label = element_compatibility_label(bonus)
         
-        if element1 == element2:
-            return {
-                'compatibility': 'Отличная',
-                'description': f'Оба знака принадлежат к элементу {element1}. Глубокое понимание и схожие подходы к жизни.',
-                'bonus': 15
-            }
-        
-        # Совместимые элементы
-        compatible_pairs = [
-            ('Огонь', 'Воздух'), ('Воздух', 'Огонь'),
-            ('Земля', 'Вода'), ('Вода', 'Земля')
-        ]
-        
-        if (element1, element2) in compatible_pairs:
-            return {
-                'compatibility': 'Хорошая',
-                'description': f'Элементы {element1} и {element2} хорошо дополняют друг друга.',
-                'bonus': 10
-            }
-        
-        # Несовместимые элементы
-        incompatible_pairs = [
-            ('Огонь', 'Вода'), ('Вода', 'Огонь'),
-            ('Земля', 'Воздух'), ('Воздух', 'Земля')
-        ]
-        
-        if (element1, element2) in incompatible_pairs:
-            return {
-                'compatibility': 'Сложная',
-                'description': f'Элементы {element1} и {element2} могут конфликтовать, но различия могут быть источником роста.',
-                'bonus': -5
-            }
+        i = self.engine.sign_index.get(sign1)
+        j = self.engine.sign_index.get(sign2)
+        description = self.engine.element_description(i, j) if i is not None and j is not None else None
+        if description:
+            pair = f'Оба знака - {element1}' if element1 == element2 else f'{element1} и {element2}'
+            description = f'{pair}: {description}.'
+        elif element1 == element2:
+            description = f'Оба знака принадлежат к элементу {element1}. Глубокое понимание и схожие подходы к жизни.'
+        elif label in ('Отличная', 'Хорошая'):
+            description = f'Элементы {element1} и {element2} хорошо дополняют друг друга.'
+        elif label == 'Сложная':
+            description = f'Элементы {element1} и {element2} могут конфликтовать, но различия могут быть источником роста.'
+        else:
+            description = f'Элементы {element1} и {element2} нейтральны друг к другу.'
         
         return {
-            'compatibility': 'Нейтральная',
-            'description': f'Элементы {element1} и {element2} нейтральны друг к другу.',
-            'bonus': 0
+            'compatibility': label,
+            'description': description,
+            'bonus': bonus
         }
     
     def _analyze_planets(self, sign1: str, sign2: str) -> Dict:
@@ -223,13 +383,7 @@ class CompatibilityCalculator:
         planet2 = self.planets.get(sign2, "Неизвестно")
         
         # Совместимые планеты
-        compatible_planets = [
-            ('Солнце', 'Луна'), ('Луна', 'Солнце'),
-            ('Меркурий', 'Венера'), ('Венера', 'Меркурий'),
-            ('Марс', 'Юпитер'), ('Юпитер', 'Марс')
-        ]
-        
-        if (planet1, planet2) in compatible_planets:
+        if (planet1, planet2) in COMPATIBLE_PLANETS:
             return {
                 'influence': 'Гармоничное',
                 'description': f'Планеты {planet1} и {planet2} создают гармоничное взаимодействие.',
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Индексированный движок баллов совместимости
+
+Таблицы из data/compatibility_matrix.json (base_compatibility,
+relationship_adjustments, detailed_analysis.element_compatibility)
+один раз переводятся в плотные массивы по порядковым номерам знаков и
+элементов. Балл пары - несколько чтений из массивов. Если в JSON нет
+таблицы или значения, используются встроенные значения.
+
+Проверка таблиц: python -m core.compatibility_engine
+"""
+
+import json
+import os
+from array import array
+from typing import Dict, List, Optional
+
+from .zodiac_data import ZODIAC_DATA, ZODIAC_SIGNS
+
+# Порядок знаков, элементов и типов отношений в массивах
+ZODIAC_ORDER = tuple(ZODIAC_SIGNS)
+ELEMENT_ORDER = ("Огонь", "Земля", "Воздух", "Вода")
+RELATIONSHIP_ORDER = ('romantic', 'friendship', 'business', 'family')
+SIGN_COUNT = len(ZODIAC_ORDER)
+ELEMENT_COUNT = len(ELEMENT_ORDER)
+
+SIGN_ELEMENTS = {sign: ZODIAC_DATA[sign]['element'] for sign in ZODIAC_ORDER}
+
+DEFAULT_BASE_SCORE = 50
+
+# Общая корректировка по типу отношений - для пар, которых нет в
+# relationship_adjustments (парная поправка из JSON её заменяет)
+TYPE_ADJUSTMENTS = {
+    'romantic': 0,      # Базовые настройки
+    'friendship': 5,    # Дружба обычно легче
+    'business': -5,     # Деловые отношения могут быть сложнее
+    'family': 10        # Семейные узы сильнее
+}
+
+# Встроенные бонусы элементов - запасной вариант для element_compatibility
+SAME_ELEMENT_BONUS = 15
+COMPATIBLE_ELEMENT_BONUS = 10
+INCOMPATIBLE_ELEMENT_BONUS = -5
+
+COMPATIBLE_ELEMENTS = frozenset({
+    ('Огонь', 'Воздух'), ('Воздух', 'Огонь'),
+    ('Земля', 'Вода'), ('Вода', 'Земля')
+})
+INCOMPATIBLE_ELEMENTS = frozenset({
+    ('Огонь', 'Вода'), ('Вода', 'Огонь'),
+    ('Земля', 'Воздух'), ('Воздух', 'Земля')
+})
+
+MATRIX_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'compatibility_matrix.json')
+
+
+def element_compatibility_label(bonus: int) -> str:
+    """Оценка пары элементов по её бонусу (тот же бонус, что идёт в балл)"""
+    if bonus >= SAME_ELEMENT_BONUS:
+        return 'Отличная'
+    if bonus > 0:
+        return 'Хорошая'
+    if bonus < 0:
+        return 'Сложная'
+    return 'Нейтральная'
+
+
+def fallback_element_bonus(element1: str, element2: str) -> int:
+    """Встроенный бонус пары элементов"""
+    if element1 == element2:
+        return SAME_ELEMENT_BONUS
+    if (element1, element2) in COMPATIBLE_ELEMENTS:
+        return COMPATIBLE_ELEMENT_BONUS
+    if (element1, element2) in INCOMPATIBLE_ELEMENTS:
+        return INCOMPATIBLE_ELEMENT_BONUS
+    return 0
+
+
+class CompatibilityScoringEngine:
+    """Баллы совместимости из плотных массивов
+
+    Раскладка массивов:
+        base          [знак1][знак2]
+        pair_adjust   [тип][знак1][знак2] - поправка из JSON или TYPE_ADJUSTMENTS
+        element_bonus [элемент1][элемент2]
+        sign_element  [знак] -> номер элемента
+    """
+
+    def __init__(self, matrix: Optional[Dict] = None, elements: Optional[Dict[str, str]] = None):
+        self.matrix = matrix if matrix is not None else {}
+        self.sign_index = {sign: i for i, sign in enumerate(ZODIAC_ORDER)}
+        self.element_index = {element: i for i, element in enumerate(ELEMENT_ORDER)}
+        self.type_index = {rt: i for i, rt in enumerate(RELATIONSHIP_ORDER)}
+
+        elements = elements or SIGN_ELEMENTS
+        self.sign_element = array('B', (self.element_index[elements[sign]] for sign in ZODIAC_ORDER))
+        self.type_base = array('b', (TYPE_ADJUSTMENTS[rt] for rt in RELATIONSHIP_ORDER))
+        self.base = self._compile_base()
+        self.pair_adjust = self._compile_pair_adjustments()
+        self.element_bonus, self.element_descriptions = self._compile_elements()
+
+    # ---------------------------- public API ----------------------------
+    def sign_ordinal(self, sign: str) -> Optional[int]:
+        """Порядковый номер знака или None"""
+        return self.sign_index.get(sign)
+
+    def base_score(self, i: int, j: int) -> int:
+        """Базовый балл пары по номерам знаков"""
+        return self.base[i * SIGN_COUNT + j]
+
+    def relationship_adjustment(self, i: int, j: int, t: int) -> int:
+        """Корректировка типа отношений: парная из JSON, иначе общая для типа"""
+        return self.pair_adjust[(t * SIGN_COUNT + i) * SIGN_COUNT + j]
+
+    def element_pair_bonus(self, i: int, j: int) -> int:
+        """Бонус элементов пары знаков"""
+        return self.element_bonus[self.sign_element[i] * ELEMENT_COUNT + self.sign_element[j]]
+
+    def element_description(self, i: int, j: int) -> Optional[str]:
+        """Описание пары элементов из detailed_analysis (если есть)"""
+        return self.element_descriptions[self.sign_element[i] * ELEMENT_COUNT + self.sign_element[j]]
+
+    def raw_score(self, i: int, j: int, t: int) -> int:
+        """Сумма база + корректировка типа + бонус элементов без ограничения 0..100
+
+        Нужна для упорядочивания пар, у которых итоговый балл упёрся в 100.
+        """
+        return (self.base[i * SIGN_COUNT + j]
+                + self.pair_adjust[(t * SIGN_COUNT + i) * SIGN_COUNT + j]
+                + self.element_bonus[self.sign_element[i] * ELEMENT_COUNT + self.sign_element[j]])
+
+    def score(self, i: int, j: int, t: int) -> int:
+        """Итоговый балл: база + корректировка типа + бонус элементов, 0..100"""
+        return min(100, max(0, self.raw_score(i, j, t)))
+
+    def validate(self) -> List[str]:
+        """Сверить таблицы JSON со встроенными значениями
+
+        Returns:
+            Список расхождений (пустой, если всё совпадает)
+        """
+        problems: List[str] = []
+
+        base = self.matrix.get('base_compatibility')
+        if not isinstance(base, dict):
+            problems.append("Нет таблицы base_compatibility")
+        else:
+            for sign1 in ZODIAC_ORDER:
+                row = base.get(sign1, {})
+                for sign2 in ZODIAC_ORDER:
+                    if sign2 not in row:
+                        problems.append(f"base_compatibility: нет пары {sign1}/{sign2}")
+                    elif row[sign2] != base.get(sign2, {}).get(sign1, row[sign2]):
+                        problems.append(f"base_compatibility: несимметричная пара {sign1}/{sign2}")
+            for sign in base:
+                if sign not in self.sign_index:
+                    problems.append(f"base_compatibility: неизвестный знак {sign}")
+
+        adjustments = self.matrix.get('relationship_adjustments')
+        if not isinstance(adjustments, dict):
+            problems.append("Нет таблицы relationship_adjustments")
+        else:
+            for rt, per_sign in adjustments.items():
+                if rt not in self.type_index:
+                    problems.append(f"relationship_adjustments: неизвестный тип {rt}")
+                    continue
+                for sign1, partners in per_sign.items():
+                    for sign2 in [sign1] + list(partners):
+                        if sign2 not in self.sign_index:
+                            problems.append(f"relationship_adjustments/{rt}: неизвестный знак {sign2}")
+            for rt in RELATIONSHIP_ORDER:
+                if rt not in adjustments:
+                    problems.append(f"relationship_adjustments: нет типа {rt}")
+
+        table = self._element_table()
+        if table is None:
+            problems.append("Нет таблицы detailed_analysis.element_compatibility")
+        else:
+            for element1 in ELEMENT_ORDER:
+                for element2 in ELEMENT_ORDER:
+                    entry = table.get(element1, {}).get(element2)
+                    expected = fallback_element_bonus(element1, element2)
+                    if not isinstance(entry, dict) or 'score' not in entry:
+                        problems.append(f"element_compatibility: нет пары {element1}/{element2}")
+                    elif entry['score'] != expected:
+                        problems.append(f"element_compatibility: {element1}/{element2} = {entry['score']}, "
+                                        f"встроенное значение {expected}")
+        return problems
+
+    # --------------------------- core logic ----------------------------
+    def _compile_base(self) -> array:
+        base = self.matrix.get('base_compatibility') or {}
+        scores = array('b')
+        for sign1 in ZODIAC_ORDER:
+            row = base.get(sign1, {})
+            for sign2 in ZODIAC_ORDER:
+                scores.append(int(row.get(sign2, DEFAULT_BASE_SCORE)))
+        return scores
+
+    def _compile_pair_adjustments(self) -> array:
+        adjustments = self.matrix.get('relationship_adjustments') or {}
+        # Пары без записи в JSON получают общую поправку своего типа
+        table = array('b')
+        for t in range(len(RELATIONSHIP_ORDER)):
+            table.extend([self.type_base[t]] * (SIGN_COUNT * SIGN_COUNT))
+        for rt, per_sign in adjustments.items():
+            t = self.type_index.get(rt)
+            if t is None or not isinstance(per_sign, dict):
+                continue
+            for sign1, partners in per_sign.items():
+                i = self.sign_index.get(sign1)
+                if i is None:
+                    continue
+                for sign2, bonus in partners.items():
+                    j = self.sign_index.get(sign2)
+                    if j is not None:
+                        table[(t * SIGN_COUNT + i) * SIGN_COUNT + j] = int(bonus)
+        return table
+
+    def _element_table(self) -> Optional[Dict]:
+        table = (self.matrix.get('detailed_analysis') or {}).get('element_compatibility')
+        return table if isinstance(table, dict) else None
+
+    def _compile_elements(self):
+        table = self._element_table() or {}
+        bonuses = array('b')
+        descriptions: List[Optional[str]] = []
+        for element1 in ELEMENT_ORDER:
+            for element2 in ELEMENT_ORDER:
+                entry = table.get(element1, {}).get(element2)
+                if isinstance(entry, dict) and 'score' in entry:
+                    bonuses.append(int(entry['score']))
+                    descriptions.append(entry.get('description'))
+                else:
+                    bonuses.append(fallback_element_bonus(element1, element2))
+                    descriptions.append(None)
+        return bonuses, tuple(descriptions)
+
+
+def load_engine(path: str = MATRIX_PATH) -> CompatibilityScoringEngine:
+    """Собрать движок из JSON-файла (без файла - встроенные значения)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            matrix = json.load(f)
+    except FileNotFoundError:
+        matrix = {}
+    return CompatibilityScoringEngine(matrix)
+
+
+if __name__ == '__main__':
+    problems = load_engine().validate()
+    for problem in problems:
+        print(problem)
+    print(f"Расхождений: {len(problems)}")
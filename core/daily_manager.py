@@ -7,20 +7,52 @@
 - Один набор из 12 уникальных общих предсказаний на день
 - Консистентность в течение суток (до 00:00)
 - Детерминированная генерация по ключу даты
+- Предварительный расчёт календаря на N дней вперёд (precompute)
+- Пакетный расчёт диапазона дат в виде таблицы id текстов (generate_range)
+- Полный набор предсказаний дня по знаку (get_bundle): общее, любовь,
+  карьера, здоровье, финансы, совет, возможности, предостережения
 """
 
 from __future__ import annotations
 
+import csv
 import json
 import os
 import hashlib
 import random
-from datetime import datetime
-from typing import Dict, List
+from array import array
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .atomic_write import atomic_write_text
 
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
 CACHE_PATH = os.path.join(DATA_DIR, 'daily_predictions.json')
+# Формат кэша: id текстов корпуса + версия корпуса вместо самих строк
+CACHE_FORMAT = 2
+BUNDLES_PATH = os.path.join(DATA_DIR, 'daily_bundles.json')
+BUNDLES_FORMAT = 1
+
+# Разделы набора дня; 'general' берётся из календаря общих предсказаний
+BUNDLE_CATEGORIES = ('general', 'love', 'career', 'health', 'finance',
+                     'advice', 'opportunities', 'warnings')
+
+# В базе нет раздела предостережений - используются эти тексты
+WARNING_TEXTS = (
+    "Не принимайте важных решений в спешке.",
+    "Будьте внимательны к словам: резкость может обидеть близких.",
+    "Не берите на себя больше, чем сможете выполнить.",
+    "Перепроверяйте документы и договорённости.",
+    "Избегайте рискованных трат и необдуманных покупок.",
+    "Не поддавайтесь на провокации и споры.",
+    "Берегите силы: переутомление сегодня ощутимо.",
+    "Не доверяйте непроверенной информации.",
+    "Осторожнее в дороге и с техникой.",
+    "Не откладывайте неприятный разговор - он только усложнится.",
+    "Следите за режимом питания и сна.",
+    "Не раскрывайте чужие секреты, даже случайно.",
+)
 
 
 ALL_SIGNS_ORDER = [
@@ -28,99 +60,424 @@ ALL_SIGNS_ORDER = [
     "Весы", "Скорпион", "Стрелец", "Козерог", "Водолей", "Рыбы",
 ]
 
+# id для текста-заглушки, которого нет в корпусе (при исчерпании пулов)
+FALLBACK_TEXT_ID = -1
+
+
+def _fallback_text(sign: str) -> str:
+    return f"День приносит новые возможности для {sign.lower()}. Сохраняйте уверенность и спокойствие."
+
+
+class GeneralTextIndex:
+    """Интернированные тексты общих предсказаний: у равных строк один id.
+
+    Пулы знаков и универсальный пул хранятся как кортежи id, поэтому
+    уникальность внутри дня проверяется по целым числам, а не по строкам.
+    """
+
+    def __init__(self, sign_pools: Dict[str, Tuple[str, ...]], universal: Tuple[str, ...]) -> None:
+        ids: Dict[str, int] = {}
+        texts: List[str] = []
+
+        def intern(pool: Tuple[str, ...]) -> Tuple[int, ...]:
+            out = []
+            for text in pool:
+                text_id = ids.get(text)
+                if text_id is None:
+                    text_id = ids[text] = len(texts)
+                    texts.append(text)
+                out.append(text_id)
+            return tuple(out)
+
+        self.sign_ids: Dict[str, Tuple[int, ...]] = {s: intern(sign_pools[s]) for s in ALL_SIGNS_ORDER}
+        self.universal_ids: Tuple[int, ...] = intern(universal)
+        self.texts: Tuple[str, ...] = tuple(texts)
+        self.ids = ids
+        # Шаги тасования по длине пула - считаются один раз на процесс
+        self._steps: Dict[int, Tuple[Tuple[int, int, int], ...]] = {}
+        # Версия корпуса: меняется при любом изменении текстов или их порядка
+        self.version = hashlib.md5('\n'.join(texts).encode('utf-8')).hexdigest()[:16]
+
+    def shuffle(self, rng: random.Random, items: List[int]) -> None:
+        """Перемешать список id так же, как rng.shuffle."""
+        if not _FAST_SHUFFLE:
+            rng.shuffle(items)
+            return
+        steps = self._steps.get(len(items))
+        if steps is None:
+            steps = self._steps[len(items)] = _shuffle_steps(len(items))
+        _shuffle_with_steps(rng, items, steps)
+
+    def text(self, text_id: int, sign: str) -> str:
+        """Текст по id (для FALLBACK_TEXT_ID - заглушка для знака)."""
+        if text_id == FALLBACK_TEXT_ID:
+            return _fallback_text(sign)
+        return self.texts[text_id]
+
+
+def _shuffle_steps(length: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Предрасчитанные шаги тасования Фишера-Йетса для пула длины length.
+
+    Каждый шаг - (позиция, число бит, граница), ровно как в random.shuffle.
+    """
+    return tuple((i, (i + 1).bit_length(), i + 1) for i in range(length - 1, 0, -1))
+
+
+def _shuffle_with_steps(rng: random.Random, items: List[int], steps) -> None:
+    """То же, что rng.shuffle(items), без вызова _randbelow на каждый элемент."""
+    getrandbits = rng.getrandbits
+    for i, bits, bound in steps:
+        j = getrandbits(bits)
+        while j >= bound:
+            j = getrandbits(bits)
+        items[i], items[j] = items[j], items[i]
+
+
+def _fast_shuffle_matches_stdlib() -> bool:
+    """Проверить, что предрасчитанное тасование совпадает с random.shuffle."""
+    for length in (2, 17, 20, 64):
+        expected = list(range(length))
+        random.Random(length).shuffle(expected)
+        actual = list(range(length))
+        _shuffle_with_steps(random.Random(length), actual, _shuffle_steps(length))
+        if actual != expected:
+            return False
+    return True
+
+
+_FAST_SHUFFLE = _fast_shuffle_matches_stdlib()
+
+_text_index: Optional[GeneralTextIndex] = None
+
+
+def get_general_text_index() -> GeneralTextIndex:
+    """Общий для процесса индекс текстов (строится при первом обращении)."""
+    global _text_index
+    if _text_index is None:
+        from .prediction_catalog import get_prediction_catalog
+        catalog = get_prediction_catalog()
+        _text_index = GeneralTextIndex(
+            {s: catalog.get_pool(s, "general") for s in ALL_SIGNS_ORDER},
+            catalog.get_universal_pool("general"),
+        )
+    return _text_index
+
+
+def _select_day_ids(index: GeneralTextIndex, day_key: str) -> List[int]:
+    """id 12 уникальных текстов дня в порядке ALL_SIGNS_ORDER.
+
+    Перемешиваются списки id по предрасчитанным шагам (перестановки те же, что
+    дал бы rng.shuffle для строк), поэтому результат совпадает с прежним выбором.
+    Универсальный пул перемешивается один раз и не копируется в пулы знаков.
+    """
+    rng = DailyPredictionManager._rng_for_date(day_key)
+    universal = list(index.universal_ids)
+    index.shuffle(rng, universal)
+    pools = []
+    for s in ALL_SIGNS_ORDER:
+        pool = list(index.sign_ids[s])
+        index.shuffle(rng, pool)
+        pools.append(pool)
+
+    used: set[int] = set()
+    picked: List[int] = []
+    for pool in pools:
+        choice = FALLBACK_TEXT_ID
+        for text_id in pool:
+            if text_id not in used:
+                choice = text_id
+                break
+        else:
+            for text_id in universal:
+                if text_id not in used:
+                    choice = text_id
+                    break
+        if choice != FALLBACK_TEXT_ID:
+            used.add(choice)
+        picked.append(choice)
+    return picked
+
+
+class PredictionRangeTable:
+    """Компактная таблица (дата x знак) -> id текста для диапазона дат."""
+
+    def __init__(self, start: date, index: GeneralTextIndex) -> None:
+        self.start = start
+        self.index = index
+        self.ids = array('i')
+
+    def __len__(self) -> int:
+        """Число дней в таблице."""
+        return len(self.ids) // len(ALL_SIGNS_ORDER)
+
+    def text_id(self, for_date: date, sign: str) -> int:
+        offset = (for_date - self.start).days
+        if not 0 <= offset < len(self):
+            raise KeyError(for_date)
+        return self.ids[offset * len(ALL_SIGNS_ORDER) + ALL_SIGNS_ORDER.index(sign)]
+
+    def text(self, for_date: date, sign: str) -> str:
+        return self.index.text(self.text_id(for_date, sign), sign)
+
+
+def iter_range(start: date, end: date) -> Iterator[Tuple[str, List[int]]]:
+    """Потоково выдавать (дата ISO, id текстов 12 знаков) для start..end включительно."""
+    index = get_general_text_index()
+    day = start
+    while day <= end:
+        day_key = day.isoformat()
+        yield day_key, _select_day_ids(index, day_key)
+        day += timedelta(days=1)
+
+
+def generate_range(start: date, end: date, out_path: Optional[str] = None,
+                   texts_path: Optional[str] = None) -> PredictionRangeTable:
+    """Рассчитать предсказания всех знаков для дат start..end включительно.
+
+    Пулы строятся один раз на весь диапазон. При out_path строки CSV
+    (date, id по знакам) пишутся по мере расчёта; texts_path сохраняет
+    таблицу id -> текст. Результаты совпадают с DailyPredictionManager.
+    """
+    index = get_general_text_index()
+    table = PredictionRangeTable(start, index)
+
+    if texts_path:
+        with open(texts_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': index.version, 'texts': list(index.texts)}, f, ensure_ascii=False)
+
+    out = open(out_path, 'w', encoding='utf-8', newline='') if out_path else None
+    try:
+        writer = csv.writer(out) if out else None
+        if writer:
+            writer.writerow(['date'] + ALL_SIGNS_ORDER)
+        for day_key, ids in iter_range(start, end):
+            table.ids.extend(ids)
+            if writer:
+                writer.writerow([day_key] + ids)
+    finally:
+        if out:
+            out.close()
+    return table
+
+
+def _category_pools(category: str) -> Tuple[Dict[str, Tuple[str, ...]], Tuple[str, ...]]:
+    """Персональные пулы знаков и универсальный пул раздела."""
+    from .prediction_catalog import get_prediction_catalog
+    catalog = get_prediction_catalog()
+    pools: Dict[str, Tuple[str, ...]] = {}
+    for s in ALL_SIGNS_ORDER:
+        sign_pools = catalog.get_pools(s)
+        pools[s] = tuple(sign_pools.get(category, ())) if sign_pools is not None else ()
+    universal_pools = catalog.get_pools("universal")
+    universal = tuple(universal_pools.get(category, ())) if universal_pools is not None else ()
+    if category == 'warnings' and not universal:
+        universal = WARNING_TEXTS
+    return pools, universal
+
+
+_bundle_version: Optional[str] = None
+
+
+def get_bundle_corpus_version() -> str:
+    """Версия текстов всех разделов набора (для проверки кэша на диске)."""
+    global _bundle_version
+    if _bundle_version is None:
+        digest = hashlib.md5()
+        for category in BUNDLE_CATEGORIES[1:]:
+            pools, universal = _category_pools(category)
+            for s in ALL_SIGNS_ORDER:
+                digest.update('\n'.join(pools[s]).encode('utf-8'))
+            digest.update('\n'.join(universal).encode('utf-8'))
+        _bundle_version = get_general_text_index().version + digest.hexdigest()[:16]
+    return _bundle_version
+
+
+def _select_category(day_key: str, category: str) -> Dict[str, str]:
+    """Тексты раздела для 12 знаков на день: детерминированно и без повторов.
+
+    Для каждого знака выбирается случайная позиция в «персональный пул +
+    универсальный пул»; если текст уже занят другим знаком, берётся следующий.
+    """
+    rng = DailyPredictionManager._rng_for_date(f"{day_key}|{category}")
+    pools, universal = _category_pools(category)
+    used = set()
+    picked: Dict[str, str] = {}
+    for s in ALL_SIGNS_ORDER:
+        pool = pools[s]
+        total = len(pool) + len(universal)
+        if not total:
+            picked[s] = ""
+            continue
+        start = rng.randrange(total)
+        text = ""
+        for k in range(total):
+            i = (start + k) % total
+            text = pool[i] if i < len(pool) else universal[i - len(pool)]
+            if text not in used:
+                break
+        used.add(text)
+        picked[s] = text
+    return picked
+
 
 class DailyPredictionManager:
     """Генерирует и кэширует уникальные ежедневные предсказания."""
 
     def __init__(self) -> None:
-        self.today_key = datetime.now().date().isoformat()
+        # Дни из файла, ещё не переведённые в тексты: дата -> id по знакам
+        self._stored_ids: Dict[str, List[int]] = {}
+        self._stored_corpus: Optional[str] = None
         self.cache: Dict[str, Dict[str, str]] = self._load_cache()
+        # Наборы дня по знакам: дата -> знак -> раздел -> текст (читаются с диска лениво)
+        self.bundles: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None
+
+    @property
+    def today_key(self) -> str:
+        """Сегодняшняя дата (ISO). Вычисляется при каждом обращении: менеджер
+        живёт всё время работы приложения и после полуночи переходит на новый день."""
+        return date.today().isoformat()
 
     # ---------------------------- public API ----------------------------
-    def get_general_for_sign(self, sign: str) -> str:
-        """Вернуть фиксированное на день общее предсказание для знака."""
-        day_bucket = self._ensure_today_bucket()
+    def get_general_for_sign(self, sign: str, for_date: Optional[date] = None) -> str:
+        """Вернуть фиксированное на день общее предсказание для знака.
+
+        Без for_date используется сегодняшний день; иначе - день из календаря
+        (рассчитывается по требованию тем же алгоритмом, что и precompute).
+        """
+        day_key = self.today_key if for_date is None else for_date.isoformat()
+        day_bucket = self._ensure_bucket(day_key)
         if sign in day_bucket:
             return day_bucket[sign]
         # Если по каким-то причинам нет записи — дозаполним аккуратно
-        self._generate_for_missing(day_bucket)
+        self._generate_for_missing(day_bucket, day_key)
         self._save_cache()
         return day_bucket.get(sign, "Предсказание временно недоступно.")
 
-    # --------------------------- core logic ----------------------------
-    def _ensure_today_bucket(self) -> Dict[str, str]:
-        if self.today_key not in self.cache:
-            self.cache = {self.today_key: self._generate_full_day()}
+    def get_day(self, for_date: Optional[date] = None) -> Dict[str, str]:
+        """Вернуть все 12 предсказаний дня (копию)."""
+        day_key = self.today_key if for_date is None else for_date.isoformat()
+        return dict(self._ensure_bucket(day_key))
+
+    def get_bundle(self, sign: str, for_date: Optional[date] = None) -> Dict[str, str]:
+        """Полный набор предсказаний знака на день (копия).
+
+        Разделы - BUNDLE_CATEGORIES. Набор рассчитывается один раз на день
+        сразу для всех знаков и сохраняется на диск.
+        """
+        day_key = self.today_key if for_date is None else for_date.isoformat()
+        bundle = self._ensure_bundles(day_key).get(sign)
+        if bundle is None:
+            return {category: "" for category in BUNDLE_CATEGORIES}
+        return dict(bundle)
+
+    def get_day_bundles(self, for_date: Optional[date] = None) -> Dict[str, Dict[str, str]]:
+        """Наборы дня для всех 12 знаков (копия)."""
+        day_key = self.today_key if for_date is None else for_date.isoformat()
+        return {s: dict(b) for s, b in self._ensure_bundles(day_key).items()}
+
+    def precompute(self, days: int = 30, start: Optional[date] = None) -> int:
+        """Рассчитать календарь на days дней вперёд и сохранить одним файлом.
+
+        Результаты совпадают с расчётом по требованию, так как используют тот
+        же md5-seed по дате. Возвращает число вновь рассчитанных дней.
+        """
+        first = date.fromisoformat(self.today_key) if start is None else start
+        generated = 0
+        for offset in range(days):
+            day_key = (first + timedelta(days=offset)).isoformat()
+            if day_key not in self.cache and day_key not in self._stored_ids:
+                self.cache[day_key] = self._generate_full_day(day_key)
+                generated += 1
+        # Ежедневный вызов precompute не должен копить прошедшие дни в файле
+        if self._prune_past_days() or generated:
             self._save_cache()
-        return self.cache[self.today_key]
+        return generated
 
-    def _generate_full_day(self) -> Dict[str, str]:
-        """Сгенерировать 12 уникальных предсказаний на текущий день."""
-        rng = self._rng_for_today()
+    def precomputed_dates(self) -> List[str]:
+        """Даты (ISO), для которых предсказания уже рассчитаны."""
+        return sorted(set(self.cache) | set(self._stored_ids))
 
-        # Импорт внутри, чтобы избежать ранних тяжелых импортов при запуске
-        from . import structured_predictions as sp  # type: ignore
+    # --------------------------- core logic ----------------------------
+    def _ensure_today_bucket(self) -> Dict[str, str]:
+        return self._ensure_bucket(self.today_key)
 
-        # Собираем кандидатов: персональные general + часть универсальных
-        universal = list(sp.UNIVERSAL_PREDICTIONS["predictions"]["general"])  # type: ignore
-        # Перемешаем универсальные детерминированно
-        rng.shuffle(universal)
+    def _ensure_bucket(self, day_key: str) -> Dict[str, str]:
+        bucket = self.cache.get(day_key)
+        if bucket is None and day_key in self._stored_ids:
+            bucket = self._resolve_stored_day(day_key)
+        if bucket is None:
+            # Прошедшие дни удаляются при сохранении (_save_cache)
+            bucket = self.cache[day_key] = self._generate_full_day(day_key)
+            self._save_cache()
+        return bucket
 
-        # Подготовим карты кандидатов по знакам
-        candidates: Dict[str, List[str]] = {}
-
-        def sign_general_pool(sign_name: str) -> List[str]:
-            # Извлекаем структуру для конкретного знака через словарь в sp.get_prediction
-            # Прямого словаря нет — но данные лежат в модулях; используем ту же логику, что в sp.get_prediction
-            from .remaining_zodiac_predictions import (
-                VIRGO_PREDICTIONS, LIBRA_PREDICTIONS, SCORPIO_PREDICTIONS,
-                SAGITTARIUS_PREDICTIONS, CAPRICORN_PREDICTIONS, AQUARIUS_PREDICTIONS,
-                PISCES_PREDICTIONS,
-            )
-            sign_map = {
-                "Овен": sp.ARIES_PREDICTIONS,
-                "Телец": sp.TAURUS_PREDICTIONS,
-                "Близнецы": sp.GEMINI_PREDICTIONS,
-                "Рак": sp.CANCER_PREDICTIONS,
-                "Лев": sp.LEO_PREDICTIONS,
-                "Дева": VIRGO_PREDICTIONS,
-                "Весы": LIBRA_PREDICTIONS,
-                "Скорпион": SCORPIO_PREDICTIONS,
-                "Стрелец": SAGITTARIUS_PREDICTIONS,
-                "Козерог": CAPRICORN_PREDICTIONS,
-                "Водолей": AQUARIUS_PREDICTIONS,
-                "Рыбы": PISCES_PREDICTIONS,
-            }
-            personal = list(sign_map[sign_name]["predictions"]["general"])  # type: ignore
-            return personal
+    def _resolve_stored_day(self, day_key: str) -> Optional[Dict[str, str]]:
+        """Перевести сохранённые id дня в тексты (лениво, при первом обращении)."""
+        index = get_general_text_index()
+        if self._stored_corpus != index.version:
+            # Корпус изменился - сохранённые id больше ничего не значат
+            print("Версия корпуса предсказаний изменилась, кэш будет пересоздан")
+            self._stored_ids.clear()
+            return None
+        ids = self._stored_ids.pop(day_key)
+        try:
+            bucket = {s: index.text(text_id, s) for s, text_id in zip(ALL_SIGNS_ORDER, ids)}
+        except IndexError:
+            return None
+        self.cache[day_key] = bucket
+        return bucket
 
-        for s in ALL_SIGNS_ORDER:
-            pool = sign_general_pool(s)
-            rng.shuffle(pool)
-            # Добавим часть универсальных в хвост пула, чтобы при нехватке персональных было из чего выбрать
-            mixed = pool + universal
-            candidates[s] = mixed
+    def _ensure_bundles(self, day_key: str) -> Dict[str, Dict[str, str]]:
+        if self.bundles is None:
+            self.bundles = self._load_bundles()
+        day = self.bundles.get(day_key)
+        if day is None:
+            day = self.bundles[day_key] = self._generate_bundles(day_key)
+            # Прошедшие дни в файле наборов не нужны
+            today_key = self.today_key
+            for old_key in [k for k in self.bundles if k < today_key]:
+                del self.bundles[old_key]
+            self._save_bundles()
+        return day
+
+    def _generate_bundles(self, day_key: str) -> Dict[str, Dict[str, str]]:
+        """Наборы дня для всех знаков; общее предсказание - из календаря."""
+        general = self._ensure_bucket(day_key)
+        sections = {category: _select_category(day_key, category)
+                    for category in BUNDLE_CATEGORIES[1:]}
+        return {
+            s: dict([('general', general.get(s, _fallback_text(s)))] +
+                    [(category, sections[category][s]) for category in BUNDLE_CATEGORIES[1:]])
+            for s in ALL_SIGNS_ORDER
+        }
 
-        picked: Dict[str, str] = {}
-        used: set[str] = set()
+    def _prune_past_days(self) -> bool:
+        """Убрать прошедшие дни из кэша; True, если что-то удалено"""
+        today_key = self.today_key
+        past = [k for k in self.cache if k < today_key]
+        for day_key in past:
+            del self.cache[day_key]
+        past_ids = [k for k in self._stored_ids if k < today_key]
+        for day_key in past_ids:
+            del self._stored_ids[day_key]
+        return bool(past or past_ids)
 
-        # Проходим по знакам в фиксированном порядке и выбираем первый ещё не использованный текст
-        for s in ALL_SIGNS_ORDER:
-            for text in candidates[s]:
-                if text not in used:
-                    picked[s] = text
-                    used.add(text)
-                    break
-            if s not in picked:
-                # На крайний случай (почти невозможен при богатой базе) — генерируем стабильный псевдо‑вариант
-                picked[s] = f"День приносит новые возможности для {s.lower()}. Сохраняйте уверенность и спокойствие."
+    def _generate_full_day(self, day_key: Optional[str] = None) -> Dict[str, str]:
+        """Сгенерировать 12 уникальных предсказаний на день (по умолчанию - сегодня).
 
-        return picked
+        Выбор идёт по целочисленным id интернированных текстов (см. _select_day_ids):
+        персональные пулы и универсальный пул не склеиваются и не копируются в
+        строковые списки, уникальность проверяется по множеству id.
+        """
+        index = get_general_text_index()
+        ids = _select_day_ids(index, day_key or self.today_key)
+        # На крайний случай (почти невозможен при богатой базе) — стабильный псевдо‑вариант
+        return {s: index.text(text_id, s) for s, text_id in zip(ALL_SIGNS_ORDER, ids)}
 
-    def _generate_for_missing(self, day_bucket: Dict[str, str]) -> None:
-        rng = self._rng_for_today()
-        from . import structured_predictions as sp
-        universal = list(sp.UNIVERSAL_PREDICTIONS["predictions"]["general"])  # type: ignore
+    def _generate_for_missing(self, day_bucket: Dict[str, str], day_key: Optional[str] = None) -> None:
+        rng = self._rng_for_date(day_key or self.today_key)
+        from .prediction_catalog import get_prediction_catalog
+        universal = list(get_prediction_catalog().get_universal_pool("general"))
         rng.shuffle(universal)
         used = set(day_bucket.values())
         for s in ALL_SIGNS_ORDER:
@@ -136,27 +493,96 @@ class DailyPredictionManager:
         try:
             with open(CACHE_PATH, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+                if isinstance(data, dict) and data.get('format') == CACHE_FORMAT:
+                    # Тексты восстанавливаются лениво в _resolve_stored_day
+                    self._stored_corpus = data.get('corpus')
+                    self._stored_ids = {
+                        k: v for k, v in data.get('days', {}).items()
+                        if isinstance(v, list) and len(v) == len(ALL_SIGNS_ORDER)
+                    }
+                    return {}
                 if isinstance(data, dict) and 'date' in data and 'predictions' in data:
-                    return {data['date']: data['predictions']}
+                    # Прежний текстовый формат
+                    cache = dict(data.get('calendar') or {})
+                    cache[data['date']] = data['predictions']
+                    return cache
                 return data  # поддержка будущих форматов
         except FileNotFoundError:
             # создаём каталог при первой записи
             os.makedirs(DATA_DIR, exist_ok=True)
             return {}
+        except ValueError as e:
+            # Повреждённый кэш не страшен: день детерминированно пересчитается
+            print(f"Кэш предсказаний повреждён, будет пересоздан: {e}")
+            return {}
 
     def _save_cache(self) -> None:
+        self._prune_past_days()
         os.makedirs(DATA_DIR, exist_ok=True)
+        index = get_general_text_index()
+        days: Dict[str, List[int]] = {}
+        if self._stored_corpus == index.version:
+            days.update(self._stored_ids)
+        for day_key, bucket in self.cache.items():
+            ids = self._bucket_to_ids(index, bucket)
+            if ids is not None:
+                days[day_key] = ids
         payload = {
+            'format': CACHE_FORMAT,
+            'corpus': index.version,
             'date': self.today_key,
-            'predictions': self.cache.get(self.today_key, {}),
+            'days': dict(sorted(days.items())),
+        }
+        atomic_write_text(CACHE_PATH, json.dumps(payload, separators=(',', ':')))
+
+    def _load_bundles(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        try:
+            with open(BUNDLES_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            print(f"Кэш наборов предсказаний повреждён, будет пересоздан: {e}")
+            return {}
+        if (not isinstance(data, dict) or data.get('format') != BUNDLES_FORMAT
+                or data.get('corpus') != get_bundle_corpus_version()):
+            # Другая версия текстов - наборы пересчитаются
+            return {}
+        days = data.get('days')
+        return days if isinstance(days, dict) else {}
+
+    def _save_bundles(self) -> None:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        payload = {
+            'format': BUNDLES_FORMAT,
+            'corpus': get_bundle_corpus_version(),
+            'days': dict(sorted((self.bundles or {}).items())),
         }
-        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        atomic_write_text(BUNDLES_PATH, json.dumps(payload, ensure_ascii=False, separators=(',', ':')))
+
+    @staticmethod
+    def _bucket_to_ids(index: GeneralTextIndex, bucket: Dict[str, str]) -> Optional[List[int]]:
+        """id текстов дня; None, если какой-то текст не из текущего корпуса."""
+        ids = []
+        for s in ALL_SIGNS_ORDER:
+            text = bucket.get(s)
+            text_id = index.ids.get(text) if text is not None else None
+            if text_id is None:
+                if text != _fallback_text(s):
+                    # Такой день не сохраняем - он будет пересчитан
+                    return None
+                text_id = FALLBACK_TEXT_ID
+            ids.append(text_id)
+        return ids
 
     # ----------------------------- utils -------------------------------
     def _rng_for_today(self) -> random.Random:
+        return self._rng_for_date(self.today_key)
+
+    @staticmethod
+    def _rng_for_date(day_key: str) -> random.Random:
         # Стабильный seed по дате через md5, чтобы тип seed был числом
-        h = hashlib.md5(self.today_key.encode('utf-8')).hexdigest()[:8]
+        h = hashlib.md5(day_key.encode('utf-8')).hexdigest()[:8]
         seed = int(h, 16)
         return random.Random(seed)
 
@@ -164,11 +590,20 @@ class DailyPredictionManager:
 _manager_singleton: DailyPredictionManager | None = None
 
 
-def get_daily_general_prediction(sign: str) -> str:
-    """Функция-обёртка для удобного импорта."""
+def _get_manager() -> DailyPredictionManager:
     global _manager_singleton
     if _manager_singleton is None:
         _manager_singleton = DailyPredictionManager()
-    return _manager_singleton.get_general_for_sign(sign)
+    return _manager_singleton
+
+
+def get_daily_general_prediction(sign: str) -> str:
+    """Функция-обёртка для удобного импорта."""
+    return _get_manager().get_general_for_sign(sign)
+
+
+def get_daily_bundle(sign: str) -> Dict[str, str]:
+    """Полный набор предсказаний знака на сегодня (см. DailyPredictionManager.get_bundle)."""
+    return _get_manager().get_bundle(sign)
 
 
@@ -3,34 +3,120 @@
 """
 ZODI - Система шифрования для защиты данных пользователя
 Использует Fernet для симметричного шифрования
+
+Ключ и объект Fernet кешируются на уровне процесса по пути к файлу ключа,
+его mtime и размеру: новые экземпляры EncryptionManager не читают файл
+заново. Экземпляр проверяет файл ключа один раз при создании; encrypt и
+decrypt не обращаются к диску. Смена ключа через regenerate_key или
+restore_key видна всем экземплярам; замену файла другим процессом
+подхватывают новые экземпляры или вызов invalidate_cipher_cache().
 """
 
 import os
 import base64
+import threading
+from typing import Dict, Optional, Tuple
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# Кеш шифров: путь к ключу -> ((mtime_ns, размер) или None - перепроверить файл, Fernet)
+_cipher_cache: Dict[str, Tuple[Optional[Tuple[int, int]], Fernet]] = {}
+_cipher_lock = threading.RLock()
+# Растёт при каждой смене или сбросе ключа; экземпляры сверяют с ним свой шифр
+_cipher_generation = 0
+
+
+def _key_stamp(key_file: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(key_file)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def invalidate_cipher_cache(key_file: Optional[str] = None) -> None:
+    """Перечитать файл ключа при следующем обращении (для одного файла или всех)
+
+    Загруженные шифры не забываются: если файл ключа окажется нечитаемым,
+    остаётся прежний ключ, а не создаётся новый.
+    """
+    global _cipher_generation
+    with _cipher_lock:
+        paths = list(_cipher_cache) if key_file is None else [os.path.realpath(key_file)]
+        for path in paths:
+            cached = _cipher_cache.get(path)
+            if cached is not None:
+                _cipher_cache[path] = (None, cached[1])
+        _cipher_generation += 1
+
+
+def _store_cipher(cache_key: str, stamp: Optional[Tuple[int, int]], cipher: Fernet) -> None:
+    """Запомнить новый ключ; остальные экземпляры перейдут на него"""
+    global _cipher_generation
+    with _cipher_lock:
+        _cipher_cache[cache_key] = (stamp, cipher)
+        _cipher_generation += 1
+
+
 class EncryptionManager:
     """Менеджер шифрования для защиты данных пользователя"""
     
-    def __init__(self):
-        self.key_file = os.path.join(os.path.dirname(__file__), '..', '.zodi_key')
-        self.cipher_suite = self._get_or_create_cipher()
+    def __init__(self, key_file: Optional[str] = None):
+        if key_file is None:
+            key_file = os.path.join(os.path.dirname(__file__), '..', '.zodi_key')
+        self.key_file = key_file
+        self._cache_key = os.path.realpath(self.key_file)
+        self._cipher: Optional[Fernet] = None
+        self._generation = -1
+        self._cipher = self._get_or_create_cipher()
+    
+    @property
+    def cipher_suite(self) -> Fernet:
+        """Текущий шифр (общий для процесса)
+
+        Файл ключа не проверяется при каждой операции: шифр перечитывается
+        только после смены ключа или invalidate_cipher_cache().
+        """
+        if self._generation != _cipher_generation or self._cipher is None:
+            self._cipher = self._get_or_create_cipher()
+        return self._cipher
     
     def _get_or_create_cipher(self) -> Fernet:
         """Получить или создать ключ шифрования"""
-        try:
-            # Пытаемся загрузить существующий ключ
-            if os.path.exists(self.key_file):
-                with open(self.key_file, 'rb') as f:
-                    key = f.read()
-                return Fernet(key)
-        except Exception:
-            pass
-        
-        # Создаем новый ключ
-        return self._create_new_cipher()
+        with _cipher_lock:
+            cipher = self._resolve_cipher()
+            self._generation = _cipher_generation
+            return cipher
+    
+    def _resolve_cipher(self) -> Fernet:
+        with _cipher_lock:
+            stamp = _key_stamp(self.key_file)
+            cached = _cipher_cache.get(self._cache_key)
+            if cached is not None and (stamp is None or cached[0] == stamp):
+                # Пропавший файл ключа не повод менять ключ посреди работы
+                return cached[1]
+            
+            try:
+                # Пытаемся загрузить существующий ключ
+                if stamp is not None:
+                    with open(self.key_file, 'rb') as f:
+                        key = f.read()
+                    cipher = Fernet(key)
+                    _store_cipher(self._cache_key, stamp, cipher)
+                    return cipher
+            except Exception as e:
+                if cached is not None:
+                    # Файл ключа изменился, но не читается (например, его как раз
+                    # переписывают): остаёмся на загруженном ключе, иначе новый ключ
+                    # сделал бы профиль и журнал нечитаемыми. Отметка файла
+                    # запоминается, чтобы не перечитывать его при каждом вызове.
+                    print(f"Не удалось перечитать ключ шифрования, используется прежний: {e}")
+                    _cipher_cache[self._cache_key] = (stamp, cached[1])
+                    return cached[1]
+            
+            # Создаем новый ключ (только если ключ ещё ни разу не был загружен)
+            return self._create_new_cipher()
     
     def _create_new_cipher(self) -> Fernet:
         """Создать новый ключ шифрования"""
@@ -45,7 +131,9 @@ class EncryptionManager:
         except Exception as e:
             print(f"Ошибка сохранения ключа шифрования: {e}")
         
-        return Fernet(key)
+        cipher = Fernet(key)
+        _store_cipher(self._cache_key, _key_stamp(self.key_file), cipher)
+        return cipher
     
     def encrypt(self, data: str) -> str:
         """Зашифровать данные"""
@@ -150,9 +238,9 @@ class EncryptionManager:
     def regenerate_key(self) -> bool:
         """Перегенерировать ключ шифрования"""
         try:
-            # Создаем новый ключ
-            new_cipher = self._create_new_cipher()
-            self.cipher_suite = new_cipher
+            # Создаем новый ключ (кеш процесса обновляется)
+            self._cipher = self._create_new_cipher()
+            self._generation = _cipher_generation
             return True
         except Exception as e:
             print(f"Ошибка перегенерации ключа: {e}")
@@ -174,13 +262,18 @@ class EncryptionManager:
         """Восстановить ключ из резервной копии"""
         try:
             if os.path.exists(backup_path):
+                # Сначала проверяем ключ из копии: повреждённая копия не должна
+                # затереть рабочий ключ (Fernet бросит исключение)
+                with open(backup_path, 'rb') as f:
+                    cipher = Fernet(f.read())
+                
                 import shutil
                 shutil.copy2(backup_path, self.key_file)
                 
-                # Перезагружаем cipher с восстановленным ключом
-                with open(self.key_file, 'rb') as f:
-                    key = f.read()
-                self.cipher_suite = Fernet(key)
+                # Восстановленный ключ становится текущим для всех экземпляров
+                _store_cipher(self._cache_key, _key_stamp(self.key_file), cipher)
+                self._cipher = cipher
+                self._generation = _cipher_generation
                 return True
         except Exception as e:
             print(f"Ошибка восстановления ключа: {e}")
@@ -5,78 +5,44 @@ ZODI - Расширенные ежедневные предсказания
 7 категорий предсказаний для каждого знака зодиака
 """
 
-import json
-import os
 import random
 from datetime import datetime
 from typing import Dict, List
 
+from .prediction_sources import get_source_resolver
+
+CATEGORIES = {
+    'love': "💖 Личная жизнь",
+    'career': "💼 Карьера",
+    'finance': "💰 Финансы",
+    'health': "🏥 Здоровье",
+    'growth': "🎯 Личностный рост",
+    'energy': "🌙 Энергетика дня",
+    'warnings': "⚠️ Предостережения"
+}
+
+
 class ExtendedDailyPredictions:
-    """Класс для расширенных ежедневных предсказаний с 7 категориями"""
+    """Класс для расширенных ежедневных предсказаний с 7 категориями
+
+    Экземпляр - лёгкое представление над общей базой из реестра
+    (см. prediction_sources): файл разбирается один раз на процесс.
+    """
     
     def __init__(self, zodiac_sign: str):
         self.zodiac_sign = zodiac_sign
-        self.categories = {
-            'love': "💖 Личная жизнь",
-            'career': "💼 Карьера", 
-            'finance': "💰 Финансы",
-            'health': "🏥 Здоровье",
-            'growth': "🎯 Личностный рост",
-            'energy': "🌙 Энергетика дня",
-            'warnings': "⚠️ Предостережения"
-        }
+        self.categories = CATEGORIES
+        # Общие данные реестра - только для чтения
         self.predictions_db = self._load_predictions_database()
     
     def _load_predictions_database(self) -> Dict:
         """Загрузить базу данных предсказаний"""
-        # Сначала пробуем качественную базу данных (приоритет №1)
-        db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'extended_predictions_quality.json')
-        
-        try:
-            with open(db_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Качественная база имеет структуру с metadata и predictions
-                if 'predictions' in data:
-                    return data['predictions']
-                return data
-        except FileNotFoundError:
-            # Если качественная база не найдена, пробуем объединенную базу данных (приоритет №2)
-            db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'extended_predictions_unified.json')
-        
-        try:
-            with open(db_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Объединенная база имеет структуру с metadata и predictions
-                if 'predictions' in data:
-                    return data['predictions']
-                return data
-        except FileNotFoundError:
-            # Если объединенная база не найдена, пробуем полную мега-базу данных для всех знаков
-            db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'extended_predictions_mega_all.json')
-            try:
-                with open(db_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except FileNotFoundError:
-                # Если полная мега-база не найдена, пробуем мега-базу данных
-                db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'extended_predictions_mega_complete.json')
-                try:
-                    with open(db_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-                except FileNotFoundError:
-                    # Если мега-база не найдена, пробуем полную базу данных
-                    db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'extended_predictions_complete.json')
-                    try:
-                        with open(db_path, 'r', encoding='utf-8') as f:
-                            return json.load(f)
-                    except FileNotFoundError:
-                        # Если полная база не найдена, пробуем основную
-                        db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'extended_predictions_db.json')
-                        try:
-                            with open(db_path, 'r', encoding='utf-8') as f:
-                                return json.load(f)
-                        except FileNotFoundError:
-                            # Если база данных не найдена, создать базовую структуру
-                            return self._create_fallback_predictions()
+        # Источник выбирается один раз на процесс (см. prediction_sources)
+        data = get_source_resolver().load()
+        if data is None:
+            # Если база данных не найдена, создать базовую структуру
+            return self._create_fallback_predictions()
+        return data
     
     def _create_fallback_predictions(self) -> Dict:
         """Создать базовые предсказания если база данных недоступна"""
@@ -122,7 +88,7 @@ class ExtendedDailyPredictions:
     
     def get_categories_info(self) -> Dict[str, str]:
         """Получить информацию о всех категориях"""
-        return self.categories
+        return dict(self.categories)
     
     def get_random_prediction(self) -> str:
         """Получить случайное предсказание из любой категории"""
@@ -1,44 +1,93 @@
 """Генератор ежедневных гороскопов.
 
 Гарантирует стабильность внутри одного дня и уникальность между знаками.
+
+Хеш считается один раз на дату (blake2b, 8 байт); индексы для знака и
+темы получаются из него дешёвым целочисленным перемешиванием.
 """
 
 from __future__ import annotations
 
 import hashlib
 from datetime import date, datetime
-from typing import Dict, List, Optional
-import random
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .zodiac_data import THEMES_TO_PHRASES, ZODIAC_SIGNS, DAILY_HOROSCOPES
 
+_MASK64 = (1 << 64) - 1
 
-def _stable_index(key: str, modulo: int) -> int:
-    """Детерминированный индекс по ключу.
+# Номера знаков и предвычисленный индекс тем: ((тема, фразы), ...) без пустых тем
+_SIGN_ORDINALS = {sign: i for i, sign in enumerate(ZODIAC_SIGNS)}
+_THEME_INDEX: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (theme, tuple(phrases)) for theme, phrases in THEMES_TO_PHRASES.items() if phrases
+)
+
+
+@lru_cache(maxsize=64)
+def _date_seed(for_date: date) -> int:
+    """64-битное зерно даты (blake2b с коротким дайджестом)."""
+    digest = hashlib.blake2b(for_date.isoformat().encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=False)
 
-    Используем SHA-256, чтобы равномерно распределять индексы.
-    """
-    digest = hashlib.sha256(key.encode("utf-8")).digest()
-    value = int.from_bytes(digest[:8], "big", signed=False)
-    return value % modulo
+
+def _mix(seed: int, a: int, b: int) -> int:
+    """Перемешивание splitmix64: равномерное 64-битное число по (зерно, a, b)."""
+    z = (seed + (a + 1) * 0x9E3779B97F4A7C15 + (b + 1) * 0xD1B54A32D192ED03) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+# Одно 64-битное число даёт индексы для 5 тем (по 12 бит на тему)
+_THEMES_PER_MIX = 5
+_THEME_BITS = 12
+_GENERAL_STREAM = 1 << 16   # поток для общего гороскопа дня
+
+
+def _themes_for(seed: int, ordinal: int) -> Dict[str, str]:
+    result: Dict[str, str] = {}
+    z = 0
+    for t, (theme, phrases) in enumerate(_THEME_INDEX):
+        if t % _THEMES_PER_MIX == 0:
+            z = _mix(seed, ordinal, t // _THEMES_PER_MIX)
+        else:
+            z >>= _THEME_BITS
+        result[theme] = phrases[(z & 0xFFF) % len(phrases)]
+    return result
 
 
 def generate_daily_horoscope(sign: str, for_date: date) -> Dict[str, str]:
     """Сгенерировать гороскоп по темам для знака на дату.
 
-    Для одного знака и дня текст стабилен. Разные знаки получают разные
-    комбинации за счёт включения имени знака в ключ хеша.
+    Для одного знака и дня текст стабилен. Хеш даты считается один раз;
+    разные знаки получают разные комбинации за счёт перемешивания seed даты
+    с порядковым номером знака (_mix).
     """
-    if sign not in ZODIAC_SIGNS:
+    ordinal = _SIGN_ORDINALS.get(sign)
+    if ordinal is None:
         raise ValueError("Неизвестный знак зодиака")
+    return _themes_for(_date_seed(for_date), ordinal)
 
-    result: Dict[str, str] = {}
-    seed_base = f"{sign}|{for_date.isoformat()}"
-    for theme, phrases in THEMES_TO_PHRASES.items():
-        if not phrases:
-            continue
-        idx = _stable_index(f"{seed_base}|{theme}", len(phrases))
-        result[theme] = phrases[idx]
+
+def generate_for_dates(signs: Iterable[str],
+                       dates: Iterable[date]) -> Dict[date, Dict[str, Dict[str, str]]]:
+    """Гороскопы по темам для набора знаков и дат: {дата: {знак: {тема: фраза}}}.
+
+    Результат совпадает с generate_daily_horoscope для каждой пары; хеш
+    считается один раз на дату.
+    """
+    ordinals = []
+    for sign in signs:
+        ordinal = _SIGN_ORDINALS.get(sign)
+        if ordinal is None:
+            raise ValueError(f"Неизвестный знак зодиака: {sign}")
+        ordinals.append((sign, ordinal))
+
+    result: Dict[date, Dict[str, Dict[str, str]]] = {}
+    for for_date in dates:
+        seed = _date_seed(for_date)
+        result[for_date] = {sign: _themes_for(seed, ordinal) for sign, ordinal in ordinals}
     return result
 
 
@@ -78,15 +127,11 @@ class HoroscopeGenerator:
         if self._generated_for_ymd != today_seed:
             self.today_horoscopes.clear()
 
-        for sign, variants in DAILY_HOROSCOPES.items():
-            try:
-                sign_seed = f"{today_seed}{sign}"
-                local_random = random.Random(sign_seed)
-                if variants:
-                    self.today_horoscopes[sign] = local_random.choice(variants)
-            except Exception:
-                # Пропускаем в случае неожиданных ошибок данных
-                continue
+        seed = _date_seed(date(int(today_seed[:4]), int(today_seed[4:6]), int(today_seed[6:])))
+        for position, (sign, variants) in enumerate(DAILY_HOROSCOPES.items()):
+            if variants:
+                ordinal = _SIGN_ORDINALS.get(sign, position)
+                self.today_horoscopes[sign] = variants[_mix(seed, ordinal, _GENERAL_STREAM) % len(variants)]
 
         self._generated_for_ymd = today_seed
 
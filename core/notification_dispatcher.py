@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Массовая рассылка ежедневных уведомлений
+
+Получатели группируются по знаку и платформе прямо при чтении потока:
+токены копятся в буферах (знак, платформа) и уходят пачками по
+batch_size. Текст уведомления строится один раз на знак (12 вариантов в
+день). Пачки отправляются ограниченным пулом потоков; если в работе
+max_pending пачек, чтение получателей приостанавливается (backpressure).
+Неудачные токены пачки повторяются с экспоненциальной задержкой.
+
+Для проверки без FCM/APNs есть FakeTransport.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .zodiac_data import ZODIAC_SIGNS
+
+PLATFORMS = ('android', 'ios')
+
+
+class Recipient(NamedTuple):
+    """Получатель уведомления."""
+    device_token: str
+    platform: str    # 'android' или 'ios'
+    sign: str
+
+
+class DispatchReport:
+    """Итоги рассылки."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.failed = 0
+        self.skipped = 0       # неизвестный знак или платформа
+        self.batches = 0
+        self.retries = 0
+        self.rendered = 0      # сколько раз строился текст (по знакам)
+        self.failed_tokens: List[str] = []
+        self._lock = threading.Lock()
+
+    def add_batch(self, sent: int, failed: Sequence[str], retries: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.sent += sent
+            self.failed += len(failed)
+            self.retries += retries
+            self.failed_tokens.extend(failed)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'sent': self.sent,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'batches': self.batches,
+            'retries': self.retries,
+            'rendered': self.rendered,
+        }
+
+
+class NotificationTransport(ABC):
+    """Канал доставки: отправляет один текст пачке токенов одной платформы."""
+
+    @abstractmethod
+    def send_batch(self, platform: str, tokens: Sequence[str], title: str, content: str) -> List[str]:
+        """Отправить пачку; вернуть токены, которые стоит повторить."""
+
+
+class MobileTransport(NotificationTransport):
+    """Доставка через MobileNotificationSystem (FCM / APNs)."""
+
+    def __init__(self, mobile_system) -> None:
+        self.mobile_system = mobile_system
+
+    def send_batch(self, platform: str, tokens: Sequence[str], title: str, content: str) -> List[str]:
+        if platform == 'android':
+            send = self.mobile_system.send_android_notification
+        else:
+            send = self.mobile_system.send_ios_notification
+        return [token for token in tokens if not send(token, title, content)]
+
+
+class FakeTransport(NotificationTransport):
+    """Транспорт в памяти для проверок: запоминает отправки, умеет «падать».
+
+    fail_tokens - токены, которые не доставляются первые fail_attempts раз
+    (None - никогда не доставляются); latency - задержка на пачку, секунды.
+    """
+
+    def __init__(self, fail_tokens: Iterable[str] = (), fail_attempts: Optional[int] = 1,
+                 latency: float = 0.0) -> None:
+        self.fail_tokens: Set[str] = set(fail_tokens)
+        self.fail_attempts = fail_attempts
+        self.latency = latency
+        self.delivered: Dict[str, Tuple[str, str, str]] = {}   # токен -> (платформа, заголовок, текст)
+        self.calls = 0
+        self.max_concurrency = 0
+        self._attempts: Dict[str, int] = {}
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def send_batch(self, platform: str, tokens: Sequence[str], title: str, content: str) -> List[str]:
+        with self._lock:
+            self.calls += 1
+            self._active += 1
+            self.max_concurrency = max(self.max_concurrency, self._active)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            failed = []
+            with self._lock:
+                for token in tokens:
+                    if token in self.fail_tokens:
+                        attempt = self._attempts.get(token, 0) + 1
+                        self._attempts[token] = attempt
+                        if self.fail_attempts is None or attempt <= self.fail_attempts:
+                            failed.append(token)
+                            continue
+                    self.delivered[token] = (platform, title, content)
+            return failed
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+class NotificationDispatcher:
+    """Рассылка ежедневного уведомления множеству получателей."""
+
+    def __init__(self, transport: NotificationTransport, render: Callable[[str], Dict[str, str]],
+                 batch_size: int = 500, max_workers: int = 8, max_pending: Optional[int] = None,
+                 max_retries: int = 3, retry_delay: float = 0.5) -> None:
+        """
+        Args:
+            transport: канал доставки
+            render: знак -> {'title': ..., 'content': ...}
+            batch_size: токенов в одной пачке
+            max_workers: потоков отправки
+            max_pending: пачек в работе одновременно (по умолчанию 2 * max_workers)
+            max_retries: повторов для неудачных токенов пачки
+            retry_delay: начальная задержка повтора, удваивается с каждой попыткой
+        """
+        self.transport = transport
+        self.render = render
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max_pending or self.max_workers * 2
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    # ---------------------------- public API ----------------------------
+    def dispatch(self, recipients: Iterable[Recipient]) -> DispatchReport:
+        """Разослать уведомления; получатели читаются потоком."""
+        report = DispatchReport()
+        contents: Dict[str, Tuple[str, str]] = {}
+        buffers: Dict[Tuple[str, str], List[str]] = {}
+        slots = threading.BoundedSemaphore(self.max_pending)
+        known_signs = set(ZODIAC_SIGNS)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix='zodi-dispatch') as pool:
+
+            def submit(sign: str, platform: str, tokens: List[str]) -> None:
+                content = contents.get(sign)
+                if content is None:
+                    rendered = self.render(sign)
+                    content = contents[sign] = (rendered['title'], rendered['content'])
+                    report.rendered += 1
+                slots.acquire()   # backpressure: ждём, пока освободится место
+                future = pool.submit(self._send_with_retry, platform, tokens, content, report)
+                future.add_done_callback(lambda _: slots.release())
+
+            for recipient in recipients:
+                if recipient.sign not in known_signs or recipient.platform not in PLATFORMS:
+                    report.skipped += 1
+                    continue
+                key = (recipient.sign, recipient.platform)
+                buffer = buffers.setdefault(key, [])
+                buffer.append(recipient.device_token)
+                if len(buffer) >= self.batch_size:
+                    buffers[key] = []
+                    submit(key[0], key[1], buffer)
+
+            for (sign, platform), buffer in buffers.items():
+                if buffer:
+                    submit(sign, platform, buffer)
+
+        return report
+
+    # --------------------------- core logic ----------------------------
+    def _send_with_retry(self, platform: str, tokens: List[str],
+                         content: Tuple[str, str], report: DispatchReport) -> None:
+        title, body = content
+        pending = tokens
+        retries = 0
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                retries += 1
+                time.sleep(self.retry_delay * (2 ** (attempt - 1)))
+            try:
+                pending = list(self.transport.send_batch(platform, pending, title, body))
+            except Exception as e:
+                print(f"Ошибка отправки пачки уведомлений: {e}")
+            if not pending:
+                break
+        report.add_batch(len(tokens) - len(pending), pending, retries)
@@ -9,11 +9,8 @@ import os
 import sys
 import platform
 import json
-import schedule
-import time
 from datetime import datetime, date
-from typing import Optional, Dict, Any
-import threading
+from typing import Optional, Dict, Any, Iterable, Tuple
 
 # Импорты для системных уведомлений
 try:
@@ -38,6 +35,8 @@ except ImportError:
 from .zodiac_calculator import get_zodiac_sign
 from .daily_manager import DailyPredictionManager
 from .zodiac_data import ZODIAC_DATA
+from .scheduler import DailyScheduler
+from .notification_dispatcher import DispatchReport, NotificationDispatcher, NotificationTransport, Recipient
 
 
 class NotificationSystem:
@@ -47,7 +46,7 @@ class NotificationSystem:
         self.system = platform.system().lower()
         self.daily_manager = DailyPredictionManager()
         self.is_running = False
-        self.notification_thread = None
+        self.scheduler: Optional[DailyScheduler] = None
         
         # Настройки уведомлений
         self.settings = {
@@ -57,40 +56,50 @@ class NotificationSystem:
             'sound': True,
             'duration': 10  # секунд
         }
+        
+        # Готовые тексты уведомлений на день: (знак, дата, show_detailed) -> контент
+        self._content_cache: Dict[Tuple[str, str, bool], Dict[str, str]] = {}
+        self._content_cache_day: Optional[date] = None
+        self._icon_path: Optional[str] = None
+        self._icon_resolved = False
     
     def get_daily_prediction_for_sign(self, zodiac_sign: str) -> Dict[str, Any]:
         """Получить предсказание на сегодня для знака зодиака"""
         try:
-            # Получаем предсказание через daily_manager
-            prediction = self.daily_manager.get_daily_general_prediction(zodiac_sign)
-            
-            # Формируем структурированное предсказание
-            return {
-                'sign': zodiac_sign,
-                'date': date.today().strftime('%d.%m.%Y'),
-                'general': prediction.get('general', ''),
-                'love': prediction.get('love', ''),
-                'career': prediction.get('career', ''),
-                'health': prediction.get('health', ''),
-                'finance': prediction.get('finance', ''),
-                'advice': prediction.get('advice', ''),
-                'opportunities': prediction.get('opportunities', ''),
-                'warnings': prediction.get('warnings', '')
-            }
+            return self._build_daily_prediction(zodiac_sign, date.today())
         except Exception as e:
             print(f"Ошибка получения предсказания: {e}")
-            return {
-                'sign': zodiac_sign,
-                'date': date.today().strftime('%d.%m.%Y'),
-                'general': 'Сегодня звезды приготовили для вас особые сюрпризы!',
-                'love': 'В любви вас ждут приятные моменты.',
-                'career': 'Карьера развивается в положительном направлении.',
-                'health': 'Здоровье требует внимания.',
-                'finance': 'Финансы стабильны.',
-                'advice': 'Слушайте свою интуицию.',
-                'opportunities': 'Новые возможности на горизонте.',
-                'warnings': 'Будьте осторожны с важными решениями.'
-            }
+            return self._fallback_prediction(zodiac_sign)
+    
+    def _build_daily_prediction(self, zodiac_sign: str, today: date) -> Dict[str, Any]:
+        """Структурированное предсказание из набора дня (ошибки не перехватываются)"""
+        # Набор дня рассчитывается один раз на все знаки и хранится на диске;
+        # дата передаётся явно, чтобы после полуночи взять набор нового дня
+        bundle = self.daily_manager.get_bundle(zodiac_sign, for_date=today)
+        
+        # Формируем структурированное предсказание
+        prediction = {
+            'sign': zodiac_sign,
+            'date': today.strftime('%d.%m.%Y'),
+        }
+        prediction.update(bundle)
+        return prediction
+    
+    @staticmethod
+    def _fallback_prediction(zodiac_sign: str) -> Dict[str, Any]:
+        """Запасное предсказание, если набор дня недоступен"""
+        return {
+            'sign': zodiac_sign,
+            'date': date.today().strftime('%d.%m.%Y'),
+            'general': 'Сегодня звезды приготовили для вас особые сюрпризы!',
+            'love': 'В любви вас ждут приятные моменты.',
+            'career': 'Карьера развивается в положительном направлении.',
+            'health': 'Здоровье требует внимания.',
+            'finance': 'Финансы стабильны.',
+            'advice': 'Слушайте свою интуицию.',
+            'opportunities': 'Новые возможности на горизонте.',
+            'warnings': 'Будьте осторожны с важными решениями.'
+        }
     
     def create_notification_content(self, prediction: Dict[str, Any]) -> Dict[str, str]:
         """Создать контент для уведомления"""
@@ -101,10 +110,12 @@ class NotificationSystem:
         
         if self.settings['show_detailed']:
             # Детальное уведомление с несколькими категориями
-            content = f"🔮 {prediction['general']}\n\n"
-            content += f"💖 Любовь: {prediction['love']}\n"
-            content += f"💼 Карьера: {prediction['career']}\n"
-            content += f"💰 Финансы: {prediction['finance']}"
+            content = "".join((
+                f"🔮 {prediction['general']}\n\n",
+                f"💖 Любовь: {prediction['love']}\n",
+                f"💼 Карьера: {prediction['career']}\n",
+                f"💰 Финансы: {prediction['finance']}",
+            ))
         else:
             # Краткое уведомление
             content = f"🔮 {prediction['general']}"
@@ -112,9 +123,44 @@ class NotificationSystem:
         return {
             'title': title,
             'content': content,
-            'icon': self._get_notification_icon_path()
+            'icon': self._notification_icon_path()
         }
     
+    def get_notification_content(self, zodiac_sign: str) -> Dict[str, str]:
+        """Контент уведомления на сегодня из кеша (строится один раз на знак)
+        
+        Кеш сбрасывается при смене даты и при изменении настроек. Запасной
+        текст (набор дня недоступен) не кешируется - следующий вызов снова
+        обратится к набору дня. Возвращаемый словарь общий - не изменяйте его.
+        """
+        today = date.today()
+        if self._content_cache_day != today:
+            self._content_cache.clear()
+            self._content_cache_day = today
+        key = (zodiac_sign, today.isoformat(), bool(self.settings['show_detailed']))
+        content = self._content_cache.get(key)
+        if content is None:
+            try:
+                prediction = self._build_daily_prediction(zodiac_sign, today)
+            except Exception as e:
+                print(f"Ошибка получения предсказания: {e}")
+                return self.create_notification_content(self._fallback_prediction(zodiac_sign))
+            content = self.create_notification_content(prediction)
+            self._content_cache[key] = content
+        return content
+    
+    def invalidate_notification_cache(self):
+        """Сбросить готовые тексты уведомлений"""
+        self._content_cache.clear()
+        self._content_cache_day = None
+    
+    def _notification_icon_path(self) -> Optional[str]:
+        """Путь к иконке (ищется один раз на экземпляр)"""
+        if not self._icon_resolved:
+            self._icon_path = self._get_notification_icon_path()
+            self._icon_resolved = True
+        return self._icon_path
+    
     def _get_notification_icon_path(self) -> Optional[str]:
         """Получить путь к иконке для уведомления"""
         # Ищем иконку в директории assets
@@ -206,11 +252,8 @@ class NotificationSystem:
     def send_daily_notification(self, user_zodiac_sign: str):
         """Отправить ежедневное уведомление для знака зодиака"""
         try:
-            # Получаем предсказание
-            prediction = self.get_daily_prediction_for_sign(user_zodiac_sign)
-            
-            # Создаем контент уведомления
-            notification_content = self.create_notification_content(prediction)
+            # Контент уведомления на сегодня (из кеша)
+            notification_content = self.get_notification_content(user_zodiac_sign)
             
             # Показываем уведомление
             success = self.show_notification(
@@ -230,39 +273,51 @@ class NotificationSystem:
             print(f"Ошибка отправки уведомления: {e}")
             return False
     
+    def render_daily_notification(self, zodiac_sign: str) -> Dict[str, str]:
+        """Заголовок и текст ежедневного уведомления для знака"""
+        return self.get_notification_content(zodiac_sign)
+    
+    def dispatch_daily_notifications(self, recipients: Iterable[Recipient],
+                                     transport: NotificationTransport, **options) -> DispatchReport:
+        """Разослать ежедневное уведомление множеству устройств
+        
+        Текст строится один раз на знак; options передаются в NotificationDispatcher
+        (batch_size, max_workers, max_pending, max_retries, retry_delay).
+        """
+        dispatcher = NotificationDispatcher(transport, self.render_daily_notification, **options)
+        report = dispatcher.dispatch(recipients)
+        print(f"Рассылка завершена: {report.as_dict()}")
+        return report
+    
     def start_daily_scheduler(self, user_zodiac_sign: str):
         """Запустить планировщик ежедневных уведомлений"""
         if self.is_running:
             print("Планировщик уже запущен")
             return
         
-        # Настраиваем расписание
-        schedule.every().day.at(self.settings['time']).do(
-            self.send_daily_notification, user_zodiac_sign
+        # Поток спит до времени уведомления, а не опрашивает расписание
+        self.scheduler = DailyScheduler(
+            self.settings['time'], self.send_daily_notification, user_zodiac_sign
         )
-        
+        self.scheduler.start()
         self.is_running = True
         
-        def run_scheduler():
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(60)  # Проверяем каждую минуту
-        
-        # Запускаем планировщик в отдельном потоке
-        self.notification_thread = threading.Thread(target=run_scheduler, daemon=True)
-        self.notification_thread.start()
-        
         print(f"Планировщик уведомлений запущен. Время: {self.settings['time']}")
     
     def stop_daily_scheduler(self):
         """Остановить планировщик уведомлений"""
         self.is_running = False
-        schedule.clear()
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+            self.scheduler = None
         print("Планировщик уведомлений остановлен")
     
     def update_settings(self, new_settings: Dict[str, Any]):
         """Обновить настройки уведомлений"""
         self.settings.update(new_settings)
+        self.invalidate_notification_cache()
+        if self.scheduler is not None and 'time' in new_settings:
+            self.scheduler.reschedule(self.settings['time'])
         print(f"Настройки уведомлений обновлены: {self.settings}")
     
     def test_notification(self, user_zodiac_sign: str):
@@ -285,6 +340,7 @@ class NotificationSystem:
             if os.path.exists(file_path):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     self.settings.update(json.load(f))
+                self.invalidate_notification_cache()
                 print(f"Настройки загружены из {file_path}")
         except Exception as e:
             print(f"Ошибка загрузки настроек: {e}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Ленивый каталог структурированных предсказаний
+
+Данные каждого знака лежат в отдельном модуле core/sign_predictions/ и
+импортируются только при первом обращении. Холодный старт строит словарь
+одного знака пользователя, а не всех двенадцати.
+
+Для выбора текстов каталог отдаёт неизменяемые кортежи по паре
+(знак, категория), общие для structured_predictions и daily_manager.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+# Знак -> (модуль в core.sign_predictions, историческое имя переменной)
+SIGN_MODULES: Dict[str, Tuple[str, str]] = {
+    "Овен": ("aries", "ARIES_PREDICTIONS"),
+    "Телец": ("taurus", "TAURUS_PREDICTIONS"),
+    "Близнецы": ("gemini", "GEMINI_PREDICTIONS"),
+    "Рак": ("cancer", "CANCER_PREDICTIONS"),
+    "Лев": ("leo", "LEO_PREDICTIONS"),
+    "Дева": ("virgo", "VIRGO_PREDICTIONS"),
+    "Весы": ("libra", "LIBRA_PREDICTIONS"),
+    "Скорпион": ("scorpio", "SCORPIO_PREDICTIONS"),
+    "Стрелец": ("sagittarius", "SAGITTARIUS_PREDICTIONS"),
+    "Козерог": ("capricorn", "CAPRICORN_PREDICTIONS"),
+    "Водолей": ("aquarius", "AQUARIUS_PREDICTIONS"),
+    "Рыбы": ("pisces", "PISCES_PREDICTIONS"),
+}
+
+_SIGN_BY_ATTRIBUTE = {attr: sign for sign, (_, attr) in SIGN_MODULES.items()}
+
+
+class PredictionCatalog:
+    """Материализует данные знака только при первом обращении."""
+
+    def __init__(self) -> None:
+        self._signs: Dict[str, Dict] = {}
+        self._universal: Optional[Dict] = None
+        # Знак (или "universal") -> неизменяемая карта категория -> кортеж текстов
+        self._pools: Dict[str, Mapping[str, Tuple[str, ...]]] = {}
+
+    def get_sign(self, sign: str) -> Optional[Dict]:
+        """Данные знака в формате {"sign": ..., "predictions": {...}} или None."""
+        data = self._signs.get(sign)
+        if data is None:
+            entry = SIGN_MODULES.get(sign)
+            if entry is None:
+                return None
+            module = importlib.import_module(f'.sign_predictions.{entry[0]}', __package__)
+            data = self._signs.setdefault(sign, module.PREDICTIONS)
+        return data
+
+    def get_universal(self) -> Dict:
+        """Универсальная база в том же формате, что и базы знаков."""
+        if self._universal is None:
+            from .universal_predictions import UNIVERSAL_PREDICTIONS
+            self._universal = {"sign": "universal", "predictions": UNIVERSAL_PREDICTIONS}
+        return self._universal
+
+    def get_pools(self, sign: str) -> Optional[Mapping[str, Tuple[str, ...]]]:
+        """Все категории знака в виде кортежей (для random.choice без копий)."""
+        pools = self._pools.get(sign)
+        if pools is None:
+            data = self.get_universal() if sign == "universal" else self.get_sign(sign)
+            if data is None:
+                return None
+            pools = MappingProxyType({
+                category: tuple(texts) for category, texts in data["predictions"].items()
+            })
+            pools = self._pools.setdefault(sign, pools)
+        return pools
+
+    def get_pool(self, sign: str, category: str) -> Optional[Tuple[str, ...]]:
+        """Кортеж текстов знака по категории; None для неизвестного знака.
+
+        Для неизвестной категории бросает KeyError.
+        """
+        pools = self.get_pools(sign)
+        if pools is None:
+            return None
+        return pools[category]
+
+    def get_universal_pool(self, category: str) -> Tuple[str, ...]:
+        """Кортеж универсальных текстов категории."""
+        return self.get_pools("universal")[category]
+
+    def get_by_attribute(self, name: str) -> Dict:
+        """Данные по историческому имени (ARIES_PREDICTIONS, ...)."""
+        if name == "UNIVERSAL_PREDICTIONS":
+            return self.get_universal()
+        sign = _SIGN_BY_ATTRIBUTE.get(name)
+        if sign is None:
+            raise AttributeError(name)
+        return self.get_sign(sign)
+
+    def loaded_signs(self) -> Tuple[str, ...]:
+        """Знаки, данные которых уже построены."""
+        return tuple(self._signs)
+
+
+_catalog = PredictionCatalog()
+
+
+def get_prediction_catalog() -> PredictionCatalog:
+    """Вернуть общий для процесса каталог предсказаний."""
+    return _catalog
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Общий реестр баз предсказаний
+
+Каждый файл базы данных разбирается не более одного раза на процесс.
+Повторная загрузка происходит только при изменении файла (по mtime).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class PredictionCorpusRegistry:
+    """Потокобезопасный кэш разобранных JSON-баз предсказаний.
+
+    Возвращаемые данные общие для всех потребителей и не должны изменяться.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # абсолютный путь -> (mtime_ns, размер, разобранные данные)
+        self._entries: Dict[str, Tuple[int, int, Any]] = {}
+
+    def load(self, path: str) -> Any:
+        """Получить разобранное содержимое файла.
+
+        Бросает FileNotFoundError, если файла нет, как и обычный open().
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        with self._lock:
+            # Другой поток мог успеть загрузить файл, пока мы ждали блокировку
+            stat = os.stat(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                return entry[2]
+
+            with open(key, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, data)
+            return data
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Сбросить кэш для одного файла или целиком."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def is_loaded(self, path: str) -> bool:
+        """Проверить, есть ли файл в кэше."""
+        return os.path.abspath(path) in self._entries
+
+
+_registry = PredictionCorpusRegistry()
+
+
+def get_corpus_registry() -> PredictionCorpusRegistry:
+    """Вернуть общий для процесса реестр баз предсказаний."""
+    return _registry
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Выбор источника расширенных предсказаний
+
+Упорядоченный список баз данных проверяется один раз на процесс,
+победивший источник запоминается. Источник можно закрепить через
+configure_prediction_sources(pinned=...) или переменную окружения
+ZODI_PREDICTIONS_SOURCE.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from .prediction_corpus import get_corpus_registry
+from .prediction_store import open_compiled_store
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+PIN_ENV_VAR = 'ZODI_PREDICTIONS_SOURCE'
+
+
+class PredictionSource(NamedTuple):
+    """Уровень (tier) базы предсказаний."""
+    name: str
+    filename: str
+
+
+# Порядок приоритета: от качественной базы к самой старой
+DEFAULT_SOURCES = (
+    PredictionSource('quality', 'extended_predictions_quality.json'),
+    PredictionSource('unified', 'extended_predictions_unified.json'),
+    PredictionSource('mega_all', 'extended_predictions_mega_all.json'),
+    PredictionSource('mega_complete', 'extended_predictions_mega_complete.json'),
+    PredictionSource('complete', 'extended_predictions_complete.json'),
+    PredictionSource('db', 'extended_predictions_db.json'),
+)
+
+
+class ResolvedSource(NamedTuple):
+    """Результат выбора источника."""
+    name: str
+    path: str
+    format: str          # 'zdb' или 'json'
+    elapsed_ms: float
+    skipped: tuple       # уровни, которые оказались недоступны
+
+
+class PredictionSourceResolver:
+    """Находит первую доступную базу предсказаний и запоминает её."""
+
+    def __init__(self, sources: Sequence[PredictionSource] = DEFAULT_SOURCES,
+                 data_dir: str = DATA_DIR, pinned: Optional[str] = None) -> None:
+        self._lock = threading.Lock()
+        self.data_dir = data_dir
+        self.sources = tuple(sources)
+        self.pinned = pinned
+        self._resolved: Optional[ResolvedSource] = None
+        self._resolved_once = False
+
+    # ---------------------------- public API ----------------------------
+    def configure(self, sources: Optional[Sequence[PredictionSource]] = None,
+                  pinned: Optional[str] = None) -> None:
+        """Задать порядок источников и/или закрепить уровень. Сбрасывает выбор."""
+        with self._lock:
+            if sources is not None:
+                self.sources = tuple(sources)
+            self.pinned = pinned
+            self._reset_locked()
+
+    def resolve(self) -> Optional[ResolvedSource]:
+        """Выбрать источник (один раз) и вернуть сведения о нём."""
+        if self._resolved_once:
+            return self._resolved
+        with self._lock:
+            if not self._resolved_once:
+                self._resolved = self._probe()
+                self._resolved_once = True
+            return self._resolved
+
+    def load(self) -> Optional[Any]:
+        """Вернуть данные выбранного источника или None, если баз нет.
+
+        Данные общие для процесса (реестр / mmap) и только для чтения.
+        """
+        resolved = self.resolve()
+        if resolved is None:
+            return None
+        data = self._read(resolved.path)
+        if data is None:
+            # Файл пропал после выбора - выбираем заново
+            self.reset()
+            resolved = self.resolve()
+            data = self._read(resolved.path) if resolved is not None else None
+        return data
+
+    def info(self) -> Dict[str, Any]:
+        """Сведения о выбранном уровне и времени выбора."""
+        resolved = self.resolve()
+        if resolved is None:
+            return {'tier': None, 'pinned': self.pinned}
+        return {
+            'tier': resolved.name,
+            'path': resolved.path,
+            'format': resolved.format,
+            'elapsed_ms': resolved.elapsed_ms,
+            'skipped': list(resolved.skipped),
+            'pinned': self.pinned,
+        }
+
+    def reset(self) -> None:
+        """Забыть выбранный источник."""
+        with self._lock:
+            self._reset_locked()
+
+    # --------------------------- core logic ----------------------------
+    def _reset_locked(self) -> None:
+        self._resolved = None
+        self._resolved_once = False
+
+    def _candidates(self) -> List[PredictionSource]:
+        pinned = self.pinned or os.environ.get(PIN_ENV_VAR) or None
+        if pinned is None:
+            return list(self.sources)
+        chosen = [s for s in self.sources if s.name == pinned]
+        if not chosen:
+            print(f"Неизвестный источник предсказаний: {pinned}")
+        return chosen
+
+    def _probe(self) -> Optional[ResolvedSource]:
+        started = time.perf_counter()
+        skipped: List[str] = []
+        for source in self._candidates():
+            path = os.path.join(self.data_dir, source.filename)
+            data = self._read(path)
+            if data is None:
+                skipped.append(source.name)
+                continue
+            fmt = 'json' if isinstance(data, dict) else 'zdb'
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            return ResolvedSource(source.name, path, fmt, elapsed_ms, tuple(skipped))
+        return None
+
+    @staticmethod
+    def _read(path: str) -> Optional[Any]:
+        store = open_compiled_store(path)
+        if store is not None:
+            return store
+        try:
+            data = get_corpus_registry().load(path)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            print(f"Ошибка чтения базы предсказаний {path}: {e}")
+            return None
+        # Качественная и объединённая базы имеют структуру с metadata и predictions
+        if isinstance(data, dict) and 'predictions' in data:
+            return data['predictions']
+        return data
+
+
+_resolver = PredictionSourceResolver()
+
+
+def get_source_resolver() -> PredictionSourceResolver:
+    """Вернуть общий для процесса выбор источника предсказаний."""
+    return _resolver
+
+
+def configure_prediction_sources(sources: Optional[Sequence[PredictionSource]] = None,
+                                 pinned: Optional[str] = None) -> None:
+    """Настроить порядок источников и/или закрепить уровень для приложения."""
+    _resolver.configure(sources, pinned)
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Компилированное бинарное хранилище предсказаний
+
+JSON-база (data/extended_predictions_*.json) компилируется в файл .zdb:
+таблица строк + индекс смещений по паре (знак, категория). Файл
+отображается в память (mmap), строки декодируются только при обращении.
+
+Сборка:
+    python -m core.prediction_store [источник.json] [результат.zdb]
+
+Формат (little-endian):
+    заголовок: magic, версия, резерв, crc32 тела, длина тела,
+               размер и crc32 исходного JSON (проверка актуальности)
+    тело:      u32 длина meta + meta (JSON: знаки, категории, metadata), выравнивание до 4
+               u32 число записей, u32 число строк
+               индекс: (начало, количество) u32 на каждую пару (знак, категория)
+               записи: u32 номера строк
+               смещения строк: (число строк + 1) u32
+               данные строк: UTF-8
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from collections.abc import Mapping, Sequence
+from typing import Dict, List, Optional, Tuple
+
+MAGIC = b'ZODB'
+FORMAT_VERSION = 2
+COMPILED_EXT = '.zdb'
+
+_HEADER = struct.Struct('<4sHHIIQI')
+_U32 = struct.Struct('<I')
+_PAIR = struct.Struct('<II')
+_COUNTS = struct.Struct('<II')
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+DEFAULT_SOURCE = os.path.join(DATA_DIR, 'extended_predictions_quality.json')
+
+
+def compiled_path_for(source_path: str) -> str:
+    """Путь к скомпилированному файлу рядом с исходным JSON."""
+    return os.path.splitext(source_path)[0] + COMPILED_EXT
+
+
+# --------------------------------------------------------------------------
+# Сборка
+# --------------------------------------------------------------------------
+
+def compile_store(source_path: str, output_path: Optional[str] = None) -> str:
+    """Скомпилировать JSON-базу предсказаний в бинарный файл .zdb"""
+    output_path = output_path or compiled_path_for(source_path)
+
+    with open(source_path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw.decode('utf-8'))
+    metadata = data.get('metadata', {}) if isinstance(data, dict) else {}
+    predictions = data.get('predictions', data)
+
+    signs = list(predictions.keys())
+    categories: List[str] = list(metadata.get('categories') or [])
+    for sign_data in predictions.values():
+        for category in sign_data:
+            if category not in categories:
+                categories.append(category)
+
+    # Таблица строк с дедупликацией
+    string_ids: Dict[str, int] = {}
+    strings: List[bytes] = []
+    index: List[Tuple[int, int]] = []
+    entries: List[int] = []
+    for sign in signs:
+        sign_data = predictions[sign]
+        for category in categories:
+            start = len(entries)
+            for text in sign_data.get(category, []):
+                sid = string_ids.get(text)
+                if sid is None:
+                    sid = len(strings)
+                    string_ids[text] = sid
+                    strings.append(text.encode('utf-8'))
+                entries.append(sid)
+            index.append((start, len(entries) - start))
+
+    meta = json.dumps(
+        {'signs': signs, 'categories': categories, 'metadata': metadata},
+        ensure_ascii=False, separators=(',', ':'),
+    ).encode('utf-8')
+
+    body = bytearray()
+    body += _U32.pack(len(meta))
+    body += meta
+    body += b'\0' * (-len(body) % 4)
+    body += _COUNTS.pack(len(entries), len(strings))
+    for start, count in index:
+        body += _PAIR.pack(start, count)
+    body += struct.pack('<%dI' % len(entries), *entries)
+    offset = 0
+    offsets = [0]
+    for encoded in strings:
+        offset += len(encoded)
+        offsets.append(offset)
+    body += struct.pack('<%dI' % len(offsets), *offsets)
+    for encoded in strings:
+        body += encoded
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, zlib.crc32(body), len(body), len(raw), zlib.crc32(raw))
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+# --------------------------------------------------------------------------
+# Чтение
+# --------------------------------------------------------------------------
+
+class StoreFormatError(ValueError):
+    """Файл .zdb повреждён, устарел или имеет неизвестный формат."""
+
+
+class _CategoryView(Sequence):
+    """Ленивый список предсказаний одной категории одного знака."""
+
+    __slots__ = ('_store', '_start', '_count')
+
+    def __init__(self, store: 'PredictionStore', start: int, count: int) -> None:
+        self._store = store
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._store._entry_text(self._start + i)
+
+
+class _SignView(Mapping):
+    """Категории предсказаний одного знака."""
+
+    __slots__ = ('_store', '_sign_ordinal')
+
+    def __init__(self, store: 'PredictionStore', sign_ordinal: int) -> None:
+        self._store = store
+        self._sign_ordinal = sign_ordinal
+
+    def __getitem__(self, category: str) -> _CategoryView:
+        cat_ordinal = self._store._category_ordinals[category]
+        return self._store._slot(self._sign_ordinal, cat_ordinal)
+
+    def __iter__(self):
+        return iter(self._store.categories)
+
+    def __len__(self) -> int:
+        return len(self._store.categories)
+
+
+class PredictionStore(Mapping):
+    """Отображённая в память база предсказаний: знак -> категория -> список.
+
+    Повторяет форму словаря из JSON, поэтому может подменять predictions_db.
+    """
+
+    def __init__(self, path: str, source_crc: Optional[int] = None) -> None:
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse(source_crc)
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _parse(self, source_crc: Optional[int]) -> None:
+        mm = self._mm
+        if len(mm) < _HEADER.size:
+            raise StoreFormatError("файл слишком короткий")
+        magic, version, _, checksum, body_size, _, stored_source_crc = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise StoreFormatError("неизвестный формат")
+        if len(mm) != _HEADER.size + body_size:
+            raise StoreFormatError("неверная длина файла")
+        with memoryview(mm) as view:
+            if zlib.crc32(view[_HEADER.size:]) != checksum:
+                raise StoreFormatError("контрольная сумма не совпадает")
+        if source_crc is not None and source_crc != stored_source_crc:
+            raise StoreFormatError("файл устарел относительно исходного JSON")
+
+        pos = _HEADER.size
+        (meta_len,) = _U32.unpack_from(mm, pos)
+        pos += _U32.size
+        meta = json.loads(mm[pos:pos + meta_len].decode('utf-8'))
+        pos += meta_len
+        pos += -(pos - _HEADER.size) % 4
+
+        self.signs: Tuple[str, ...] = tuple(meta['signs'])
+        self.categories: Tuple[str, ...] = tuple(meta['categories'])
+        self.metadata: Dict = meta.get('metadata', {})
+        self._sign_ordinals = {s: i for i, s in enumerate(self.signs)}
+        self._category_ordinals = {c: i for i, c in enumerate(self.categories)}
+
+        n_entries, n_strings = _COUNTS.unpack_from(mm, pos)
+        pos += _COUNTS.size
+        self._index_pos = pos
+        pos += _PAIR.size * len(self.signs) * len(self.categories)
+        self._entries_pos = pos
+        pos += _U32.size * n_entries
+        self._offsets_pos = pos
+        pos += _U32.size * (n_strings + 1)
+        self._strings_pos = pos
+
+    # ------------------------------ доступ -------------------------------
+    def _slot(self, sign_ordinal: int, cat_ordinal: int) -> _CategoryView:
+        pos = self._index_pos + _PAIR.size * (sign_ordinal * len(self.categories) + cat_ordinal)
+        start, count = _PAIR.unpack_from(self._mm, pos)
+        return _CategoryView(self, start, count)
+
+    def _entry_text(self, entry: int) -> str:
+        (sid,) = _U32.unpack_from(self._mm, self._entries_pos + _U32.size * entry)
+        start, end = _PAIR.unpack_from(self._mm, self._offsets_pos + _U32.size * sid)
+        base = self._strings_pos
+        return self._mm[base + start:base + end].decode('utf-8')
+
+    def get_text(self, sign: str, category: str, i: int) -> str:
+        """Получить i-е предсказание категории знака без декодирования остальных."""
+        return self[sign][category][i]
+
+    def __getitem__(self, sign: str) -> _SignView:
+        return _SignView(self, self._sign_ordinals[sign])
+
+    def __iter__(self):
+        return iter(self.signs)
+
+    def __len__(self) -> int:
+        return len(self.signs)
+
+    def close(self) -> None:
+        """Закрыть отображение файла и убрать хранилище из общего кеша.
+
+        Хранилище из open_compiled_store общее для всех вызывающих: после
+        close() им не может пользоваться никто, а следующий вызов
+        open_compiled_store откроет файл заново.
+        """
+        with _stores_lock:
+            path = os.path.abspath(self.path)
+            cached = _open_stores.get(path)
+            if cached is not None and cached[1] is self:
+                del _open_stores[path]
+        self._mm.close()
+
+
+_stores_lock = threading.Lock()
+# путь .zdb -> ((mtime_ns .zdb, mtime_ns и размер JSON), хранилище)
+_open_stores: Dict[str, Tuple[Tuple[int, Optional[Tuple[int, int]]], Optional[PredictionStore]]] = {}
+
+
+def invalidate_compiled_store(source_path: Optional[str] = None) -> None:
+    """Забыть открытые хранилища (одного JSON-источника или все).
+
+    Уже выданные хранилища не закрываются и продолжают работать; следующий
+    open_compiled_store заново проверит файлы.
+    """
+    with _stores_lock:
+        if source_path is None:
+            _open_stores.clear()
+        else:
+            _open_stores.pop(os.path.abspath(compiled_path_for(source_path)), None)
+
+
+def _source_crc(source_path: str) -> Optional[int]:
+    """crc32 байтов исходного JSON (None, если исходника нет).
+
+    Сравнивается содержимое, а не размер: правка с тем же размером файла
+    (например, замена одной буквы) тоже делает .zdb устаревшим.
+    """
+    try:
+        with open(source_path, 'rb') as f:
+            return zlib.crc32(f.read())
+    except OSError:
+        return None
+
+
+def open_compiled_store(source_path: str) -> Optional[PredictionStore]:
+    """Открыть скомпилированную версию JSON-базы, если она есть и актуальна.
+
+    Возвращает None, если файла .zdb нет, он повреждён или собран из другой
+    версии JSON - тогда вызывающий код должен читать JSON как раньше.
+    """
+    path = os.path.abspath(compiled_path_for(source_path))
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        source_stat = os.stat(source_path)
+        source_key: Optional[Tuple[int, int]] = (source_stat.st_mtime_ns, source_stat.st_size)
+    except OSError:
+        # На устройстве может лежать только скомпилированная база
+        source_key = None
+
+    # Пока файлы не менялись, исходный JSON повторно не читается
+    key = (mtime, source_key)
+    cached = _open_stores.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with _stores_lock:
+        cached = _open_stores.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            source_crc = _source_crc(source_path) if source_key is not None else None
+            store: Optional[PredictionStore] = PredictionStore(path, source_crc)
+        except (OSError, ValueError) as e:
+            # Запоминаем неудачу, чтобы не проверять тот же файл повторно
+            print(f"Скомпилированная база {path} не используется: {e}")
+            store = None
+        _open_stores[path] = (key, store)
+        return store
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOURCE
+    output = sys.argv[2] if len(sys.argv) > 2 else None
+    result = compile_store(source, output)
+    print(f"База скомпилирована: {result} ({os.path.getsize(result)} байт)")
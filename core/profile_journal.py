@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Журнал изменений профиля
+
+Добавление в избранное и в историю совместимости дописывает в журнал одну
+зашифрованную строку вместо перезаписи всего профиля. Каждая запись имеет
+порядковый номер (seq). Снимок профиля хранит номер последней учтённой
+записи (journal_seq); при загрузке применяются только более поздние записи.
+Когда журнал разрастается, профиль сохраняется целиком и журнал очищается
+(компакция), так что время загрузки ограничено.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Порог компакции: после стольких записей профиль сохраняется целиком
+JOURNAL_COMPACT_EVERY = 64
+
+
+class ProfileJournal:
+    """Журнал операций профиля: одна зашифрованная JSON-запись на строку."""
+
+    def __init__(self, path: str, encryption_manager) -> None:
+        self.path = path
+        self.encryption_manager = encryption_manager
+        self.last_seq = 0
+        self.records = 0   # записей в файле журнала
+        self._torn_tail = False  # файл оканчивается оборванной строкой
+
+    # ---------------------------- public API ----------------------------
+    def replay(self, after_seq: int) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Записи (seq, op, entry) с номером больше after_seq, по порядку.
+
+        Нечитаемые строки (например, оборванная последняя запись после сбоя)
+        пропускаются.
+        """
+        self.last_seq = after_seq
+        self.records = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"Ошибка чтения журнала профиля: {e}")
+            return
+        self._torn_tail = bool(text) and not text.endswith('\n')
+
+        for line in text.splitlines():
+            if not line:
+                continue
+            record = self._decode(line)
+            if record is None:
+                print("Пропущена повреждённая запись журнала профиля")
+                continue
+            self.records += 1
+            seq = record['seq']
+            if seq <= after_seq:
+                continue
+            self.last_seq = max(self.last_seq, seq)
+            yield seq, record['op'], record['entry']
+
+    def append(self, op: str, entry: Dict[str, Any]) -> bool:
+        """Дописать запись в журнал и сбросить её на диск."""
+        seq = self.last_seq + 1
+        payload = json.dumps({'seq': seq, 'op': op, 'entry': entry},
+                             ensure_ascii=False, separators=(',', ':'))
+        line = self.encryption_manager.encrypt(payload)
+        if not line:
+            return False
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                # Новая запись не должна склеиться с оборванной строкой
+                f.write(('\n' if self._torn_tail else '') + line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"Ошибка записи журнала профиля: {e}")
+            return False
+        self._torn_tail = False
+        self.last_seq = seq
+        self.records += 1
+        return True
+
+    def needs_compaction(self) -> bool:
+        """Пора ли сохранить профиль целиком и очистить журнал."""
+        return self.records >= JOURNAL_COMPACT_EVERY
+
+    def truncate(self) -> None:
+        """Очистить журнал (после сохранения снимка с journal_seq = last_seq)."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Ошибка очистки журнала профиля: {e}")
+            return
+        self.records = 0
+        self._torn_tail = False
+
+    # --------------------------- core logic ----------------------------
+    def _decode(self, line: str) -> Optional[Dict[str, Any]]:
+        decrypted = self.encryption_manager.decrypt(line)
+        if not decrypted:
+            return None
+        try:
+            record = json.loads(decrypted)
+        except ValueError:
+            return None
+        if not isinstance(record, dict) or not {'seq', 'op', 'entry'} <= record.keys():
+            return None
+        return record
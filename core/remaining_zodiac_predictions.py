@@ -2,1131 +2,21 @@
 # -*- coding: utf-8 -*-
 """
 Остальные знаки зодиака для структурированной системы предсказаний
-"""
-
-# 6. ДЕВА - Практичность, аналитичность, перфекционизм
-VIRGO_PREDICTIONS = {
-    "sign": "Дева",
-    "predictions": {
-        "love": [
-            "Время для проявления заботы и внимания к деталям в отношениях.",
-            "Ваша практичность поможет в решении бытовых вопросов в любви.",
-            "Новые возможности для любви появятся через работу или учебу.",
-            "Время для проявления терпения и понимания к партнеру.",
-            "Ваша аналитичность поможет в понимании потребностей партнера.",
-            "Новые знакомства через друзей или коллег принесут радость.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша практичность поможет в создании стабильных отношений.",
-            "Время для планирования совместного будущего с любимым человеком.",
-            "Ваша преданность и верность будут высоко оценены партнером.",
-            "Новые возможности для романтики появятся через практические дела.",
-            "Время для проявления терпения и понимания в отношениях.",
-            "Ваша аналитичность поможет в решении любых проблем в любви.",
-            "Время для создания системы поддержки и помощи в отношениях.",
-            "Ваша практичность поможет в планировании совместных мероприятий.",
-            "Новые возможности для любви появятся через заботу о других.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша заботливость создаст прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша преданность и верность будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы над деталями и совершенствованием процессов.",
-            "Ваша аналитичность поможет в решении сложных профессиональных задач.",
-            "Новые возможности для карьерного роста появятся через упорный труд.",
-            "Время для развития навыков анализа и планирования.",
-            "Ваша практичность поможет в оптимизации рабочих процессов.",
-            "Новые возможности для заработка появятся через практические навыки.",
-            "Время для создания системы организации и планирования в работе.",
-            "Ваша заботливость поможет в установлении доверительных отношений с коллегами.",
-            "Новые возможности для карьерного роста появятся через семью.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша аналитичность поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с деталями и совершенствованием.",
-            "Ваша практичность поможет в создании эффективных рабочих процессов.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша заботливость поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша преданность поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для создания детальной системы управления финансами.",
-            "Ваша аналитичность поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через практические навыки.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша практичность поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через упорный труд.",
-            "Время для создания системы финансового планирования и контроля.",
-            "Ваша аналитичность подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Ваша практичность поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша аналитичность поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через практические навыки.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша практичность поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша преданность поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для создания детальной системы здорового образа жизни.",
-            "Ваша аналитичность поможет в понимании потребностей вашего тела.",
-            "Новые возможности для укрепления здоровья появятся через практические методы.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша практичность поможет в создании системы здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через семью.",
-            "Время для создания системы мониторинга здоровья и самочувствия.",
-            "Ваша аналитичность подскажет правильный момент для обращения к врачу.",
-            "Новые возможности для оздоровления появятся через практические методы.",
-            "Время для изучения новых способов поддержания здоровья и долголетия.",
-            "Ваша практичность поможет в создании комфортной среды для здоровья.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша аналитичность поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша практичность поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша преданность поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День практичности и внимания к деталям. Цените качество во всем.",
-            "Ваша аналитичность поможет в принятии важных жизненных решений.",
-            "Время для создания системы организации и планирования в жизни.",
-            "Новые возможности для роста появятся через практические навыки.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша практичность поможет в решении повседневных задач.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша заботливость поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков анализа и планирования.",
-            "Ваша практичность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша заботливость поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша преданность поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте гибкость, но не забывайте про практичность.",
-            "Ваша аналитичность - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
-            "Баланс между перфекционизмом и принятием несовершенства важен для гармонии.",
-            "Ваша практичность - это сила, но не забывайте про мечты.",
-            "Время для развития уверенности в принятии решений.",
-            "Ваша заботливость - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между критичностью и принятием важен для успеха.",
-            "Ваша преданность - это дар, но не забывайте про гибкость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша аналитичность - это сила, но используйте её с умом.",
-            "Время для развития навыков принятия и прощения.",
-            "Ваша практичность - это дар, но не забывайте про творчество.",
-            "Баланс между контролем и спонтанностью важен для роста.",
-            "Ваша заботливость - это достоинство, но иногда нужна дистанция.",
-            "Время для развития навыков расслабления и отдыха.",
-            "Ваша преданность - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша практичность - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для практической работы появятся в неожиданных местах.",
-            "Время для участия в проектах по совершенствованию и оптимизации.",
-            "Ваша аналитичность поможет в выборе правильных возможностей.",
-            "Новые знакомства через работу откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через практические навыки.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша практичность поможет в установлении важных связей.",
-            "Новые возможности для самореализации появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через практическую работу.",
-            "Время для развития навыков анализа и планирования.",
-            "Ваша практичность поможет в выборе подходящих возможностей.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для участия в программах поддержки и помощи.",
-            "Ваша заботливость поможет в создании новых возможностей.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша преданность поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через практическую работу."
-        ]
-    }
-}
 
-# 7. ВЕСЫ - Гармония, дипломатия, красота
-LIBRA_PREDICTIONS = {
-    "sign": "Весы",
-    "predictions": {
-        "love": [
-            "Время для создания гармонии и баланса в отношениях.",
-            "Ваша дипломатичность поможет в решении любых конфликтов в любви.",
-            "Новые возможности для любви появятся через искусство и красоту.",
-            "Время для проявления эстетического вкуса в отношениях.",
-            "Ваша способность к компромиссу поможет в укреплении отношений.",
-            "Новые знакомства через культурные мероприятия принесут радость.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша красота и обаяние будут высоко оценены партнером.",
-            "Время для планирования романтических мероприятий и событий.",
-            "Ваша дипломатичность поможет в создании гармоничных отношений.",
-            "Новые возможности для романтики появятся через искусство.",
-            "Время для проявления эстетического вкуса в романтических жестах.",
-            "Ваша способность к компромиссу поможет в решении любых проблем в любви.",
-            "Время для создания атмосферы красоты и гармонии в отношениях.",
-            "Ваша дипломатичность поможет в укреплении существующих связей.",
-            "Новые возможности для любви появятся через культурные мероприятия.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша красота и обаяние создадут прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша дипломатичность и красота будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы в сфере искусства, дизайна или дипломатии.",
-            "Ваша дипломатичность поможет в решении сложных профессиональных задач.",
-            "Новые возможности для карьерного роста появятся через искусство и красоту.",
-            "Время для развития навыков дипломатии и переговоров.",
-            "Ваша эстетический вкус поможет в создании красивых проектов.",
-            "Новые возможности для заработка появятся через искусство и творчество.",
-            "Время для создания гармоничной рабочей атмосферы.",
-            "Ваша дипломатичность поможет в установлении доверительных отношений с коллегами.",
-            "Новые возможности для карьерного роста появятся через культурные мероприятия.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша способность к компромиссу поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша эстетический вкус поможет в создании красивых и функциональных решений.",
-            "Новые возможности для самореализации появятся через искусство и красоту.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша дипломатичность поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через культурные мероприятия.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша красота и обаяние помогут в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для инвестиций в искусство, красоту и эстетику.",
-            "Ваша дипломатичность поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через искусство и красоту.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Ваша эстетический вкус поможет в выборе красивых и функциональных инвестиций.",
-            "Новые возможности для заработка появятся через культурные мероприятия.",
-            "Время для создания системы управления финансами с эстетическим подходом.",
-            "Ваша дипломатичность поможет в поиске новых возможностей для заработка.",
-            "Новые возможности для инвестиций появятся через искусство и красоту.",
-            "Время для изучения новых способов заработка в творческой сфере.",
-            "Ваша способность к компромиссу поможет в создании системы финансовой поддержки.",
-            "Время для развития навыков управления финансами.",
-            "Новые возможности для заработка появятся через искусство и красоту.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша дипломатичность поможет в достижении любых финансовых целей.",
-            "Новые возможности для заработка появятся через культурные мероприятия.",
-            "Время для создания системы пассивного дохода и инвестиций.",
-            "Ваша красота и обаяние помогут в поиске новых возможностей для заработка.",
-            "Новые возможности для инвестиций появятся через искусство и красоту.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для занятий эстетическими видами спорта или активностями.",
-            "Ваша дипломатичность поможет в достижении любых спортивных целей.",
-            "Новые возможности для укрепления здоровья появятся через искусство и красоту.",
-            "Время для создания системы здорового образа жизни с эстетическим подходом.",
-            "Ваша способность к компромиссу поможет в создании позитивной атмосферы для здоровья.",
-            "Новые возможности для занятий спортом появятся через культурные мероприятия.",
-            "Время для изучения новых методов поддержания здоровья и долголетия.",
-            "Ваша эстетический вкус поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через искусство и красоту.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша дипломатичность поможет в поддержании регулярных здоровых привычек.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Новые возможности для занятий спортом появятся через культурные мероприятия.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша способность к компромиссу поможет в создании комфортной среды для здоровья.",
-            "Новые возможности для укрепления здоровья появятся через искусство и красоту.",
-            "Время для участия в спортивных мероприятиях или соревнованиях.",
-            "Ваша красота и обаяние помогут в поиске партнеров для занятий спортом.",
-            "Новые возможности для оздоровления появятся через искусство и красоту.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День гармонии и красоты. Создавайте эстетику во всем.",
-            "Ваша дипломатичность поможет в решении любых жизненных вопросов.",
-            "Время для проявления эстетического вкуса в повседневной жизни.",
-            "Новые возможности для роста появятся через искусство и красоту.",
-            "Время для участия в культурных мероприятиях и событиях.",
-            "Ваша способность к компромиссу поможет в достижении любых поставленных целей.",
-            "Время для проявления красоты и гармонии к окружающим.",
-            "Новые возможности для самореализации появятся через искусство и красоту.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Ваша дипломатичность поможет в установлении важных связей.",
-            "Новые возможности для личностного роста появятся через искусство и красоту.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша способность к компромиссу поможет в создании позитивной атмосферы.",
-            "Новые возможности для самореализации появятся через искусство и красоту.",
-            "Время для проявления эстетического вкуса и гармонии в жизни.",
-            "Ваша дипломатичность поможет в преодолении любых жизненных препятствий.",
-            "Новые возможности для роста появятся через культурные мероприятия.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша красота и обаяние помогут в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств и достижения новых высот."
-        ],
-        "advice": [
-            "Развивайте решительность, но не забывайте про дипломатичность.",
-            "Ваша способность к компромиссу - это дар, но используйте её мудро.",
-            "Не бойтесь принимать решения, но не забывайте про баланс.",
-            "Баланс между дипломатичностью и решительностью важен для гармонии.",
-            "Ваша красота - это сила, но не забывайте про глубину.",
-            "Время для развития навыков принятия решений и лидерства.",
-            "Ваша способность к компромиссу - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между жертвенностью и самосохранением важен для успеха.",
-            "Ваша дипломатичность - это дар, но не забывайте про прямолинейность.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша красота - это сила, но используйте её с умом.",
-            "Время для развития навыков самозащиты и установления границ.",
-            "Ваша способность к компромиссу - это дар, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша дипломатичность - это достоинство, но иногда нужна прямолинейность.",
-            "Время для развития навыков принятия решений и лидерства.",
-            "Ваша красота - это сила, но не забывайте про качество общения.",
-            "Баланс между количеством и качеством связей важен для гармонии.",
-            "Ваша способность к компромиссу - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для искусства и красоты появятся в неожиданных местах.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша дипломатичность поможет в установлении важных связей.",
-            "Новые знакомства через искусство откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через искусство и красоту.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша способность к компромиссу поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через искусство и красоту.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через искусство и красоту.",
-            "Время для развития навыков дипломатии и переговоров.",
-            "Ваша красота и обаяние помогут в создании новых возможностей.",
-            "Новые возможности для заработка появятся через культурные мероприятия.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша дипломатичность поможет в поиске новых возможностей.",
-            "Новые возможности для самореализации появятся через искусство и красоту.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша способность к компромиссу поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через искусство и красоту."
-        ]
-    }
-}
-
-# 8. СКОРПИОН - Интенсивность, трансформация, глубина
-SCORPIO_PREDICTIONS = {
-    "sign": "Скорпион",
-    "predictions": {
-        "love": [
-            "Время для глубоких и страстных отношений. Ваша интенсивность привлекает достойных партнеров.",
-            "Новые возможности для любви появятся через трансформацию и личностный рост.",
-            "Время для проявления искренности и глубины в отношениях.",
-            "Ваша загадочность и магнетизм будут высоко оценены партнером.",
-            "Время для исцеления старых ран и прощения в любви.",
-            "Новые знакомства через духовные практики или глубокие разговоры принесут радость.",
-            "Время для проявления страсти и преданности в отношениях.",
-            "Ваша способность к трансформации поможет в укреплении связей.",
-            "Время для планирования глубоких и значимых отношений.",
-            "Ваша интуиция и проницательность будут высоко оценены партнером.",
-            "Новые возможности для романтики появятся через саморазвитие.",
-            "Время для проявления заботы и внимания к эмоциональным потребностям партнера.",
-            "Ваша способность к исцелению поможет в решении любых проблем в любви.",
-            "Время для создания атмосферы доверия и близости в отношениях.",
-            "Ваша глубина и мудрость помогут в укреплении существующих связей.",
-            "Новые возможности для любви появятся через духовные практики.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша преданность и верность создадут прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их глубокое развитие.",
-            "Ваша способность к трансформации и исцелению будет высоко оценена партнером."
-        ],
-        "career": [
-            "Время для работы в сфере психологии, исцеления или трансформации.",
-            "Ваша интуиция поможет в принятии правильных профессиональных решений.",
-            "Новые возможности для карьерного роста появятся через глубокую работу над собой.",
-            "Время для развития навыков психологии и понимания людей.",
-            "Ваша способность к трансформации поможет в работе с людьми.",
-            "Новые возможности для заработка появятся через духовные практики или консультирование.",
-            "Время для создания атмосферы доверия и поддержки в работе.",
-            "Ваша глубина поможет в установлении глубоких профессиональных связей.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша интуиция поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша способность к исцелению поможет в понимании клиентов или коллег.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша глубина поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через духовные практики.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша преданность поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для создания системы глубокого финансового планирования.",
-            "Ваша интуиция поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через духовные практики или консультирование.",
-            "Время для инвестиций в семью и близких людей.",
-            "Ваша способность к трансформации поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через глубокую работу над собой.",
-            "Время для создания финансовой подушки безопасности для семьи.",
-            "Ваша интуиция подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша глубина поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша интуиция поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через духовные практики.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша способность к трансформации поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша преданность поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для создания системы глубокого оздоровления и исцеления.",
-            "Ваша интуиция поможет в понимании потребностей вашего тела.",
-            "Новые возможности для укрепления здоровья появятся через духовные практики.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша способность к трансформации поможет в создании системы здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через семью.",
-            "Время для создания системы мониторинга здоровья и самочувствия.",
-            "Ваша интуиция подскажет правильный момент для обращения к врачу.",
-            "Новые возможности для оздоровления появятся через духовные практики.",
-            "Время для изучения новых способов поддержания здоровья и долголетия.",
-            "Ваша глубина поможет в создании комфортной среды для здоровья.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша интуиция поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша способность к трансформации поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша преданность поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День глубоких размышлений и трансформации. Цените моменты тишины.",
-            "Ваша интуиция поможет в принятии важных жизненных решений.",
-            "Время для создания атмосферы доверия и близости в отношениях.",
-            "Новые возможности для роста появятся через духовные практики.",
-            "Время для проявления заботы и внимания к эмоциональным потребностям близких.",
-            "Ваша способность к трансформации поможет в понимании потребностей окружающих.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша глубина поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков психологии и понимания людей.",
-            "Ваша интуиция поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через духовные практики.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша способность к исцелению поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша преданность поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте открытость, но не забывайте про глубину.",
-            "Ваша способность к трансформации - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про контроль.",
-            "Баланс между интенсивностью и спокойствием важен для гармонии.",
-            "Ваша интуиция - это сила, но не забывайте про логику.",
-            "Время для развития навыков доверия и открытости.",
-            "Ваша глубина - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между жертвенностью и самосохранением важен для успеха.",
-            "Ваша преданность - это дар, но не забывайте про гибкость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша способность к исцелению - это сила, но используйте её с умом.",
-            "Время для развития навыков прощения и принятия.",
-            "Ваша интуиция - это дар, но не забывайте про логическое мышление.",
-            "Баланс между контролем и доверием важен для роста.",
-            "Ваша интенсивность - это достоинство, но иногда нужна сдержанность.",
-            "Время для развития навыков расслабления и отдыха.",
-            "Ваша глубина - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша преданность - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для духовного роста появятся в неожиданных местах.",
-            "Время для участия в программах личностного развития и трансформации.",
-            "Ваша интуиция поможет в выборе правильных возможностей.",
-            "Новые знакомства через духовные практики откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через консультирование или исцеление.",
-            "Время для участия в семинарах по психологии и духовному развитию.",
-            "Ваша глубина поможет в установлении важных связей.",
-            "Новые возможности для самореализации появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через духовные практики.",
-            "Время для развития навыков психологии и консультирования.",
-            "Ваша интуиция поможет в выборе подходящих возможностей.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для участия в программах поддержки и помощи.",
-            "Ваша способность к трансформации поможет в создании новых возможностей.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша преданность поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через духовные практики."
-        ]
-    }
-}
+Данные перенесены в core/sign_predictions/ и строятся лениво:
+VIRGO_PREDICTIONS ... PISCES_PREDICTIONS доступны как атрибуты модуля (PEP 562).
+"""
 
-# 9. СТРЕЛЕЦ - Авантюризм, философия, оптимизм
-SAGITTARIUS_PREDICTIONS = {
-    "sign": "Стрелец",
-    "predictions": {
-        "love": [
-            "Время для романтических приключений и новых впечатлений. Ваш оптимизм привлекает интересных людей.",
-            "Новые возможности для любви появятся через путешествия и изучение новых культур.",
-            "Время для проявления философского подхода к отношениям.",
-            "Ваша авантюрность и энтузиазм будут высоко оценены партнером.",
-            "Время для планирования совместных путешествий и приключений.",
-            "Новые знакомства через образование или культурные мероприятия принесут радость.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша философская мудрость поможет в укреплении отношений.",
-            "Время для планирования долгосрочных отношений с приключениями.",
-            "Ваша оптимизм и энтузиазм будут высоко оценены партнером.",
-            "Новые возможности для романтики появятся через путешествия.",
-            "Время для проявления философского подхода к любви.",
-            "Ваша авантюрность поможет в решении любых проблем в отношениях.",
-            "Время для создания атмосферы приключений и открытий в отношениях.",
-            "Ваша мудрость поможет в укреплении существующих связей.",
-            "Новые возможности для любви появятся через образование.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша философская глубина создаст прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша авантюрность и оптимизм будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы в сфере образования, путешествий или философии.",
-            "Ваша философская мудрость поможет в принятии правильных профессиональных решений.",
-            "Новые возможности для карьерного роста появятся через путешествия и образование.",
-            "Время для развития навыков преподавания и наставничества.",
-            "Ваша авантюрность поможет в работе с людьми.",
-            "Новые возможности для заработка появятся через путешествия или образование.",
-            "Время для создания атмосферы обучения и развития в работе.",
-            "Ваша философская глубина поможет в установлении важных профессиональных связей.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша мудрость поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша философская глубина поможет в понимании клиентов или коллег.",
-            "Новые возможности для самореализации появятся через образование.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша авантюрность поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через путешествия.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша философская мудрость поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для инвестиций в образование, путешествия или философские проекты.",
-            "Ваша философская мудрость поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через путешествия или образование.",
-            "Время для инвестиций в семью и близких людей.",
-            "Ваша авантюрность поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через образование.",
-            "Время для создания финансовой подушки безопасности для семьи.",
-            "Ваша философская мудрость подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша мудрость поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша философская глубина поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через путешествия.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша авантюрность поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша философская мудрость поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для занятий активными видами спорта или путешествий.",
-            "Ваша авантюрность поможет в достижении любых спортивных целей.",
-            "Новые возможности для укрепления здоровья появятся через путешествия.",
-            "Время для создания системы здорового образа жизни.",
-            "Ваша философская мудрость поможет в создании позитивной атмосферы для здоровья.",
-            "Новые возможности для занятий спортом появятся через друзей.",
-            "Время для изучения новых методов поддержания здоровья и долголетия.",
-            "Ваша авантюрность поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через путешествия.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша философская мудрость поможет в поддержании регулярных здоровых привычек.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша авантюрность поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша философская мудрость поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша мудрость поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День приключений и философских размышлений. Изучайте новые горизонты.",
-            "Ваша философская мудрость поможет в решении любых жизненных вопросов.",
-            "Время для путешествий и изучения новых культур.",
-            "Новые возможности для роста появятся через образование и путешествия.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша авантюрность поможет в понимании потребностей окружающих.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через образование.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша философская мудрость поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков преподавания и наставничества.",
-            "Ваша авантюрность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через путешествия.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша философская мудрость поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша мудрость поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте терпение, но не забывайте про авантюризм.",
-            "Ваша философская мудрость - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
-            "Баланс между авантюризмом и стабильностью важен для гармонии.",
-            "Ваша мудрость - это сила, но не забывайте про практичность.",
-            "Время для развития навыков планирования и организации.",
-            "Ваша авантюрность - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между жертвенностью и самосохранением важен для успеха.",
-            "Ваша философская мудрость - это дар, но не забывайте про гибкость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша авантюрность - это сила, но используйте её с умом.",
-            "Время для развития навыков терпения и настойчивости.",
-            "Ваша философская мудрость - это дар, но не забывайте про практическое применение.",
-            "Баланс между мечтами и реальностью важен для роста.",
-            "Ваша авантюрность - это достоинство, но иногда нужна осторожность.",
-            "Время для развития навыков планирования и организации.",
-            "Ваша философская мудрость - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша мудрость - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для путешествий и приключений появятся в неожиданных местах.",
-            "Время для участия в образовательных программах и курсах.",
-            "Ваша философская мудрость поможет в установлении важных связей.",
-            "Новые знакомства через путешествия откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через путешествия или образование.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша авантюрность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через путешествия.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через образование.",
-            "Время для развития навыков преподавания и наставничества.",
-            "Ваша философская мудрость поможет в создании новых возможностей.",
-            "Новые возможности для заработка появятся через путешествия.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша авантюрность поможет в поиске новых возможностей.",
-            "Новые возможности для самореализации появятся через образование.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша философская мудрость поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через путешествия и образование."
-        ]
-    }
-}
+from .prediction_catalog import get_prediction_catalog
 
-# 10. КОЗЕРОГ - Амбиции, дисциплина, ответственность
-CAPRICORN_PREDICTIONS = {
-    "sign": "Козерог",
-    "predictions": {
-        "love": [
-            "Время для серьезных и долгосрочных отношений. Ваша ответственность привлекает надежных партнеров.",
-            "Новые возможности для любви появятся через работу или профессиональные связи.",
-            "Время для проявления дисциплины и терпения в отношениях.",
-            "Ваша амбициозность и целеустремленность будут высоко оценены партнером.",
-            "Время для планирования серьезных отношений с будущим.",
-            "Новые знакомства через работу или профессиональные мероприятия принесут радость.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша дисциплина поможет в укреплении отношений.",
-            "Время для планирования долгосрочных отношений с ответственностью.",
-            "Ваша надежность и преданность будут высоко оценены партнером.",
-            "Новые возможности для романтики появятся через работу.",
-            "Время для проявления серьезного подхода к любви.",
-            "Ваша дисциплина поможет в решении любых проблем в отношениях.",
-            "Время для создания атмосферы стабильности и надежности в отношениях.",
-            "Ваша ответственность поможет в укреплении существующих связей.",
-            "Новые возможности для любви появятся через профессиональные связи.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша дисциплина и ответственность создадут прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша амбициозность и надежность будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы в сфере управления, бизнеса или государственной службы.",
-            "Ваша дисциплина поможет в принятии правильных профессиональных решений.",
-            "Новые возможности для карьерного роста появятся через упорный труд и дисциплину.",
-            "Время для развития навыков лидерства и управления.",
-            "Ваша ответственность поможет в работе с людьми.",
-            "Новые возможности для заработка появятся через профессиональные связи.",
-            "Время для создания атмосферы дисциплины и порядка в работе.",
-            "Ваша амбициозность поможет в установлении важных профессиональных связей.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша дисциплина поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша ответственность поможет в понимании клиентов или коллег.",
-            "Новые возможности для самореализации появятся через упорный труд.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша дисциплина поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через профессиональные связи.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша амбициозность поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для создания системы строгого финансового планирования и контроля.",
-            "Ваша дисциплина поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через профессиональные связи.",
-            "Время для инвестиций в семью и близких людей.",
-            "Ваша ответственность поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через упорный труд.",
-            "Время для создания финансовой подушки безопасности для семьи.",
-            "Ваша дисциплина подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша ответственность поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша дисциплина поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через профессиональные связи.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша амбициозность поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша дисциплина поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для создания системы строгого здорового образа жизни.",
-            "Ваша дисциплина поможет в достижении любых спортивных целей.",
-            "Новые возможности для укрепления здоровья появятся через упорный труд.",
-            "Время для создания системы здорового образа жизни.",
-            "Ваша ответственность поможет в создании позитивной атмосферы для здоровья.",
-            "Новые возможности для занятий спортом появятся через семью.",
-            "Время для изучения новых методов поддержания здоровья и долголетия.",
-            "Ваша дисциплина поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через профессиональные связи.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша дисциплина поможет в поддержании регулярных здоровых привычек.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша ответственность поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша дисциплина поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша ответственность поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День дисциплины и ответственности. Планируйте будущее с мудростью.",
-            "Ваша дисциплина поможет в решении любых жизненных вопросов.",
-            "Время для создания системы порядка и организации в жизни.",
-            "Новые возможности для роста появятся через упорный труд.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша ответственность поможет в понимании потребностей окружающих.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через упорный труд.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша дисциплина поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков лидерства и управления.",
-            "Ваша ответственность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через профессиональные связи.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша дисциплина поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша амбициозность поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте гибкость, но не забывайте про дисциплину.",
-            "Ваша ответственность - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про контроль.",
-            "Баланс между дисциплиной и спонтанностью важен для гармонии.",
-            "Ваша амбициозность - это сила, но не забывайте про отдых.",
-            "Время для развития навыков расслабления и отдыха.",
-            "Ваша дисциплина - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между работой и отдыхом важен для успеха.",
-            "Ваша ответственность - это дар, но не забывайте про гибкость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша дисциплина - это сила, но используйте её с умом.",
-            "Время для развития навыков гибкости и адаптивности.",
-            "Ваша амбициозность - это дар, но не забывайте про практическое применение.",
-            "Баланс между мечтами и реальностью важен для роста.",
-            "Ваша ответственность - это достоинство, но иногда нужна спонтанность.",
-            "Время для развития навыков расслабления и отдыха.",
-            "Ваша дисциплина - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша амбициозность - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для профессионального роста появятся в неожиданных местах.",
-            "Время для участия в программах лидерства и управления.",
-            "Ваша дисциплина поможет в установлении важных связей.",
-            "Новые знакомства через работу откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через профессиональные связи.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша ответственность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через упорный труд.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через дисциплину.",
-            "Время для развития навыков лидерства и управления.",
-            "Ваша амбициозность поможет в создании новых возможностей.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для участия в программах поддержки и помощи.",
-            "Ваша дисциплина поможет в создании новых возможностей.",
-            "Новые возможности для самореализации появятся через упорный труд.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша ответственность поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через дисциплину и упорный труд."
-        ]
-    }
-}
+_LAZY_NAMES = (
+    "VIRGO_PREDICTIONS", "LIBRA_PREDICTIONS", "SCORPIO_PREDICTIONS",
+    "SAGITTARIUS_PREDICTIONS", "CAPRICORN_PREDICTIONS", "AQUARIUS_PREDICTIONS",
+    "PISCES_PREDICTIONS",
+)
 
-# 11. ВОДОЛЕЙ - Инновации, независимость, гуманизм
-AQUARIUS_PREDICTIONS = {
-    "sign": "Водолей",
-    "predictions": {
-        "love": [
-            "Время для необычных и инновационных отношений. Ваша независимость привлекает уникальных людей.",
-            "Новые возможности для любви появятся через дружбу или социальные связи.",
-            "Время для проявления гуманизма и заботы о человечестве в отношениях.",
-            "Ваша инновационность и оригинальность будут высоко оценены партнером.",
-            "Время для планирования отношений, основанных на дружбе и взаимопонимании.",
-            "Новые знакомства через друзей или социальные мероприятия принесут радость.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша независимость поможет в укреплении отношений.",
-            "Время для планирования долгосрочных отношений с дружбой.",
-            "Ваша оригинальность и гуманизм будут высоко оценены партнером.",
-            "Новые возможности для романтики появятся через дружбу.",
-            "Время для проявления необычного подхода к любви.",
-            "Ваша независимость поможет в решении любых проблем в отношениях.",
-            "Время для создания атмосферы дружбы и взаимопонимания в отношениях.",
-            "Ваша гуманизм поможет в укреплении существующих связей.",
-            "Новые возможности для любви появятся через социальные связи.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша оригинальность и независимость создадут прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша инновационность и гуманизм будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы в сфере технологий, инноваций или социальных проектов.",
-            "Ваша инновационность поможет в принятии правильных профессиональных решений.",
-            "Новые возможности для карьерного роста появятся через дружбу и социальные связи.",
-            "Время для развития навыков инноваций и творчества.",
-            "Ваша независимость поможет в работе с людьми.",
-            "Новые возможности для заработка появятся через социальные связи.",
-            "Время для создания атмосферы инноваций и творчества в работе.",
-            "Ваша оригинальность поможет в установлении важных профессиональных связей.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша инновационность поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша гуманизм поможет в понимании клиентов или коллег.",
-            "Новые возможности для самореализации появятся через социальные проекты.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша оригинальность поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через дружбу.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша инновационность поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для инвестиций в инновационные проекты и технологии.",
-            "Ваша инновационность поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через социальные связи.",
-            "Время для инвестиций в семью и близких людей.",
-            "Ваша независимость поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через дружбу.",
-            "Время для создания финансовой подушки безопасности для семьи.",
-            "Ваша оригинальность подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша инновационность поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша гуманизм поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через социальные проекты.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша оригинальность поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша инновационность поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для занятий необычными видами спорта или инновационными методами оздоровления.",
-            "Ваша инновационность поможет в достижении любых спортивных целей.",
-            "Новые возможности для укрепления здоровья появятся через дружбу.",
-            "Время для создания системы здорового образа жизни.",
-            "Ваша гуманизм поможет в создании позитивной атмосферы для здоровья.",
-            "Новые возможности для занятий спортом появятся через друзей.",
-            "Время для изучения новых методов поддержания здоровья и долголетия.",
-            "Ваша оригинальность поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через социальные проекты.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша инновационность поможет в поддержании регулярных здоровых привычек.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша независимость поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша оригинальность поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша гуманизм поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День инноваций и гуманизма. Создавайте новое для человечества.",
-            "Ваша инновационность поможет в решении любых жизненных вопросов.",
-            "Время для дружбы и социальных связей.",
-            "Новые возможности для роста появятся через дружбу и социальные проекты.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша гуманизм поможет в понимании потребностей окружающих.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через социальные проекты.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша оригинальность поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков инноваций и творчества.",
-            "Ваша независимость поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через дружбу.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша гуманизм поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша инновационность поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте эмоциональность, но не забывайте про независимость.",
-            "Ваша оригинальность - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
-            "Баланс между независимостью и близостью важен для гармонии.",
-            "Ваша инновационность - это сила, но не забывайте про традиции.",
-            "Время для развития навыков эмоциональной близости.",
-            "Ваша гуманизм - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между заботой о других и заботой о себе важен для успеха.",
-            "Ваша независимость - это дар, но не забывайте про близость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша оригинальность - это сила, но используйте её с умом.",
-            "Время для развития навыков эмоциональной близости.",
-            "Ваша инновационность - это дар, но не забывайте про практическое применение.",
-            "Баланс между мечтами и реальностью важен для роста.",
-            "Ваша гуманизм - это достоинство, но иногда нужна дистанция.",
-            "Время для развития навыков эмоциональной близости.",
-            "Ваша независимость - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша оригинальность - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для инноваций и творчества появятся в неожиданных местах.",
-            "Время для участия в социальных проектах и программах.",
-            "Ваша инновационность поможет в установлении важных связей.",
-            "Новые знакомства через друзей откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через социальные связи.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша оригинальность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через дружбу.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через инновации.",
-            "Время для развития навыков творчества и инноваций.",
-            "Ваша гуманизм поможет в создании новых возможностей.",
-            "Новые возможности для заработка появятся через социальные проекты.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша инновационность поможет в поиске новых возможностей.",
-            "Новые возможности для самореализации появятся через дружбу.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша оригинальность поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через инновации и дружбу."
-        ]
-    }
-}
 
-# 12. РЫБЫ - Интуиция, сострадание, духовность
-PISCES_PREDICTIONS = {
-    "sign": "Рыбы",
-    "predictions": {
-        "love": [
-            "Время для глубоких и духовных отношений. Ваша интуиция привлекает чувствительных людей.",
-            "Новые возможности для любви появятся через духовные практики или творчество.",
-            "Время для проявления сострадания и понимания в отношениях.",
-            "Ваша духовность и чувствительность будут высоко оценены партнером.",
-            "Время для планирования отношений, основанных на духовной близости.",
-            "Новые знакомства через творчество или духовные практики принесут радость.",
-            "Время для проявления заботы и внимания к эмоциональным потребностям партнера.",
-            "Ваша интуиция поможет в укреплении отношений.",
-            "Время для планирования долгосрочных отношений с духовной близостью.",
-            "Ваша сострадание и чувствительность будут высоко оценены партнером.",
-            "Новые возможности для романтики появятся через творчество.",
-            "Время для проявления духовного подхода к любви.",
-            "Ваша интуиция поможет в решении любых проблем в отношениях.",
-            "Время для создания атмосферы духовной близости и понимания в отношениях.",
-            "Ваша сострадание поможет в укреплении существующих связей.",
-            "Новые возможности для любви появятся через духовные практики.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша духовность и интуиция создадут прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их духовное развитие.",
-            "Ваша сострадание и чувствительность будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы в сфере искусства, духовности или помощи людям.",
-            "Ваша интуиция поможет в принятии правильных профессиональных решений.",
-            "Новые возможности для карьерного роста появятся через творчество или духовные практики.",
-            "Время для развития навыков творчества и духовности.",
-            "Ваша сострадание поможет в работе с людьми.",
-            "Новые возможности для заработка появятся через творчество или духовные практики.",
-            "Время для создания атмосферы творчества и духовности в работе.",
-            "Ваша чувствительность поможет в установлении важных профессиональных связей.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша интуиция поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша сострадание поможет в понимании клиентов или коллег.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша духовность поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через духовные практики.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша интуиция поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для инвестиций в творческие проекты или духовные практики.",
-            "Ваша интуиция поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через творчество или духовные практики.",
-            "Время для инвестиций в семью и близких людей.",
-            "Ваша сострадание поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через творчество.",
-            "Время для создания финансовой подушки безопасности для семьи.",
-            "Ваша интуиция подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша духовность поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша интуиция поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через творчество.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша сострадание поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша духовность поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для занятий творческими видами спорта или духовными практиками.",
-            "Ваша интуиция поможет в достижении любых спортивных целей.",
-            "Новые возможности для укрепления здоровья появятся через творчество.",
-            "Время для создания системы здорового образа жизни.",
-            "Ваша духовность поможет в создании позитивной атмосферы для здоровья.",
-            "Новые возможности для занятий спортом появятся через друзей.",
-            "Время для изучения новых методов поддержания здоровья и долголетия.",
-            "Ваша чувствительность поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через духовные практики.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша интуиция поможет в поддержании регулярных здоровых привычек.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша духовность поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша сострадание поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша интуиция поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День духовности и творчества. Создавайте красоту для мира.",
-            "Ваша интуиция поможет в решении любых жизненных вопросов.",
-            "Время для творчества и духовных практик.",
-            "Новые возможности для роста появятся через творчество и духовность.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша сострадание поможет в понимании потребностей окружающих.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша духовность поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков творчества и духовности.",
-            "Ваша интуиция поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через духовные практики.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша сострадание поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша духовность поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте практичность, но не забывайте про духовность.",
-            "Ваша интуиция - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
-            "Баланс между духовностью и практичностью важен для гармонии.",
-            "Ваша сострадание - это сила, но не забывайте про собственные потребности.",
-            "Время для развития навыков практичности и организации.",
-            "Ваша чувствительность - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между жертвенностью и самосохранением важен для успеха.",
-            "Ваша духовность - это дар, но не забывайте про практичность.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша интуиция - это сила, но используйте её с умом.",
-            "Время для развития навыков практичности и организации.",
-            "Ваша сострадание - это дар, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для роста.",
-            "Ваша чувствительность - это достоинство, но иногда нужна дистанция.",
-            "Время для развития навыков практичности и организации.",
-            "Ваша духовность - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша интуиция - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для творчества и духовности появятся в неожиданных местах.",
-            "Время для участия в творческих проектах и духовных практиках.",
-            "Ваша интуиция поможет в установлении важных связей.",
-            "Новые знакомства через творчество откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через творчество или духовные практики.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша сострадание поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через творчество.",
-            "Время для развития навыков творчества и духовности.",
-            "Ваша духовность поможет в создании новых возможностей.",
-            "Новые возможности для заработка появятся через творческие проекты.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша интуиция поможет в поиске новых возможностей.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша сострадание поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через творчество и духовность."
-        ]
-    }
-}
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        return get_prediction_catalog().get_by_attribute(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZODI - Планировщик ежедневных задач
+
+Поток вычисляет время следующего запуска и спит на threading.Event до
+этого момента, а не опрашивает расписание каждую минуту. Остановка и
+смена времени будят поток сразу. Каждый экземпляр независим (нет общего
+глобального реестра задач).
+"""
+
+import threading
+from datetime import datetime, time as dt_time, timedelta
+from typing import Any, Callable, Optional
+
+# Максимальный непрерывный сон. Event.wait отсчитывает монотонные часы,
+# которые на Linux/Android не идут во время сна устройства и не замечают
+# перевода часов; без ограничения запуск мог бы опоздать на часы. Раз в
+# час поток просыпается, сверяет время и засыпает снова (24 проверки в
+# сутки - одна операция сравнения дат).
+MAX_SLEEP_SECONDS = 3600.0
+
+
+def parse_time(value: str) -> dt_time:
+    """Разобрать время вида 'HH:MM' (или 'HH:MM:SS')."""
+    parts = [int(p) for p in value.split(':')]
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"Неверный формат времени: {value}")
+    return dt_time(*parts)
+
+
+def next_fire_time(at: dt_time, now: datetime) -> datetime:
+    """Ближайший момент at строго после now."""
+    candidate = datetime.combine(now.date(), at)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+class DailyScheduler:
+    """Вызывает callback(*args) каждый день в заданное время."""
+
+    def __init__(self, at: str, callback: Callable[..., Any], *args: Any,
+                 now_func: Callable[[], datetime] = datetime.now) -> None:
+        self.at = parse_time(at)
+        self.callback = callback
+        self.args = args
+        self._now = now_func
+        self._lock = threading.Lock()
+        # У каждого запуска потока своё событие: остановленный поток не
+        # мешает новому после cancel() + start()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self.next_run: Optional[datetime] = None
+
+    # ---------------------------- public API ----------------------------
+    def start(self) -> None:
+        """Запустить фоновый поток (повторный вызов для работающего ничего не делает).
+
+        После cancel() запускается новый поток, даже если прежний ещё не
+        успел завершиться - он выйдет сам, не вызывая callback.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and not self._stopped:
+                return
+            self._stopped = False
+            self._wake = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._wake,),
+                                            name='zodi-daily-scheduler', daemon=True)
+            self._thread.start()
+
+    def cancel(self, wait: bool = False) -> None:
+        """Остановить планировщик немедленно."""
+        with self._lock:
+            self._stopped = True
+            self._wake.set()
+            thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def reschedule(self, at: str) -> None:
+        """Сменить время запуска; спящий поток пересчитает ожидание сразу."""
+        new_time = parse_time(at)
+        with self._lock:
+            self.at = new_time
+            self._wake.set()
+
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stopped
+
+    # --------------------------- core logic ----------------------------
+    def _is_current(self, wake: threading.Event) -> bool:
+        # Вызывается под self._lock
+        return not self._stopped and wake is self._wake
+
+    def _run(self, wake: threading.Event) -> None:
+        with self._lock:
+            scheduled_at = self.at
+        target = next_fire_time(scheduled_at, self._now())
+        while True:
+            with self._lock:
+                if not self._is_current(wake):
+                    return
+                if self.at != scheduled_at:
+                    # Время сменили - считаем заново от текущего момента
+                    scheduled_at = self.at
+                    target = next_fire_time(scheduled_at, self._now())
+                wake.clear()
+                self.next_run = target
+
+            remaining = (target - self._now()).total_seconds()
+            if remaining > 0:
+                wake.wait(min(remaining, MAX_SLEEP_SECONDS))
+                continue
+
+            with self._lock:
+                if not self._is_current(wake):
+                    return
+            try:
+                self.callback(*self.args)
+            except Exception as e:
+                print(f"Ошибка задачи планировщика: {e}")
+            target = next_fire_time(scheduled_at, max(self._now(), target))
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Персонализированные базы предсказаний - по одному модулю на знак.
+
+Модули импортируются лениво через core.prediction_catalog, чтобы при
+запуске строились только данные нужного знака.
+"""
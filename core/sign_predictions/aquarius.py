@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: ВОДОЛЕЙ - Инновации, независимость, гуманизм
+"""
+
+PREDICTIONS = {
+    "sign": "Водолей",
+    "predictions": {
+        "love": [
+            "Время для необычных и инновационных отношений. Ваша независимость привлекает уникальных людей.",
+            "Новые возможности для любви появятся через дружбу или социальные связи.",
+            "Время для проявления гуманизма и заботы о человечестве в отношениях.",
+            "Ваша инновационность и оригинальность будут высоко оценены партнером.",
+            "Время для планирования отношений, основанных на дружбе и взаимопонимании.",
+            "Новые знакомства через друзей или социальные мероприятия принесут радость.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша независимость поможет в укреплении отношений.",
+            "Время для планирования долгосрочных отношений с дружбой.",
+            "Ваша оригинальность и гуманизм будут высоко оценены партнером.",
+            "Новые возможности для романтики появятся через дружбу.",
+            "Время для проявления необычного подхода к любви.",
+            "Ваша независимость поможет в решении любых проблем в отношениях.",
+            "Время для создания атмосферы дружбы и взаимопонимания в отношениях.",
+            "Ваша гуманизм поможет в укреплении существующих связей.",
+            "Новые возможности для любви появятся через социальные связи.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша оригинальность и независимость создадут прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша инновационность и гуманизм будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы в сфере технологий, инноваций или социальных проектов.",
+            "Ваша инновационность поможет в принятии правильных профессиональных решений.",
+            "Новые возможности для карьерного роста появятся через дружбу и социальные связи.",
+            "Время для развития навыков инноваций и творчества.",
+            "Ваша независимость поможет в работе с людьми.",
+            "Новые возможности для заработка появятся через социальные связи.",
+            "Время для создания атмосферы инноваций и творчества в работе.",
+            "Ваша оригинальность поможет в установлении важных профессиональных связей.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша инновационность поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша гуманизм поможет в понимании клиентов или коллег.",
+            "Новые возможности для самореализации появятся через социальные проекты.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша оригинальность поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через дружбу.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша инновационность поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для инвестиций в инновационные проекты и технологии.",
+            "Ваша инновационность поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через социальные связи.",
+            "Время для инвестиций в семью и близких людей.",
+            "Ваша независимость поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через дружбу.",
+            "Время для создания финансовой подушки безопасности для семьи.",
+            "Ваша оригинальность подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша инновационность поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша гуманизм поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через социальные проекты.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша оригинальность поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша инновационность поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для занятий необычными видами спорта или инновационными методами оздоровления.",
+            "Ваша инновационность поможет в достижении любых спортивных целей.",
+            "Новые возможности для укрепления здоровья появятся через дружбу.",
+            "Время для создания системы здорового образа жизни.",
+            "Ваша гуманизм поможет в создании позитивной атмосферы для здоровья.",
+            "Новые возможности для занятий спортом появятся через друзей.",
+            "Время для изучения новых методов поддержания здоровья и долголетия.",
+            "Ваша оригинальность поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через социальные проекты.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша инновационность поможет в поддержании регулярных здоровых привычек.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша независимость поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша оригинальность поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша гуманизм поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День инноваций и гуманизма. Создавайте новое для человечества.",
+            "Ваша инновационность поможет в решении любых жизненных вопросов.",
+            "Время для дружбы и социальных связей.",
+            "Новые возможности для роста появятся через дружбу и социальные проекты.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша гуманизм поможет в понимании потребностей окружающих.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через социальные проекты.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша оригинальность поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков инноваций и творчества.",
+            "Ваша независимость поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через дружбу.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша гуманизм поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша инновационность поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте эмоциональность, но не забывайте про независимость.",
+            "Ваша оригинальность - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
+            "Баланс между независимостью и близостью важен для гармонии.",
+            "Ваша инновационность - это сила, но не забывайте про традиции.",
+            "Время для развития навыков эмоциональной близости.",
+            "Ваша гуманизм - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между заботой о других и заботой о себе важен для успеха.",
+            "Ваша независимость - это дар, но не забывайте про близость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша оригинальность - это сила, но используйте её с умом.",
+            "Время для развития навыков эмоциональной близости.",
+            "Ваша инновационность - это дар, но не забывайте про практическое применение.",
+            "Баланс между мечтами и реальностью важен для роста.",
+            "Ваша гуманизм - это достоинство, но иногда нужна дистанция.",
+            "Время для развития навыков эмоциональной близости.",
+            "Ваша независимость - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша оригинальность - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для инноваций и творчества появятся в неожиданных местах.",
+            "Время для участия в социальных проектах и программах.",
+            "Ваша инновационность поможет в установлении важных связей.",
+            "Новые знакомства через друзей откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через социальные связи.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша оригинальность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через дружбу.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через инновации.",
+            "Время для развития навыков творчества и инноваций.",
+            "Ваша гуманизм поможет в создании новых возможностей.",
+            "Новые возможности для заработка появятся через социальные проекты.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша инновационность поможет в поиске новых возможностей.",
+            "Новые возможности для самореализации появятся через дружбу.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша оригинальность поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через инновации и дружбу."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: ОВЕН - Лидерство, энергия, смелость
+"""
+
+PREDICTIONS = {
+    "sign": "Овен",
+    "predictions": {
+        "love": [
+            "Ваша страстная натура привлекает внимание. Не бойтесь проявлять инициативу в любви!",
+            "Огненная энергия разгорается в вашем сердце. Время для смелых романтических жестов.",
+            "Новые знакомства через активные хобби принесут интересные возможности.",
+            "Ваша харизма и уверенность делают вас неотразимыми. Используйте это время!",
+            "Спонтанные романтические поступки принесут неожиданные результаты.",
+            "Лидерские качества в отношениях будут высоко оценены партнером.",
+            "Время для решительных шагов в любви. Ваша прямолинейность - ваш козырь.",
+            "Спортивные мероприятия или активный отдых могут привести к серьезным отношениям.",
+            "Ваша энергия и энтузиазм создают магнетическое притяжение.",
+            "Не бойтесь быть первым в признании чувств. Ваша смелость окупится.",
+            "Огненная страсть разгорается в вашем сердце. Время для пылких признаний.",
+            "Новые знакомства через друзей или коллег принесут радость в личную жизнь.",
+            "Ваша инициативность в отношениях будет высоко оценена.",
+            "Время для романтических приключений и новых впечатлений.",
+            "Ваша уверенность в себе привлекает достойных партнеров.",
+            "Смелые романтические жесты принесут успех в любви.",
+            "Ваша энергия и оптимизм создают благоприятную атмосферу для отношений.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша честность и открытость укрепляют существующие связи.",
+            "Новые возможности для любви появятся через активную деятельность."
+        ],
+        "career": [
+            "Лидерские качества помогут в продвижении по карьерной лестнице. Не бойтесь брать на себя ответственность.",
+            "Новые проекты требуют вашего внимания. Ваша инициативность будет высоко оценена начальством.",
+            "Время для смелых решений в карьере. Ваша решительность принесет отличные результаты.",
+            "Конкуренция в работе усилится, но ваша энергия поможет выйти победителем.",
+            "Возможности для карьерного роста появятся неожиданно. Будьте готовы к быстрым решениям.",
+            "Ваша предприимчивость откроет новые горизонты в карьере. Время для амбициозных проектов.",
+            "Лидерские качества проявятся в полной мере. Не бойтесь брать на себя ответственность за команду.",
+            "Смелые инновационные идеи принесут признание. Ваша креативность в цене.",
+            "Конкуренция вдохновляет вас на новые достижения. Используйте это как мотивацию.",
+            "Время для карьерных прорывов. Ваша энергия и решительность - ключ к успеху.",
+            "Новые возможности для лидерства появятся в неожиданных местах.",
+            "Ваша смелость в принятии решений поможет в решении сложных задач.",
+            "Время для участия в амбициозных проектах и инициативах.",
+            "Ваша энергия и энтузиазм вдохновят коллег на новые достижения.",
+            "Новые возможности для карьерного роста появятся через активную деятельность.",
+            "Ваша инициативность поможет в создании новых направлений работы.",
+            "Время для проявления лидерских качеств в командной работе.",
+            "Ваша решительность поможет в преодолении любых профессиональных препятствий.",
+            "Новые возможности для самореализации появятся через творческий подход.",
+            "Ваша энергия и оптимизм помогут в достижении любых карьерных целей."
+        ],
+        "finance": [
+            "Активные инвестиции могут принести прибыль. Не бойтесь рисковать разумно.",
+            "Ваша предприимчивость поможет найти новые источники дохода.",
+            "Время для смелых финансовых решений. Ваша интуиция подскажет правильный путь.",
+            "Возможны неожиданные поступления денег. Будьте готовы к приятным сюрпризам.",
+            "Ваша энергия поможет в решении финансовых вопросов. Не откладывайте важные дела.",
+            "Спортивные инвестиции или активные виды заработка принесут хорошие результаты.",
+            "Ваша инициативность поможет в поиске дополнительных источников дохода.",
+            "Время для рискованных, но перспективных инвестиций. Ваша смелость окупится.",
+            "Новые финансовые возможности появятся через активную деятельность.",
+            "Ваша энергия и решительность помогут в решении денежных вопросов.",
+            "Время для инвестиций в собственное развитие и новые навыки.",
+            "Ваша смелость в финансовых решениях принесет неожиданные результаты.",
+            "Новые возможности для заработка появятся через лидерские качества.",
+            "Ваша инициативность поможет в создании дополнительных источников дохода.",
+            "Время для активного управления финансами и планирования бюджета.",
+            "Ваша энергия поможет в поиске новых способов заработка.",
+            "Новые финансовые возможности появятся через творческий подход.",
+            "Ваша решительность поможет в достижении финансовых целей.",
+            "Время для инвестиций в перспективные проекты и начинания.",
+            "Ваша оптимизм и энергия помогут в решении любых финансовых вопросов."
+        ],
+        "health": [
+            "Энергия на высоком уровне. Займитесь спортом и активными видами деятельности.",
+            "Время для интенсивных тренировок. Ваша выносливость поможет в достижении спортивных целей.",
+            "Активный образ жизни принесет отличные результаты. Не бойтесь физических нагрузок.",
+            "Спортивные соревнования или состязания могут принести успех и признание.",
+            "Ваша энергия поможет в преодолении любых физических препятствий.",
+            "Время для экстремальных видов спорта или активного отдыха. Ваша смелость - ваш козырь.",
+            "Регулярные физические упражнения укрепят ваше здоровье и выносливость.",
+            "Ваша активность и энергия помогут в поддержании отличной физической формы.",
+            "Время для участия в спортивных мероприятиях или соревнованиях.",
+            "Ваша решительность поможет в достижении любых спортивных целей.",
+            "Новые возможности для занятий спортом появятся в неожиданных местах.",
+            "Ваша энергия поможет в преодолении любых физических вызовов.",
+            "Время для создания системы регулярных тренировок и физической активности.",
+            "Ваша смелость поможет в освоении новых видов спорта и активностей.",
+            "Новые возможности для укрепления здоровья появятся через активную деятельность.",
+            "Ваша инициативность поможет в создании здорового образа жизни.",
+            "Время для инвестиций в собственное здоровье и физическое развитие.",
+            "Ваша решительность поможет в достижении любых спортивных целей.",
+            "Новые возможности для активного отдыха появятся через друзей и знакомых.",
+            "Ваша энергия и оптимизм помогут в поддержании отличного самочувствия."
+        ],
+        "general": [
+            "День активности и достижений. Не торопитесь, но будьте решительны.",
+            "Ваша энергия заразительна. Вдохновляйте окружающих на великие дела.",
+            "Время для новых начинаний. Ваша смелость откроет множество возможностей.",
+            "Лидерские качества проявятся в полной мере. Не бойтесь брать на себя ответственность.",
+            "Оптимизм и энтузиазм помогут преодолеть любые препятствия.",
+            "Сегодняшний день принесет много интересных событий и встреч.",
+            "Будьте открыты новым идеям и возможностям, они уже близко.",
+            "Ваша интуиция подскажет правильный путь в сложных ситуациях.",
+            "Время для саморазвития и обучения. Расширяйте свои горизонты.",
+            "Возможно, вы найдете новый источник вдохновения.",
+            "Ваша смелость поможет в решении любых жизненных задач.",
+            "Время для проявления лидерских качеств в повседневной жизни.",
+            "Ваша энергия поможет в достижении любых поставленных целей.",
+            "Новые возможности для роста и развития появятся неожиданно.",
+            "Ваша инициативность поможет в создании позитивных изменений.",
+            "Время для активного участия в общественной жизни и проектах.",
+            "Ваша решительность поможет в преодолении любых препятствий.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Ваша оптимизм и энергия помогут в решении любых жизненных вопросов.",
+            "Время для проявления лучших качеств и достижения новых высот."
+        ],
+        "advice": [
+            "Слушайте интуицию, но не игнорируйте логику. Баланс решительности и осторожности.",
+            "Ваша прямолинейность - это сила, но иногда нужна дипломатия.",
+            "Не распыляйтесь на слишком много дел одновременно. Сосредоточьтесь на главном.",
+            "Информация - это сила, но важно уметь её фильтровать.",
+            "Баланс между общением и уединением важен для душевного равновесия.",
+            "Будьте открыты новым идеям, но не забывайте про свои принципы.",
+            "Ваша гибкость - это сила, но не забывайте про стабильность.",
+            "Не бойтесь просить о помощи, если это необходимо.",
+            "Время для саморефлексии и анализа своих поступков.",
+            "Доверяйте себе и своим решениям, но будьте готовы к изменениям.",
+            "Ваша смелость - это дар, но используйте её мудро.",
+            "Время для развития терпения и понимания к окружающим.",
+            "Ваша энергия - это сила, но не забывайте про отдых.",
+            "Баланс между действием и размышлением важен для успеха.",
+            "Ваша честность - это достоинство, но иногда нужна тактичность.",
+            "Время для развития эмпатии и понимания чувств других.",
+            "Ваша уверенность - это сила, но не забывайте про скромность.",
+            "Баланс между лидерством и сотрудничеством важен для гармонии.",
+            "Ваша решительность - это дар, но не забывайте про компромиссы.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для лидерства появятся в неожиданных местах.",
+            "Время для участия в амбициозных проектах и инициативах.",
+            "Ваша энергия поможет в реализации любых планов и целей.",
+            "Сетевые связи откроют множество интересных возможностей.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Новые знакомства могут привести к интересным проектам.",
+            "Возможности для укрепления финансового положения.",
+            "Ваша эмпатия поможет в установлении глубоких связей.",
+            "Время для создания уютной атмосферы дома.",
+            "Интуиция поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для участия в общественных инициативах и проектах.",
+            "Ваша смелость поможет в освоении новых областей деятельности.",
+            "Новые возможности для карьерного роста появятся через активность.",
+            "Время для инвестиций в собственное развитие и рост.",
+            "Ваша инициативность поможет в создании новых возможностей.",
+            "Новые возможности для путешествий и изучения мира появятся неожиданно.",
+            "Время для участия в спортивных мероприятиях и соревнованиях.",
+            "Ваша энергия поможет в достижении любых поставленных целей.",
+            "Новые возможности для личностного роста появятся через саморазвитие."
+        ]
+    }
+}
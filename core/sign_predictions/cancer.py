@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: РАК - Эмоциональность, интуиция, забота
+"""
+
+PREDICTIONS = {
+    "sign": "Рак",
+    "predictions": {
+        "love": [
+            "Время для проявления заботы и нежности к близким людям.",
+            "Ваша интуиция поможет в понимании потребностей партнера.",
+            "Семейные ценности и традиции укрепят ваши отношения.",
+            "Время для создания уютной и романтической атмосферы дома.",
+            "Ваша эмоциональность поможет в создании глубоких связей.",
+            "Новые возможности для любви появятся через заботу о других.",
+            "Время для проявления материнской/отцовской заботы в отношениях.",
+            "Ваша чувствительность поможет в понимании чувств партнера.",
+            "Время для планирования семейного будущего с любимым человеком.",
+            "Ваша преданность и верность будут высоко оценены партнером.",
+            "Новые знакомства через семью или близких друзей принесут радость.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша интуиция подскажет правильный момент для важных решений в любви.",
+            "Время для создания семейного уюта и гармонии.",
+            "Ваша эмоциональная глубина поможет в укреплении отношений.",
+            "Новые возможности для романтики появятся через домашние дела.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша заботливость создаст прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша преданность и верность будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы в сфере заботы о людях или образования.",
+            "Ваша интуиция поможет в принятии правильных профессиональных решений.",
+            "Новые возможности для карьерного роста появятся через заботу о других.",
+            "Время для развития навыков эмпатии и понимания людей.",
+            "Ваша чувствительность поможет в работе с людьми.",
+            "Новые возможности для заработка появятся через домашние дела.",
+            "Время для создания комфортной рабочей атмосферы.",
+            "Ваша заботливость поможет в установлении доверительных отношений с коллегами.",
+            "Новые возможности для карьерного роста появятся через семью.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша интуиция поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша эмоциональная глубина поможет в понимании клиентов или коллег.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша заботливость поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша преданность поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для создания системы сбережений и накоплений.",
+            "Ваша интуиция поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через заботу о других.",
+            "Время для инвестиций в семью и близких людей.",
+            "Ваша заботливость поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через домашние дела.",
+            "Время для создания финансовой подушки безопасности для семьи.",
+            "Ваша интуиция подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша заботливость поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша интуиция поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через заботу о других.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша заботливость поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша преданность поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для создания комфортной среды для отдыха и восстановления.",
+            "Ваша интуиция поможет в понимании потребностей вашего тела.",
+            "Новые возможности для укрепления здоровья появятся через домашние процедуры.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша заботливость поможет в создании системы здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через семью.",
+            "Время для создания системы мониторинга здоровья и самочувствия.",
+            "Ваша интуиция подскажет правильный момент для обращения к врачу.",
+            "Новые возможности для оздоровления появятся через заботу о других.",
+            "Время для изучения новых способов поддержания здоровья и долголетия.",
+            "Ваша заботливость поможет в создании комфортной среды для здоровья.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша интуиция поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша заботливость поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша преданность поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День заботы и внимания к близким. Цените семейные узы.",
+            "Ваша интуиция поможет в принятии важных жизненных решений.",
+            "Время для создания уюта и гармонии в доме.",
+            "Новые возможности для роста появятся через заботу о других.",
+            "Время для проявления материнской/отцовской заботы к окружающим.",
+            "Ваша чувствительность поможет в понимании потребностей близких.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша заботливость поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков эмпатии и понимания людей.",
+            "Ваша интуиция поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша заботливость поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша преданность поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте уверенность в себе, но не забывайте про заботу о других.",
+            "Ваша чувствительность - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
+            "Баланс между заботой о других и заботой о себе важен для гармонии.",
+            "Ваша интуиция - это сила, но не забывайте про анализ.",
+            "Время для развития уверенности в принятии решений.",
+            "Ваша заботливость - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между эмоциональностью и рациональностью важен для успеха.",
+            "Ваша преданность - это дар, но не забывайте про гибкость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша чувствительность - это сила, но используйте её с умом.",
+            "Время для развития уверенности в собственных силах.",
+            "Ваша интуиция - это дар, но не забывайте про логическое мышление.",
+            "Баланс между заботой о других и заботой о себе важен для роста.",
+            "Ваша эмоциональность - это достоинство, но иногда нужна сдержанность.",
+            "Время для развития навыков самозащиты и установления границ.",
+            "Ваша заботливость - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша преданность - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для заботы о других появятся в неожиданных местах.",
+            "Время для участия в волонтерских программах и благотворительности.",
+            "Ваша интуиция поможет в выборе правильных возможностей.",
+            "Новые знакомства через семью откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через заботу о других.",
+            "Время для участия в семейных мероприятиях и событиях.",
+            "Ваша заботливость поможет в установлении важных связей.",
+            "Новые возможности для самореализации появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через заботу о других.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша интуиция поможет в выборе подходящих возможностей.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для участия в программах поддержки и помощи.",
+            "Ваша заботливость поможет в создании новых возможностей.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша преданность поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через заботу о близких."
+        ]
+    }
+}
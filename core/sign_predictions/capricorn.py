@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: КОЗЕРОГ - Амбиции, дисциплина, ответственность
+"""
+
+PREDICTIONS = {
+    "sign": "Козерог",
+    "predictions": {
+        "love": [
+            "Время для серьезных и долгосрочных отношений. Ваша ответственность привлекает надежных партнеров.",
+            "Новые возможности для любви появятся через работу или профессиональные связи.",
+            "Время для проявления дисциплины и терпения в отношениях.",
+            "Ваша амбициозность и целеустремленность будут высоко оценены партнером.",
+            "Время для планирования серьезных отношений с будущим.",
+            "Новые знакомства через работу или профессиональные мероприятия принесут радость.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша дисциплина поможет в укреплении отношений.",
+            "Время для планирования долгосрочных отношений с ответственностью.",
+            "Ваша надежность и преданность будут высоко оценены партнером.",
+            "Новые возможности для романтики появятся через работу.",
+            "Время для проявления серьезного подхода к любви.",
+            "Ваша дисциплина поможет в решении любых проблем в отношениях.",
+            "Время для создания атмосферы стабильности и надежности в отношениях.",
+            "Ваша ответственность поможет в укреплении существующих связей.",
+            "Новые возможности для любви появятся через профессиональные связи.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша дисциплина и ответственность создадут прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша амбициозность и надежность будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы в сфере управления, бизнеса или государственной службы.",
+            "Ваша дисциплина поможет в принятии правильных профессиональных решений.",
+            "Новые возможности для карьерного роста появятся через упорный труд и дисциплину.",
+            "Время для развития навыков лидерства и управления.",
+            "Ваша ответственность поможет в работе с людьми.",
+            "Новые возможности для заработка появятся через профессиональные связи.",
+            "Время для создания атмосферы дисциплины и порядка в работе.",
+            "Ваша амбициозность поможет в установлении важных профессиональных связей.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша дисциплина поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша ответственность поможет в понимании клиентов или коллег.",
+            "Новые возможности для самореализации появятся через упорный труд.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша дисциплина поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через профессиональные связи.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша амбициозность поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для создания системы строгого финансового планирования и контроля.",
+            "Ваша дисциплина поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через профессиональные связи.",
+            "Время для инвестиций в семью и близких людей.",
+            "Ваша ответственность поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через упорный труд.",
+            "Время для создания финансовой подушки безопасности для семьи.",
+            "Ваша дисциплина подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша ответственность поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша дисциплина поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через профессиональные связи.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша амбициозность поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша дисциплина поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для создания системы строгого здорового образа жизни.",
+            "Ваша дисциплина поможет в достижении любых спортивных целей.",
+            "Новые возможности для укрепления здоровья появятся через упорный труд.",
+            "Время для создания системы здорового образа жизни.",
+            "Ваша ответственность поможет в создании позитивной атмосферы для здоровья.",
+            "Новые возможности для занятий спортом появятся через семью.",
+            "Время для изучения новых методов поддержания здоровья и долголетия.",
+            "Ваша дисциплина поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через профессиональные связи.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша дисциплина поможет в поддержании регулярных здоровых привычек.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша ответственность поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша дисциплина поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша ответственность поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День дисциплины и ответственности. Планируйте будущее с мудростью.",
+            "Ваша дисциплина поможет в решении любых жизненных вопросов.",
+            "Время для создания системы порядка и организации в жизни.",
+            "Новые возможности для роста появятся через упорный труд.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша ответственность поможет в понимании потребностей окружающих.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через упорный труд.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша дисциплина поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков лидерства и управления.",
+            "Ваша ответственность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через профессиональные связи.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша дисциплина поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша амбициозность поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте гибкость, но не забывайте про дисциплину.",
+            "Ваша ответственность - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про контроль.",
+            "Баланс между дисциплиной и спонтанностью важен для гармонии.",
+            "Ваша амбициозность - это сила, но не забывайте про отдых.",
+            "Время для развития навыков расслабления и отдыха.",
+            "Ваша дисциплина - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между работой и отдыхом важен для успеха.",
+            "Ваша ответственность - это дар, но не забывайте про гибкость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша дисциплина - это сила, но используйте её с умом.",
+            "Время для развития навыков гибкости и адаптивности.",
+            "Ваша амбициозность - это дар, но не забывайте про практическое применение.",
+            "Баланс между мечтами и реальностью важен для роста.",
+            "Ваша ответственность - это достоинство, но иногда нужна спонтанность.",
+            "Время для развития навыков расслабления и отдыха.",
+            "Ваша дисциплина - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша амбициозность - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для профессионального роста появятся в неожиданных местах.",
+            "Время для участия в программах лидерства и управления.",
+            "Ваша дисциплина поможет в установлении важных связей.",
+            "Новые знакомства через работу откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через профессиональные связи.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша ответственность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через упорный труд.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через дисциплину.",
+            "Время для развития навыков лидерства и управления.",
+            "Ваша амбициозность поможет в создании новых возможностей.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для участия в программах поддержки и помощи.",
+            "Ваша дисциплина поможет в создании новых возможностей.",
+            "Новые возможности для самореализации появятся через упорный труд.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша ответственность поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через дисциплину и упорный труд."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: БЛИЗНЕЦЫ - Коммуникация, любознательность, гибкость
+"""
+
+PREDICTIONS = {
+    "sign": "Близнецы",
+    "predictions": {
+        "love": [
+            "Общение принесет удовольствие. Не бойтесь проявлять инициативу в знакомствах.",
+            "Время для интересных разговоров и новых знакомств. Ваша коммуникабельность - ваш козырь.",
+            "Новые знакомства через общение и социальные сети принесут радость.",
+            "Ваша любознательность и интеллект привлекают интересных людей.",
+            "Время для романтических разговоров и обмена идеями с партнером.",
+            "Ваша гибкость поможет в решении любых проблем в отношениях.",
+            "Новые возможности для любви появятся через общение и знакомства.",
+            "Время для проявления внимания и заботы к близким людям.",
+            "Ваша коммуникабельность поможет в укреплении существующих отношений.",
+            "Время для планирования совместных мероприятий и развлечений.",
+            "Новые знакомства через учебу или работу принесут интересные возможности.",
+            "Время для проявления творчества и оригинальности в отношениях.",
+            "Ваша любознательность поможет в изучении потребностей партнера.",
+            "Время для создания атмосферы легкости и веселья в отношениях.",
+            "Ваша гибкость поможет в адаптации к потребностям партнера.",
+            "Новые возможности для романтики появятся через общение и знакомства.",
+            "Время для проявления юмора и позитивного настроения в отношениях.",
+            "Ваша коммуникабельность поможет в решении любых конфликтов.",
+            "Время для инвестиций в общение и развитие отношений.",
+            "Ваша любознательность и интеллект будут высоко оценены партнером."
+        ],
+        "career": [
+            "Обучение и коммуникация. Новые знания откроют двери.",
+            "Возможности для работы в сфере коммуникаций или образования.",
+            "Ваша любознательность поможет в изучении новых областей.",
+            "Сетевые связи откроют множество интересных возможностей.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Новые знакомства могут привести к интересным проектам.",
+            "Возможности для укрепления финансового положения.",
+            "Ваша эмпатия поможет в установлении глубоких связей.",
+            "Время для создания уютной атмосферы дома.",
+            "Интуиция поможет в выборе правильных возможностей.",
+            "Новые возможности для карьерного роста появятся через общение.",
+            "Время для развития навыков коммуникации и презентации.",
+            "Ваша любознательность поможет в изучении новых технологий.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша гибкость поможет в адаптации к новым условиям работы.",
+            "Новые возможности для творческой работы появятся через знакомства.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша коммуникабельность поможет в установлении деловых связей.",
+            "Новые возможности для самореализации появятся через общение.",
+            "Ваша любознательность и интеллект помогут в достижении любых карьерных целей."
+        ],
+        "finance": [
+            "Время для изучения новых способов заработка через общение.",
+            "Ваша коммуникабельность поможет в поиске новых источников дохода.",
+            "Новые возможности для заработка появятся через знакомства и связи.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша любознательность поможет в изучении финансовых инструментов.",
+            "Новые возможности для заработка через творчество или хобби.",
+            "Время для создания системы управления финансами.",
+            "Ваша гибкость поможет в адаптации к изменяющимся финансовым условиям.",
+            "Новые возможности для заработка появятся через общение и знакомства.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Ваша коммуникабельность поможет в поиске выгодных предложений.",
+            "Время для изучения новых способов инвестирования и сбережения.",
+            "Ваша любознательность поможет в изучении финансовых рынков.",
+            "Новые возможности для заработка через социальные сети или интернет.",
+            "Время для создания дополнительных источников дохода.",
+            "Ваша гибкость поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через творческие проекты.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша коммуникабельность поможет в поиске новых возможностей для заработка.",
+            "Время для создания системы пассивного дохода и инвестиций."
+        ],
+        "health": [
+            "Время для занятий, которые сочетают физическую активность с общением.",
+            "Ваша любознательность поможет в изучении новых методов оздоровления.",
+            "Новые возможности для занятий спортом появятся через знакомства.",
+            "Время для создания системы здорового образа жизни.",
+            "Ваша гибкость поможет в выборе подходящих физических нагрузок.",
+            "Новые возможности для укрепления здоровья появятся через общение.",
+            "Время для изучения новых методов релаксации и снятия стресса.",
+            "Ваша коммуникабельность поможет в поиске партнеров для занятий спортом.",
+            "Новые возможности для оздоровления появятся через групповые занятия.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша любознательность поможет в изучении новых способов поддержания здоровья.",
+            "Время для участия в групповых занятиях спортом или фитнесом.",
+            "Ваша гибкость поможет в адаптации к новым видам физической активности.",
+            "Новые возможности для занятий спортом появятся через друзей.",
+            "Время для создания системы регулярных физических упражнений.",
+            "Ваша коммуникабельность поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через общение.",
+            "Время для изучения новых способов поддержания психического здоровья.",
+            "Ваша любознательность поможет в освоении новых видов спорта.",
+            "Время для создания баланса между физической активностью и общением."
+        ],
+        "general": [
+            "День общения и новых знакомств. Будьте открыты новым возможностям.",
+            "Ваша коммуникабельность поможет в решении любых вопросов.",
+            "Время для изучения нового и расширения кругозора.",
+            "Новые знакомства принесут интересные возможности.",
+            "Время для участия в общественных мероприятиях и событиях.",
+            "Ваша любознательность поможет в изучении новых областей.",
+            "Время для проявления творчества и оригинальности.",
+            "Новые возможности для роста появятся через общение.",
+            "Время для инвестиций в образование и саморазвитие.",
+            "Ваша гибкость поможет в адаптации к новым условиям.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша коммуникабельность поможет в установлении важных связей.",
+            "Время для проявления юмора и позитивного настроения.",
+            "Новые возможности для путешествий появятся через знакомства.",
+            "Время для изучения новых языков или культур.",
+            "Ваша любознательность поможет в освоении новых навыков.",
+            "Время для создания атмосферы легкости и веселья.",
+            "Новые возможности для личностного роста появятся через общение.",
+            "Время для проявления лучших качеств и достижения новых высот."
+        ],
+        "advice": [
+            "Развивайте терпение, но не забывайте про активность в общении.",
+            "Ваша гибкость - это сила, но иногда нужна стабильность.",
+            "Не распыляйтесь на слишком много дел одновременно. Сосредоточьтесь на главном.",
+            "Информация - это сила, но важно уметь её фильтровать.",
+            "Баланс между общением и уединением важен для душевного равновесия.",
+            "Будьте открыты новым идеям, но не забывайте про свои принципы.",
+            "Ваша любознательность - это дар, но не забывайте про глубину.",
+            "Не бойтесь просить о помощи, если это необходимо.",
+            "Время для саморефлексии и анализа своих потребностей.",
+            "Доверяйте себе и своим решениям, но будьте готовы к изменениям.",
+            "Ваша коммуникабельность - это сила, но используйте её мудро.",
+            "Время для развития глубины и концентрации в общении.",
+            "Ваша гибкость - это дар, но не забывайте про постоянство.",
+            "Баланс между поверхностностью и глубиной важен для роста.",
+            "Ваша любознательность - это достоинство, но иногда нужна сосредоточенность.",
+            "Время для развития терпения и настойчивости в достижении целей.",
+            "Ваша коммуникабельность - это сила, но не забывайте про качество общения.",
+            "Баланс между количеством и качеством связей важен для гармонии.",
+            "Ваша гибкость - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в общении и отношениях."
+        ],
+        "opportunities": [
+            "Новые возможности для обучения и развития появятся через общение.",
+            "Время для участия в образовательных программах и курсах.",
+            "Ваша коммуникабельность поможет в установлении важных связей.",
+            "Новые знакомства откроют двери для интересных проектов.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для творческой работы появятся через знакомства.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша любознательность поможет в изучении новых областей.",
+            "Новые возможности для путешествий появятся через друзей.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через общение.",
+            "Время для развития навыков презентации и публичных выступлений.",
+            "Ваша гибкость поможет в адаптации к новым возможностям.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для участия в профессиональных сообществах и ассоциациях.",
+            "Ваша коммуникабельность поможет в поиске новых возможностей.",
+            "Новые возможности для заработка появятся через социальные сети.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша любознательность поможет в освоении новых областей деятельности.",
+            "Новые возможности для личностного роста появятся через общение и обучение."
+        ]
+    }
+}
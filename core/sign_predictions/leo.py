@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: ЛЕВ - Лидерство, творчество, щедрость
+"""
+
+PREDICTIONS = {
+    "sign": "Лев",
+    "predictions": {
+        "love": [
+            "Ваша харизма и обаяние привлекают внимание. Не бойтесь проявлять инициативу в любви!",
+            "Время для романтических жестов и проявления щедрости к партнеру.",
+            "Новые знакомства через творческие мероприятия принесут интересные возможности.",
+            "Ваша уверенность и оптимизм создают магнетическое притяжение.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша щедрость и великодушие будут высоко оценены партнером.",
+            "Новые возможности для любви появятся через творчество и искусство.",
+            "Время для планирования романтических сюрпризов и подарков.",
+            "Ваша страсть и энтузиазм помогут в укреплении отношений.",
+            "Время для проявления лидерских качеств в отношениях.",
+            "Новые знакомства через друзей или коллег принесут радость.",
+            "Время для проявления творчества и оригинальности в отношениях.",
+            "Ваша уверенность поможет в решении любых проблем в любви.",
+            "Время для создания особенной атмосферы для романтических встреч.",
+            "Ваша щедрость поможет в создании незабываемых моментов.",
+            "Новые возможности для романтики появятся через творческие проекты.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша харизма поможет в укреплении существующих отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша страсть и энтузиазм будут высоко оценены партнером."
+        ],
+        "career": [
+            "Лидерские качества помогут в продвижении по карьерной лестнице.",
+            "Время для проявления творчества и оригинальности в работе.",
+            "Новые возможности для карьерного роста появятся через творческие проекты.",
+            "Ваша харизма поможет в установлении важных деловых связей.",
+            "Время для участия в творческих конкурсах и соревнованиях.",
+            "Новые возможности для заработка появятся через искусство и творчество.",
+            "Время для создания собственного бизнеса или творческого проекта.",
+            "Ваша уверенность поможет в решении любых профессиональных задач.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша щедрость поможет в создании позитивной рабочей атмосферы.",
+            "Время для развития навыков лидерства и управления командой.",
+            "Новые возможности для карьерного роста появятся через творческие проекты.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша харизма поможет в установлении важных профессиональных связей.",
+            "Новые возможности для заработка появятся через творчество и искусство.",
+            "Время для создания портфолио или демонстрации ваших достижений.",
+            "Ваша уверенность поможет в преодолении любых профессиональных препятствий.",
+            "Новые возможности для самореализации появятся через творческие проекты.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для инвестиций в творческие проекты и начинания.",
+            "Ваша щедрость поможет в создании новых источников дохода.",
+            "Новые возможности для заработка появятся через творчество и искусство.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Ваша уверенность поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через творческие проекты.",
+            "Время для создания системы управления финансами.",
+            "Ваша харизма поможет в поиске новых возможностей для заработка.",
+            "Новые возможности для инвестиций появятся через творческие начинания.",
+            "Время для изучения новых способов заработка в творческой сфере.",
+            "Ваша щедрость поможет в создании системы финансовой поддержки.",
+            "Время для развития навыков управления финансами.",
+            "Новые возможности для заработка появятся через искусство и творчество.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша уверенность поможет в достижении любых финансовых целей.",
+            "Новые возможности для заработка появятся через творческие проекты.",
+            "Время для создания системы пассивного дохода и инвестиций.",
+            "Ваша харизма поможет в поиске новых возможностей для заработка.",
+            "Новые возможности для инвестиций появятся через творческие начинания.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для занятий творческими видами спорта или активностями.",
+            "Ваша уверенность поможет в достижении любых спортивных целей.",
+            "Новые возможности для укрепления здоровья появятся через творчество.",
+            "Время для создания системы здорового образа жизни.",
+            "Ваша щедрость поможет в создании позитивной атмосферы для здоровья.",
+            "Новые возможности для занятий спортом появятся через друзей.",
+            "Время для изучения новых методов поддержания здоровья и долголетия.",
+            "Ваша харизма поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через творческие проекты.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша уверенность поможет в поддержании регулярных здоровых привычек.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Новые возможности для занятий спортом появятся через творческие мероприятия.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша щедрость поможет в создании комфортной среды для здоровья.",
+            "Новые возможности для укрепления здоровья появятся через творчество.",
+            "Время для участия в спортивных мероприятиях или соревнованиях.",
+            "Ваша харизма поможет в поиске партнеров для занятий спортом.",
+            "Новые возможности для оздоровления появятся через творческие проекты.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День творчества и самовыражения. Не бойтесь проявлять свою индивидуальность.",
+            "Ваша харизма поможет в решении любых жизненных вопросов.",
+            "Время для проявления лидерских качеств в повседневной жизни.",
+            "Новые возможности для роста появятся через творчество и искусство.",
+            "Время для участия в творческих мероприятиях и событиях.",
+            "Ваша уверенность поможет в достижении любых поставленных целей.",
+            "Время для проявления щедрости и великодушия к окружающим.",
+            "Новые возможности для самореализации появятся через творческие проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Ваша харизма поможет в установлении важных связей.",
+            "Новые возможности для личностного роста появятся через творчество.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша щедрость поможет в создании позитивной атмосферы.",
+            "Новые возможности для самореализации появятся через искусство.",
+            "Время для проявления творчества и оригинальности в жизни.",
+            "Ваша уверенность поможет в преодолении любых жизненных препятствий.",
+            "Новые возможности для роста появятся через творческие проекты.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша харизма поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств и достижения новых высот."
+        ],
+        "advice": [
+            "Развивайте скромность, но не забывайте про уверенность в себе.",
+            "Ваша щедрость - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять лидерство, но не забывайте про сотрудничество.",
+            "Баланс между уверенностью и скромностью важен для гармонии.",
+            "Ваша харизма - это сила, но не забывайте про глубину.",
+            "Время для развития эмпатии и понимания чувств других.",
+            "Ваша щедрость - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между лидерством и сотрудничеством важен для успеха.",
+            "Ваша уверенность - это дар, но не забывайте про гибкость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша харизма - это сила, но используйте её с умом.",
+            "Время для развития навыков слушания и понимания других.",
+            "Ваша щедрость - это дар, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша уверенность - это достоинство, но иногда нужна сдержанность.",
+            "Время для развития навыков компромисса и дипломатии.",
+            "Ваша харизма - это сила, но не забывайте про качество общения.",
+            "Баланс между количеством и качеством связей важен для гармонии.",
+            "Ваша щедрость - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для творчества и самовыражения появятся в неожиданных местах.",
+            "Время для участия в творческих конкурсах и соревнованиях.",
+            "Ваша харизма поможет в установлении важных связей.",
+            "Новые знакомства через искусство откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через творчество и искусство.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша уверенность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через творческие проекты.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через творчество.",
+            "Время для развития навыков лидерства и управления командой.",
+            "Ваша щедрость поможет в создании новых возможностей.",
+            "Новые возможности для заработка появятся через искусство и творчество.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша харизма поможет в поиске новых возможностей.",
+            "Новые возможности для самореализации появятся через творческие проекты.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша уверенность поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через творчество и искусство."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: ВЕСЫ - Гармония, дипломатия, красота
+"""
+
+PREDICTIONS = {
+    "sign": "Весы",
+    "predictions": {
+        "love": [
+            "Время для создания гармонии и баланса в отношениях.",
+            "Ваша дипломатичность поможет в решении любых конфликтов в любви.",
+            "Новые возможности для любви появятся через искусство и красоту.",
+            "Время для проявления эстетического вкуса в отношениях.",
+            "Ваша способность к компромиссу поможет в укреплении отношений.",
+            "Новые знакомства через культурные мероприятия принесут радость.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша красота и обаяние будут высоко оценены партнером.",
+            "Время для планирования романтических мероприятий и событий.",
+            "Ваша дипломатичность поможет в создании гармоничных отношений.",
+            "Новые возможности для романтики появятся через искусство.",
+            "Время для проявления эстетического вкуса в романтических жестах.",
+            "Ваша способность к компромиссу поможет в решении любых проблем в любви.",
+            "Время для создания атмосферы красоты и гармонии в отношениях.",
+            "Ваша дипломатичность поможет в укреплении существующих связей.",
+            "Новые возможности для любви появятся через культурные мероприятия.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша красота и обаяние создадут прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша дипломатичность и красота будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы в сфере искусства, дизайна или дипломатии.",
+            "Ваша дипломатичность поможет в решении сложных профессиональных задач.",
+            "Новые возможности для карьерного роста появятся через искусство и красоту.",
+            "Время для развития навыков дипломатии и переговоров.",
+            "Ваша эстетический вкус поможет в создании красивых проектов.",
+            "Новые возможности для заработка появятся через искусство и творчество.",
+            "Время для создания гармоничной рабочей атмосферы.",
+            "Ваша дипломатичность поможет в установлении доверительных отношений с коллегами.",
+            "Новые возможности для карьерного роста появятся через культурные мероприятия.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша способность к компромиссу поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша эстетический вкус поможет в создании красивых и функциональных решений.",
+            "Новые возможности для самореализации появятся через искусство и красоту.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша дипломатичность поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через культурные мероприятия.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша красота и обаяние помогут в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для инвестиций в искусство, красоту и эстетику.",
+            "Ваша дипломатичность поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через искусство и красоту.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Ваша эстетический вкус поможет в выборе красивых и функциональных инвестиций.",
+            "Новые возможности для заработка появятся через культурные мероприятия.",
+            "Время для создания системы управления финансами с эстетическим подходом.",
+            "Ваша дипломатичность поможет в поиске новых возможностей для заработка.",
+            "Новые возможности для инвестиций появятся через искусство и красоту.",
+            "Время для изучения новых способов заработка в творческой сфере.",
+            "Ваша способность к компромиссу поможет в создании системы финансовой поддержки.",
+            "Время для развития навыков управления финансами.",
+            "Новые возможности для заработка появятся через искусство и красоту.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша дипломатичность поможет в достижении любых финансовых целей.",
+            "Новые возможности для заработка появятся через культурные мероприятия.",
+            "Время для создания системы пассивного дохода и инвестиций.",
+            "Ваша красота и обаяние помогут в поиске новых возможностей для заработка.",
+            "Новые возможности для инвестиций появятся через искусство и красоту.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для занятий эстетическими видами спорта или активностями.",
+            "Ваша дипломатичность поможет в достижении любых спортивных целей.",
+            "Новые возможности для укрепления здоровья появятся через искусство и красоту.",
+            "Время для создания системы здорового образа жизни с эстетическим подходом.",
+            "Ваша способность к компромиссу поможет в создании позитивной атмосферы для здоровья.",
+            "Новые возможности для занятий спортом появятся через культурные мероприятия.",
+            "Время для изучения новых методов поддержания здоровья и долголетия.",
+            "Ваша эстетический вкус поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через искусство и красоту.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша дипломатичность поможет в поддержании регулярных здоровых привычек.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Новые возможности для занятий спортом появятся через культурные мероприятия.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша способность к компромиссу поможет в создании комфортной среды для здоровья.",
+            "Новые возможности для укрепления здоровья появятся через искусство и красоту.",
+            "Время для участия в спортивных мероприятиях или соревнованиях.",
+            "Ваша красота и обаяние помогут в поиске партнеров для занятий спортом.",
+            "Новые возможности для оздоровления появятся через искусство и красоту.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День гармонии и красоты. Создавайте эстетику во всем.",
+            "Ваша дипломатичность поможет в решении любых жизненных вопросов.",
+            "Время для проявления эстетического вкуса в повседневной жизни.",
+            "Новые возможности для роста появятся через искусство и красоту.",
+            "Время для участия в культурных мероприятиях и событиях.",
+            "Ваша способность к компромиссу поможет в достижении любых поставленных целей.",
+            "Время для проявления красоты и гармонии к окружающим.",
+            "Новые возможности для самореализации появятся через искусство и красоту.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Ваша дипломатичность поможет в установлении важных связей.",
+            "Новые возможности для личностного роста появятся через искусство и красоту.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша способность к компромиссу поможет в создании позитивной атмосферы.",
+            "Новые возможности для самореализации появятся через искусство и красоту.",
+            "Время для проявления эстетического вкуса и гармонии в жизни.",
+            "Ваша дипломатичность поможет в преодолении любых жизненных препятствий.",
+            "Новые возможности для роста появятся через культурные мероприятия.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша красота и обаяние помогут в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств и достижения новых высот."
+        ],
+        "advice": [
+            "Развивайте решительность, но не забывайте про дипломатичность.",
+            "Ваша способность к компромиссу - это дар, но используйте её мудро.",
+            "Не бойтесь принимать решения, но не забывайте про баланс.",
+            "Баланс между дипломатичностью и решительностью важен для гармонии.",
+            "Ваша красота - это сила, но не забывайте про глубину.",
+            "Время для развития навыков принятия решений и лидерства.",
+            "Ваша способность к компромиссу - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между жертвенностью и самосохранением важен для успеха.",
+            "Ваша дипломатичность - это дар, но не забывайте про прямолинейность.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша красота - это сила, но используйте её с умом.",
+            "Время для развития навыков самозащиты и установления границ.",
+            "Ваша способность к компромиссу - это дар, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша дипломатичность - это достоинство, но иногда нужна прямолинейность.",
+            "Время для развития навыков принятия решений и лидерства.",
+            "Ваша красота - это сила, но не забывайте про качество общения.",
+            "Баланс между количеством и качеством связей важен для гармонии.",
+            "Ваша способность к компромиссу - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для искусства и красоты появятся в неожиданных местах.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша дипломатичность поможет в установлении важных связей.",
+            "Новые знакомства через искусство откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через искусство и красоту.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша способность к компромиссу поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через искусство и красоту.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через искусство и красоту.",
+            "Время для развития навыков дипломатии и переговоров.",
+            "Ваша красота и обаяние помогут в создании новых возможностей.",
+            "Новые возможности для заработка появятся через культурные мероприятия.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша дипломатичность поможет в поиске новых возможностей.",
+            "Новые возможности для самореализации появятся через искусство и красоту.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша способность к компромиссу поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через искусство и красоту."
+        ]
+    }
+}
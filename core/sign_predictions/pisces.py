@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: РЫБЫ - Интуиция, сострадание, духовность
+"""
+
+PREDICTIONS = {
+    "sign": "Рыбы",
+    "predictions": {
+        "love": [
+            "Время для глубоких и духовных отношений. Ваша интуиция привлекает чувствительных людей.",
+            "Новые возможности для любви появятся через духовные практики или творчество.",
+            "Время для проявления сострадания и понимания в отношениях.",
+            "Ваша духовность и чувствительность будут высоко оценены партнером.",
+            "Время для планирования отношений, основанных на духовной близости.",
+            "Новые знакомства через творчество или духовные практики принесут радость.",
+            "Время для проявления заботы и внимания к эмоциональным потребностям партнера.",
+            "Ваша интуиция поможет в укреплении отношений.",
+            "Время для планирования долгосрочных отношений с духовной близостью.",
+            "Ваша сострадание и чувствительность будут высоко оценены партнером.",
+            "Новые возможности для романтики появятся через творчество.",
+            "Время для проявления духовного подхода к любви.",
+            "Ваша интуиция поможет в решении любых проблем в отношениях.",
+            "Время для создания атмосферы духовной близости и понимания в отношениях.",
+            "Ваша сострадание поможет в укреплении существующих связей.",
+            "Новые возможности для любви появятся через духовные практики.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша духовность и интуиция создадут прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их духовное развитие.",
+            "Ваша сострадание и чувствительность будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы в сфере искусства, духовности или помощи людям.",
+            "Ваша интуиция поможет в принятии правильных профессиональных решений.",
+            "Новые возможности для карьерного роста появятся через творчество или духовные практики.",
+            "Время для развития навыков творчества и духовности.",
+            "Ваша сострадание поможет в работе с людьми.",
+            "Новые возможности для заработка появятся через творчество или духовные практики.",
+            "Время для создания атмосферы творчества и духовности в работе.",
+            "Ваша чувствительность поможет в установлении важных профессиональных связей.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша интуиция поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша сострадание поможет в понимании клиентов или коллег.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша духовность поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через духовные практики.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша интуиция поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для инвестиций в творческие проекты или духовные практики.",
+            "Ваша интуиция поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через творчество или духовные практики.",
+            "Время для инвестиций в семью и близких людей.",
+            "Ваша сострадание поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через творчество.",
+            "Время для создания финансовой подушки безопасности для семьи.",
+            "Ваша интуиция подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша духовность поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша интуиция поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через творчество.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша сострадание поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша духовность поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для занятий творческими видами спорта или духовными практиками.",
+            "Ваша интуиция поможет в достижении любых спортивных целей.",
+            "Новые возможности для укрепления здоровья появятся через творчество.",
+            "Время для создания системы здорового образа жизни.",
+            "Ваша духовность поможет в создании позитивной атмосферы для здоровья.",
+            "Новые возможности для занятий спортом появятся через друзей.",
+            "Время для изучения новых методов поддержания здоровья и долголетия.",
+            "Ваша чувствительность поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через духовные практики.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша интуиция поможет в поддержании регулярных здоровых привычек.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша духовность поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша сострадание поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша интуиция поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День духовности и творчества. Создавайте красоту для мира.",
+            "Ваша интуиция поможет в решении любых жизненных вопросов.",
+            "Время для творчества и духовных практик.",
+            "Новые возможности для роста появятся через творчество и духовность.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша сострадание поможет в понимании потребностей окружающих.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша духовность поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков творчества и духовности.",
+            "Ваша интуиция поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через духовные практики.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша сострадание поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша духовность поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте практичность, но не забывайте про духовность.",
+            "Ваша интуиция - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
+            "Баланс между духовностью и практичностью важен для гармонии.",
+            "Ваша сострадание - это сила, но не забывайте про собственные потребности.",
+            "Время для развития навыков практичности и организации.",
+            "Ваша чувствительность - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между жертвенностью и самосохранением важен для успеха.",
+            "Ваша духовность - это дар, но не забывайте про практичность.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша интуиция - это сила, но используйте её с умом.",
+            "Время для развития навыков практичности и организации.",
+            "Ваша сострадание - это дар, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для роста.",
+            "Ваша чувствительность - это достоинство, но иногда нужна дистанция.",
+            "Время для развития навыков практичности и организации.",
+            "Ваша духовность - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша интуиция - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для творчества и духовности появятся в неожиданных местах.",
+            "Время для участия в творческих проектах и духовных практиках.",
+            "Ваша интуиция поможет в установлении важных связей.",
+            "Новые знакомства через творчество откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через творчество или духовные практики.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша сострадание поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через творчество.",
+            "Время для развития навыков творчества и духовности.",
+            "Ваша духовность поможет в создании новых возможностей.",
+            "Новые возможности для заработка появятся через творческие проекты.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша интуиция поможет в поиске новых возможностей.",
+            "Новые возможности для самореализации появятся через творчество.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша сострадание поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через творчество и духовность."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: СТРЕЛЕЦ - Авантюризм, философия, оптимизм
+"""
+
+PREDICTIONS = {
+    "sign": "Стрелец",
+    "predictions": {
+        "love": [
+            "Время для романтических приключений и новых впечатлений. Ваш оптимизм привлекает интересных людей.",
+            "Новые возможности для любви появятся через путешествия и изучение новых культур.",
+            "Время для проявления философского подхода к отношениям.",
+            "Ваша авантюрность и энтузиазм будут высоко оценены партнером.",
+            "Время для планирования совместных путешествий и приключений.",
+            "Новые знакомства через образование или культурные мероприятия принесут радость.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша философская мудрость поможет в укреплении отношений.",
+            "Время для планирования долгосрочных отношений с приключениями.",
+            "Ваша оптимизм и энтузиазм будут высоко оценены партнером.",
+            "Новые возможности для романтики появятся через путешествия.",
+            "Время для проявления философского подхода к любви.",
+            "Ваша авантюрность поможет в решении любых проблем в отношениях.",
+            "Время для создания атмосферы приключений и открытий в отношениях.",
+            "Ваша мудрость поможет в укреплении существующих связей.",
+            "Новые возможности для любви появятся через образование.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша философская глубина создаст прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша авантюрность и оптимизм будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы в сфере образования, путешествий или философии.",
+            "Ваша философская мудрость поможет в принятии правильных профессиональных решений.",
+            "Новые возможности для карьерного роста появятся через путешествия и образование.",
+            "Время для развития навыков преподавания и наставничества.",
+            "Ваша авантюрность поможет в работе с людьми.",
+            "Новые возможности для заработка появятся через путешествия или образование.",
+            "Время для создания атмосферы обучения и развития в работе.",
+            "Ваша философская глубина поможет в установлении важных профессиональных связей.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша мудрость поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша философская глубина поможет в понимании клиентов или коллег.",
+            "Новые возможности для самореализации появятся через образование.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша авантюрность поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через путешествия.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша философская мудрость поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для инвестиций в образование, путешествия или философские проекты.",
+            "Ваша философская мудрость поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через путешествия или образование.",
+            "Время для инвестиций в семью и близких людей.",
+            "Ваша авантюрность поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через образование.",
+            "Время для создания финансовой подушки безопасности для семьи.",
+            "Ваша философская мудрость подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша мудрость поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша философская глубина поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через путешествия.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша авантюрность поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша философская мудрость поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для занятий активными видами спорта или путешествий.",
+            "Ваша авантюрность поможет в достижении любых спортивных целей.",
+            "Новые возможности для укрепления здоровья появятся через путешествия.",
+            "Время для создания системы здорового образа жизни.",
+            "Ваша философская мудрость поможет в создании позитивной атмосферы для здоровья.",
+            "Новые возможности для занятий спортом появятся через друзей.",
+            "Время для изучения новых методов поддержания здоровья и долголетия.",
+            "Ваша авантюрность поможет в поиске подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через путешествия.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша философская мудрость поможет в поддержании регулярных здоровых привычек.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша авантюрность поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша философская мудрость поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша мудрость поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День приключений и философских размышлений. Изучайте новые горизонты.",
+            "Ваша философская мудрость поможет в решении любых жизненных вопросов.",
+            "Время для путешествий и изучения новых культур.",
+            "Новые возможности для роста появятся через образование и путешествия.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша авантюрность поможет в понимании потребностей окружающих.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через образование.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша философская мудрость поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков преподавания и наставничества.",
+            "Ваша авантюрность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через путешествия.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша философская мудрость поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша мудрость поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте терпение, но не забывайте про авантюризм.",
+            "Ваша философская мудрость - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
+            "Баланс между авантюризмом и стабильностью важен для гармонии.",
+            "Ваша мудрость - это сила, но не забывайте про практичность.",
+            "Время для развития навыков планирования и организации.",
+            "Ваша авантюрность - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между жертвенностью и самосохранением важен для успеха.",
+            "Ваша философская мудрость - это дар, но не забывайте про гибкость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша авантюрность - это сила, но используйте её с умом.",
+            "Время для развития навыков терпения и настойчивости.",
+            "Ваша философская мудрость - это дар, но не забывайте про практическое применение.",
+            "Баланс между мечтами и реальностью важен для роста.",
+            "Ваша авантюрность - это достоинство, но иногда нужна осторожность.",
+            "Время для развития навыков планирования и организации.",
+            "Ваша философская мудрость - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша мудрость - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для путешествий и приключений появятся в неожиданных местах.",
+            "Время для участия в образовательных программах и курсах.",
+            "Ваша философская мудрость поможет в установлении важных связей.",
+            "Новые знакомства через путешествия откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через путешествия или образование.",
+            "Время для участия в культурных мероприятиях и выставках.",
+            "Ваша авантюрность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через путешествия.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через образование.",
+            "Время для развития навыков преподавания и наставничества.",
+            "Ваша философская мудрость поможет в создании новых возможностей.",
+            "Новые возможности для заработка появятся через путешествия.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша авантюрность поможет в поиске новых возможностей.",
+            "Новые возможности для самореализации появятся через образование.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша философская мудрость поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через путешествия и образование."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: СКОРПИОН - Интенсивность, трансформация, глубина
+"""
+
+PREDICTIONS = {
+    "sign": "Скорпион",
+    "predictions": {
+        "love": [
+            "Время для глубоких и страстных отношений. Ваша интенсивность привлекает достойных партнеров.",
+            "Новые возможности для любви появятся через трансформацию и личностный рост.",
+            "Время для проявления искренности и глубины в отношениях.",
+            "Ваша загадочность и магнетизм будут высоко оценены партнером.",
+            "Время для исцеления старых ран и прощения в любви.",
+            "Новые знакомства через духовные практики или глубокие разговоры принесут радость.",
+            "Время для проявления страсти и преданности в отношениях.",
+            "Ваша способность к трансформации поможет в укреплении связей.",
+            "Время для планирования глубоких и значимых отношений.",
+            "Ваша интуиция и проницательность будут высоко оценены партнером.",
+            "Новые возможности для романтики появятся через саморазвитие.",
+            "Время для проявления заботы и внимания к эмоциональным потребностям партнера.",
+            "Ваша способность к исцелению поможет в решении любых проблем в любви.",
+            "Время для создания атмосферы доверия и близости в отношениях.",
+            "Ваша глубина и мудрость помогут в укреплении существующих связей.",
+            "Новые возможности для любви появятся через духовные практики.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша преданность и верность создадут прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их глубокое развитие.",
+            "Ваша способность к трансформации и исцелению будет высоко оценена партнером."
+        ],
+        "career": [
+            "Время для работы в сфере психологии, исцеления или трансформации.",
+            "Ваша интуиция поможет в принятии правильных профессиональных решений.",
+            "Новые возможности для карьерного роста появятся через глубокую работу над собой.",
+            "Время для развития навыков психологии и понимания людей.",
+            "Ваша способность к трансформации поможет в работе с людьми.",
+            "Новые возможности для заработка появятся через духовные практики или консультирование.",
+            "Время для создания атмосферы доверия и поддержки в работе.",
+            "Ваша глубина поможет в установлении глубоких профессиональных связей.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша интуиция поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с людьми и их потребностями.",
+            "Ваша способность к исцелению поможет в понимании клиентов или коллег.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша глубина поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через духовные практики.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша преданность поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для создания системы глубокого финансового планирования.",
+            "Ваша интуиция поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через духовные практики или консультирование.",
+            "Время для инвестиций в семью и близких людей.",
+            "Ваша способность к трансформации поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через глубокую работу над собой.",
+            "Время для создания финансовой подушки безопасности для семьи.",
+            "Ваша интуиция подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша глубина поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша интуиция поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через духовные практики.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша способность к трансформации поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша преданность поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для создания системы глубокого оздоровления и исцеления.",
+            "Ваша интуиция поможет в понимании потребностей вашего тела.",
+            "Новые возможности для укрепления здоровья появятся через духовные практики.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша способность к трансформации поможет в создании системы здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через семью.",
+            "Время для создания системы мониторинга здоровья и самочувствия.",
+            "Ваша интуиция подскажет правильный момент для обращения к врачу.",
+            "Новые возможности для оздоровления появятся через духовные практики.",
+            "Время для изучения новых способов поддержания здоровья и долголетия.",
+            "Ваша глубина поможет в создании комфортной среды для здоровья.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша интуиция поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша способность к трансформации поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша преданность поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День глубоких размышлений и трансформации. Цените моменты тишины.",
+            "Ваша интуиция поможет в принятии важных жизненных решений.",
+            "Время для создания атмосферы доверия и близости в отношениях.",
+            "Новые возможности для роста появятся через духовные практики.",
+            "Время для проявления заботы и внимания к эмоциональным потребностям близких.",
+            "Ваша способность к трансформации поможет в понимании потребностей окружающих.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша глубина поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков психологии и понимания людей.",
+            "Ваша интуиция поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через духовные практики.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша способность к исцелению поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша преданность поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте открытость, но не забывайте про глубину.",
+            "Ваша способность к трансформации - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про контроль.",
+            "Баланс между интенсивностью и спокойствием важен для гармонии.",
+            "Ваша интуиция - это сила, но не забывайте про логику.",
+            "Время для развития навыков доверия и открытости.",
+            "Ваша глубина - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между жертвенностью и самосохранением важен для успеха.",
+            "Ваша преданность - это дар, но не забывайте про гибкость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша способность к исцелению - это сила, но используйте её с умом.",
+            "Время для развития навыков прощения и принятия.",
+            "Ваша интуиция - это дар, но не забывайте про логическое мышление.",
+            "Баланс между контролем и доверием важен для роста.",
+            "Ваша интенсивность - это достоинство, но иногда нужна сдержанность.",
+            "Время для развития навыков расслабления и отдыха.",
+            "Ваша глубина - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша преданность - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для духовного роста появятся в неожиданных местах.",
+            "Время для участия в программах личностного развития и трансформации.",
+            "Ваша интуиция поможет в выборе правильных возможностей.",
+            "Новые знакомства через духовные практики откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через консультирование или исцеление.",
+            "Время для участия в семинарах по психологии и духовному развитию.",
+            "Ваша глубина поможет в установлении важных связей.",
+            "Новые возможности для самореализации появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через духовные практики.",
+            "Время для развития навыков психологии и консультирования.",
+            "Ваша интуиция поможет в выборе подходящих возможностей.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для участия в программах поддержки и помощи.",
+            "Ваша способность к трансформации поможет в создании новых возможностей.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша преданность поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через духовные практики."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: ТЕЛЕЦ - Стабильность, практичность, надежность
+"""
+
+PREDICTIONS = {
+    "sign": "Телец",
+    "predictions": {
+        "love": [
+            "Романтические ужины и теплые разговоры укрепят ваши отношения.",
+            "Время для проявления заботы и нежности к близким людям.",
+            "Стабильность в отношениях принесет душевное спокойствие.",
+            "Семейные ценности и традиции помогут в укреплении связей.",
+            "Ваша надежность и преданность будут высоко оценены партнером.",
+            "Время для создания уютной и романтической атмосферы дома.",
+            "Терпение и понимание помогут в решении любых проблем в отношениях.",
+            "Ваша чувственность и нежность сделают отношения особенными.",
+            "Время для планирования совместного будущего с любимым человеком.",
+            "Ваша верность и преданность - основа крепких отношений.",
+            "Новые возможности для любви появятся через старых друзей.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша практичность поможет в решении бытовых вопросов в отношениях.",
+            "Время для создания семейного уюта и гармонии.",
+            "Ваша терпеливость поможет в преодолении любых трудностей в любви.",
+            "Новые возможности для романтики появятся через домашние дела.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша надежность создаст прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша преданность и верность будут высоко оценены партнером."
+        ],
+        "career": [
+            "Стабильность в работе. Хорошее время для планирования карьеры.",
+            "Ваша надежность и трудолюбие будут высоко оценены начальством.",
+            "Время для работы над долгосрочными проектами.",
+            "Терпение и настойчивость помогут в достижении профессиональных целей.",
+            "Ваша практичность поможет в решении сложных рабочих задач.",
+            "Время для инвестиций в профессиональное развитие.",
+            "Стабильный доход и надежная работа принесут финансовую безопасность.",
+            "Ваша организованность поможет в повышении эффективности работы.",
+            "Время для создания прочной основы для будущего карьерного роста.",
+            "Ваша надежность - ключ к успеху в любой профессиональной деятельности.",
+            "Новые возможности для стабильной работы появятся в неожиданных местах.",
+            "Время для развития практических навыков и компетенций.",
+            "Ваша терпеливость поможет в достижении долгосрочных карьерных целей.",
+            "Время для создания надежной репутации в профессиональной сфере.",
+            "Ваша практичность поможет в оптимизации рабочих процессов.",
+            "Новые возможности для карьерного роста появятся через упорный труд.",
+            "Время для инвестиций в профессиональные связи и отношения.",
+            "Ваша организованность поможет в повышении продуктивности.",
+            "Новые возможности для стабильного дохода появятся через практические навыки.",
+            "Ваша надежность и трудолюбие будут вознаграждены признанием и продвижением."
+        ],
+        "finance": [
+            "Финансовая стабильность. Хорошее время для планирования бюджета.",
+            "Возможны неожиданные поступления денег. Будьте разумны в тратах.",
+            "Время для консервативных инвестиций. Терпение принесет плоды.",
+            "Ваша практичность поможет в принятии правильных финансовых решений.",
+            "Новые источники дохода могут появиться из неожиданных мест.",
+            "Сегодняшний день благоприятен для крупных покупок или инвестиций.",
+            "Будьте внимательны к своим расходам, это поможет сэкономить.",
+            "Ваша интуиция подскажет правильный путь в финансовых вопросах.",
+            "Время для создания финансовой подушки безопасности.",
+            "Возможно, вы получите выгодное предложение или скидку.",
+            "Новые возможности для стабильного дохода появятся через практические навыки.",
+            "Время для инвестиций в недвижимость или другие стабильные активы.",
+            "Ваша терпеливость поможет в достижении долгосрочных финансовых целей.",
+            "Время для создания системы сбережений и накоплений.",
+            "Ваша практичность поможет в оптимизации финансовых расходов.",
+            "Новые возможности для заработка появятся через домашние дела.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша организованность поможет в ведении семейного бюджета.",
+            "Новые возможности для финансовой стабильности появятся через терпение.",
+            "Ваша надежность поможет в создании прочной финансовой основы."
+        ],
+        "health": [
+            "Обратите внимание на питание и отдых. Время для восстановления сил.",
+            "Физические нагрузки принесут пользу. Займитесь спортом.",
+            "Время для создания здоровых привычек. Ваша дисциплина поможет.",
+            "Душевное равновесие важно для физического здоровья.",
+            "Новые методы оздоровления могут принести отличные результаты.",
+            "Сегодняшний день благоприятен для начала диеты или тренировок.",
+            "Будьте внимательны к своему телу, оно подскажет, что ему нужно.",
+            "Ваша энергия сегодня на высоте, используйте это для активного отдыха.",
+            "Время для медитации и расслабления. Найдите время для себя.",
+            "Возможно, вы найдете новый способ улучшить свое самочувствие.",
+            "Новые возможности для укрепления здоровья появятся через домашние процедуры.",
+            "Время для создания комфортной среды для отдыха и восстановления.",
+            "Ваша терпеливость поможет в поддержании здорового образа жизни.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша практичность поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для занятий спортом появятся через друзей.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша организованность поможет в планировании здорового образа жизни.",
+            "Новые возможности для релаксации появятся через домашние процедуры.",
+            "Ваша надежность поможет в поддержании регулярных здоровых привычек."
+        ],
+        "general": [
+            "День стабильности и комфорта. Цените то, что имеете.",
+            "Ваша надежность - источник силы для окружающих.",
+            "Время для создания уюта и гармонии в доме.",
+            "Терпение и настойчивость помогут в достижении любых целей.",
+            "Стабильность в жизни принесет душевное спокойствие.",
+            "Сегодняшний день благоприятен для планирования будущего.",
+            "Будьте благодарны за то, что имеете, и работайте над улучшением.",
+            "Ваша практичность поможет в решении повседневных задач.",
+            "Время для заботы о близких и создания семейного уюта.",
+            "Ваша надежность - основа крепких отношений с окружающими.",
+            "Новые возможности для стабильности появятся через терпение.",
+            "Время для создания прочной основы для будущего развития.",
+            "Ваша практичность поможет в решении любых жизненных вопросов.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Ваша организованность поможет в повышении качества жизни.",
+            "Новые возможности для комфорта появятся через домашние дела.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша терпеливость поможет в преодолении любых жизненных трудностей.",
+            "Новые возможности для гармонии появятся через создание уюта.",
+            "Ваша надежность и преданность будут высоко оценены окружающими."
+        ],
+        "advice": [
+            "Проявите гибкость в принятии решений, но не забывайте про стабильность.",
+            "Ваша надежность - это сила, но иногда нужна спонтанность.",
+            "Не бойтесь изменений, но делайте их постепенно и обдуманно.",
+            "Терпение - это добродетель, но не забывайте про активность.",
+            "Баланс между стабильностью и новизной важен для роста.",
+            "Будьте открыты новому опыту, но не забывайте про свои ценности.",
+            "Ваша практичность - это сила, но не забывайте про мечты.",
+            "Не бойтесь просить о помощи, если это необходимо.",
+            "Время для саморефлексии и анализа своих потребностей.",
+            "Доверяйте себе и своим решениям, но будьте готовы к компромиссам.",
+            "Ваша терпеливость - это дар, но используйте её мудро.",
+            "Время для развития гибкости и адаптивности к изменениям.",
+            "Ваша практичность - это сила, но не забывайте про творчество.",
+            "Баланс между комфортом и ростом важен для развития.",
+            "Ваша надежность - это достоинство, но иногда нужна спонтанность.",
+            "Время для развития открытости к новым возможностям.",
+            "Ваша организованность - это сила, но не забывайте про гибкость.",
+            "Баланс между стабильностью и изменениями важен для прогресса.",
+            "Ваша преданность - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Возможность укрепить финансовое положение.",
+            "Время для инвестиций в недвижимость или стабильные активы.",
+            "Ваша практичность поможет в выборе правильных возможностей.",
+            "Семейные связи откроют новые возможности для роста.",
+            "Время для создания прочной основы для будущего.",
+            "Новые возможности для заработка через практические навыки.",
+            "Возможности для укрепления отношений с близкими.",
+            "Ваша надежность поможет в установлении долгосрочных партнерств.",
+            "Время для создания уютного дома и семейного счастья.",
+            "Интуиция поможет в выборе стабильных и надежных возможностей.",
+            "Новые возможности для стабильного дохода появятся через терпение.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша практичность поможет в выборе подходящих возможностей.",
+            "Новые возможности для карьерного роста появятся через упорный труд.",
+            "Время для создания надежной основы для будущего развития.",
+            "Ваша организованность поможет в планировании долгосрочных целей.",
+            "Новые возможности для комфорта появятся через домашние дела.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Ваша терпеливость поможет в достижении любых поставленных целей.",
+            "Новые возможности для стабильности появятся через практические навыки."
+        ]
+    }
+}
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Персонализированные предсказания: ДЕВА - Практичность, аналитичность, перфекционизм
+"""
+
+PREDICTIONS = {
+    "sign": "Дева",
+    "predictions": {
+        "love": [
+            "Время для проявления заботы и внимания к деталям в отношениях.",
+            "Ваша практичность поможет в решении бытовых вопросов в любви.",
+            "Новые возможности для любви появятся через работу или учебу.",
+            "Время для проявления терпения и понимания к партнеру.",
+            "Ваша аналитичность поможет в понимании потребностей партнера.",
+            "Новые знакомства через друзей или коллег принесут радость.",
+            "Время для проявления заботы и внимания к партнеру.",
+            "Ваша практичность поможет в создании стабильных отношений.",
+            "Время для планирования совместного будущего с любимым человеком.",
+            "Ваша преданность и верность будут высоко оценены партнером.",
+            "Новые возможности для романтики появятся через практические дела.",
+            "Время для проявления терпения и понимания в отношениях.",
+            "Ваша аналитичность поможет в решении любых проблем в любви.",
+            "Время для создания системы поддержки и помощи в отношениях.",
+            "Ваша практичность поможет в планировании совместных мероприятий.",
+            "Новые возможности для любви появятся через заботу о других.",
+            "Время для проявления благодарности и любви к близким.",
+            "Ваша заботливость создаст прочную основу для долгосрочных отношений.",
+            "Время для инвестиций в отношения и их развитие.",
+            "Ваша преданность и верность будут высоко оценены партнером."
+        ],
+        "career": [
+            "Время для работы над деталями и совершенствованием процессов.",
+            "Ваша аналитичность поможет в решении сложных профессиональных задач.",
+            "Новые возможности для карьерного роста появятся через упорный труд.",
+            "Время для развития навыков анализа и планирования.",
+            "Ваша практичность поможет в оптимизации рабочих процессов.",
+            "Новые возможности для заработка появятся через практические навыки.",
+            "Время для создания системы организации и планирования в работе.",
+            "Ваша заботливость поможет в установлении доверительных отношений с коллегами.",
+            "Новые возможности для карьерного роста появятся через семью.",
+            "Время для инвестиций в профессиональное развитие и обучение.",
+            "Ваша аналитичность поможет в выборе подходящих возможностей.",
+            "Время для развития навыков работы с деталями и совершенствованием.",
+            "Ваша практичность поможет в создании эффективных рабочих процессов.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи в работе.",
+            "Ваша заботливость поможет в создании позитивной рабочей атмосферы.",
+            "Новые возможности для карьерного роста появятся через семью и близких.",
+            "Время для инвестиций в отношения с коллегами и начальством.",
+            "Ваша преданность поможет в создании долгосрочных профессиональных связей.",
+            "Время для проявления лучших качеств в профессиональной деятельности."
+        ],
+        "finance": [
+            "Время для создания детальной системы управления финансами.",
+            "Ваша аналитичность поможет в принятии правильных финансовых решений.",
+            "Новые возможности для заработка появятся через практические навыки.",
+            "Время для инвестиций в образование или профессиональное развитие.",
+            "Ваша практичность поможет в планировании семейного бюджета.",
+            "Новые возможности для стабильного дохода появятся через упорный труд.",
+            "Время для создания системы финансового планирования и контроля.",
+            "Ваша аналитичность подскажет правильный момент для инвестиций.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Ваша практичность поможет в создании системы финансовой поддержки семьи.",
+            "Время для изучения новых способов сбережения и накопления.",
+            "Ваша аналитичность поможет в выборе подходящих финансовых инструментов.",
+            "Новые возможности для заработка появятся через практические навыки.",
+            "Время для создания системы финансовой помощи близким.",
+            "Ваша практичность поможет в планировании долгосрочных финансовых целей.",
+            "Новые возможности для стабильного дохода появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша преданность поможет в создании прочной финансовой основы.",
+            "Время для проявления лучших качеств в управлении финансами."
+        ],
+        "health": [
+            "Время для создания детальной системы здорового образа жизни.",
+            "Ваша аналитичность поможет в понимании потребностей вашего тела.",
+            "Новые возможности для укрепления здоровья появятся через практические методы.",
+            "Время для инвестиций в собственное здоровье и благополучие.",
+            "Ваша практичность поможет в создании системы здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через семью.",
+            "Время для создания системы мониторинга здоровья и самочувствия.",
+            "Ваша аналитичность подскажет правильный момент для обращения к врачу.",
+            "Новые возможности для оздоровления появятся через практические методы.",
+            "Время для изучения новых способов поддержания здоровья и долголетия.",
+            "Ваша практичность поможет в создании комфортной среды для здоровья.",
+            "Время для развития навыков релаксации и снятия стресса.",
+            "Ваша аналитичность поможет в выборе подходящих методов оздоровления.",
+            "Новые возможности для укрепления здоровья появятся через семью.",
+            "Время для создания системы здорового питания и режима.",
+            "Ваша практичность поможет в планировании здорового образа жизни.",
+            "Новые возможности для занятий спортом появятся через близких.",
+            "Время для инвестиций в отношения с врачами и специалистами.",
+            "Ваша преданность поможет в поддержании регулярных здоровых привычек.",
+            "Время для проявления лучших качеств в заботе о собственном здоровье."
+        ],
+        "general": [
+            "День практичности и внимания к деталям. Цените качество во всем.",
+            "Ваша аналитичность поможет в принятии важных жизненных решений.",
+            "Время для создания системы организации и планирования в жизни.",
+            "Новые возможности для роста появятся через практические навыки.",
+            "Время для проявления заботы и внимания к близким людям.",
+            "Ваша практичность поможет в решении повседневных задач.",
+            "Время для инвестиций в отношения и семейные связи.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи близким.",
+            "Ваша заботливость поможет в создании позитивной атмосферы.",
+            "Новые возможности для личностного роста появятся через семью.",
+            "Время для развития навыков анализа и планирования.",
+            "Ваша практичность поможет в выборе правильных возможностей.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для создания системы поддержки и помощи в жизни.",
+            "Ваша заботливость поможет в создании гармоничной атмосферы.",
+            "Новые возможности для роста появятся через семью и близких.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Ваша преданность поможет в создании прочной основы для будущего.",
+            "Время для проявления лучших качеств в заботе о близких."
+        ],
+        "advice": [
+            "Развивайте гибкость, но не забывайте про практичность.",
+            "Ваша аналитичность - это дар, но используйте её мудро.",
+            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
+            "Баланс между перфекционизмом и принятием несовершенства важен для гармонии.",
+            "Ваша практичность - это сила, но не забывайте про мечты.",
+            "Время для развития уверенности в принятии решений.",
+            "Ваша заботливость - это достоинство, но не забывайте про собственные потребности.",
+            "Баланс между критичностью и принятием важен для успеха.",
+            "Ваша преданность - это дар, но не забывайте про гибкость.",
+            "Время для развития мудрости и зрелости в отношениях.",
+            "Ваша аналитичность - это сила, но используйте её с умом.",
+            "Время для развития навыков принятия и прощения.",
+            "Ваша практичность - это дар, но не забывайте про творчество.",
+            "Баланс между контролем и спонтанностью важен для роста.",
+            "Ваша заботливость - это достоинство, но иногда нужна дистанция.",
+            "Время для развития навыков расслабления и отдыха.",
+            "Ваша преданность - это сила, но не забывайте про собственные интересы.",
+            "Баланс между жертвенностью и самосохранением важен для здоровья.",
+            "Ваша практичность - это дар, но не забывайте про собственные потребности.",
+            "Время для развития мудрости и зрелости в принятии решений."
+        ],
+        "opportunities": [
+            "Новые возможности для практической работы появятся в неожиданных местах.",
+            "Время для участия в проектах по совершенствованию и оптимизации.",
+            "Ваша аналитичность поможет в выборе правильных возможностей.",
+            "Новые знакомства через работу откроют интересные проекты.",
+            "Время для инвестиций в собственное развитие и обучение.",
+            "Новые возможности для заработка появятся через практические навыки.",
+            "Время для участия в профессиональных мероприятиях и конференциях.",
+            "Ваша практичность поможет в установлении важных связей.",
+            "Новые возможности для самореализации появятся через семью.",
+            "Время для инвестиций в отношения и профессиональные связи.",
+            "Новые возможности для карьерного роста появятся через практическую работу.",
+            "Время для развития навыков анализа и планирования.",
+            "Ваша практичность поможет в выборе подходящих возможностей.",
+            "Новые возможности для заработка появятся через семью и близких.",
+            "Время для участия в программах поддержки и помощи.",
+            "Ваша заботливость поможет в создании новых возможностей.",
+            "Новые возможности для самореализации появятся через заботу о других.",
+            "Время для инвестиций в образование или новые навыки.",
+            "Ваша преданность поможет в создании долгосрочных возможностей.",
+            "Новые возможности для личностного роста появятся через практическую работу."
+        ]
+    }
+}
@@ -8,1116 +8,26 @@
 import random
 from datetime import datetime
 
+from .prediction_catalog import get_prediction_catalog
+
 # =============================================================================
 # ПЕРСОНАЛИЗИРОВАННЫЕ БАЗЫ ДАННЫХ (12 знаков зодиака)
 # =============================================================================
 
-# 1. ОВЕН - Лидерство, энергия, смелость
-ARIES_PREDICTIONS = {
-    "sign": "Овен",
-    "predictions": {
-        "love": [
-            "Ваша страстная натура привлекает внимание. Не бойтесь проявлять инициативу в любви!",
-            "Огненная энергия разгорается в вашем сердце. Время для смелых романтических жестов.",
-            "Новые знакомства через активные хобби принесут интересные возможности.",
-            "Ваша харизма и уверенность делают вас неотразимыми. Используйте это время!",
-            "Спонтанные романтические поступки принесут неожиданные результаты.",
-            "Лидерские качества в отношениях будут высоко оценены партнером.",
-            "Время для решительных шагов в любви. Ваша прямолинейность - ваш козырь.",
-            "Спортивные мероприятия или активный отдых могут привести к серьезным отношениям.",
-            "Ваша энергия и энтузиазм создают магнетическое притяжение.",
-            "Не бойтесь быть первым в признании чувств. Ваша смелость окупится.",
-            "Огненная страсть разгорается в вашем сердце. Время для пылких признаний.",
-            "Новые знакомства через друзей или коллег принесут радость в личную жизнь.",
-            "Ваша инициативность в отношениях будет высоко оценена.",
-            "Время для романтических приключений и новых впечатлений.",
-            "Ваша уверенность в себе привлекает достойных партнеров.",
-            "Смелые романтические жесты принесут успех в любви.",
-            "Ваша энергия и оптимизм создают благоприятную атмосферу для отношений.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша честность и открытость укрепляют существующие связи.",
-            "Новые возможности для любви появятся через активную деятельность."
-        ],
-        "career": [
-            "Лидерские качества помогут в продвижении по карьерной лестнице. Не бойтесь брать на себя ответственность.",
-            "Новые проекты требуют вашего внимания. Ваша инициативность будет высоко оценена начальством.",
-            "Время для смелых решений в карьере. Ваша решительность принесет отличные результаты.",
-            "Конкуренция в работе усилится, но ваша энергия поможет выйти победителем.",
-            "Возможности для карьерного роста появятся неожиданно. Будьте готовы к быстрым решениям.",
-            "Ваша предприимчивость откроет новые горизонты в карьере. Время для амбициозных проектов.",
-            "Лидерские качества проявятся в полной мере. Не бойтесь брать на себя ответственность за команду.",
-            "Смелые инновационные идеи принесут признание. Ваша креативность в цене.",
-            "Конкуренция вдохновляет вас на новые достижения. Используйте это как мотивацию.",
-            "Время для карьерных прорывов. Ваша энергия и решительность - ключ к успеху.",
-            "Новые возможности для лидерства появятся в неожиданных местах.",
-            "Ваша смелость в принятии решений поможет в решении сложных задач.",
-            "Время для участия в амбициозных проектах и инициативах.",
-            "Ваша энергия и энтузиазм вдохновят коллег на новые достижения.",
-            "Новые возможности для карьерного роста появятся через активную деятельность.",
-            "Ваша инициативность поможет в создании новых направлений работы.",
-            "Время для проявления лидерских качеств в командной работе.",
-            "Ваша решительность поможет в преодолении любых профессиональных препятствий.",
-            "Новые возможности для самореализации появятся через творческий подход.",
-            "Ваша энергия и оптимизм помогут в достижении любых карьерных целей."
-        ],
-        "finance": [
-            "Активные инвестиции могут принести прибыль. Не бойтесь рисковать разумно.",
-            "Ваша предприимчивость поможет найти новые источники дохода.",
-            "Время для смелых финансовых решений. Ваша интуиция подскажет правильный путь.",
-            "Возможны неожиданные поступления денег. Будьте готовы к приятным сюрпризам.",
-            "Ваша энергия поможет в решении финансовых вопросов. Не откладывайте важные дела.",
-            "Спортивные инвестиции или активные виды заработка принесут хорошие результаты.",
-            "Ваша инициативность поможет в поиске дополнительных источников дохода.",
-            "Время для рискованных, но перспективных инвестиций. Ваша смелость окупится.",
-            "Новые финансовые возможности появятся через активную деятельность.",
-            "Ваша энергия и решительность помогут в решении денежных вопросов.",
-            "Время для инвестиций в собственное развитие и новые навыки.",
-            "Ваша смелость в финансовых решениях принесет неожиданные результаты.",
-            "Новые возможности для заработка появятся через лидерские качества.",
-            "Ваша инициативность поможет в создании дополнительных источников дохода.",
-            "Время для активного управления финансами и планирования бюджета.",
-            "Ваша энергия поможет в поиске новых способов заработка.",
-            "Новые финансовые возможности появятся через творческий подход.",
-            "Ваша решительность поможет в достижении финансовых целей.",
-            "Время для инвестиций в перспективные проекты и начинания.",
-            "Ваша оптимизм и энергия помогут в решении любых финансовых вопросов."
-        ],
-        "health": [
-            "Энергия на высоком уровне. Займитесь спортом и активными видами деятельности.",
-            "Время для интенсивных тренировок. Ваша выносливость поможет в достижении спортивных целей.",
-            "Активный образ жизни принесет отличные результаты. Не бойтесь физических нагрузок.",
-            "Спортивные соревнования или состязания могут принести успех и признание.",
-            "Ваша энергия поможет в преодолении любых физических препятствий.",
-            "Время для экстремальных видов спорта или активного отдыха. Ваша смелость - ваш козырь.",
-            "Регулярные физические упражнения укрепят ваше здоровье и выносливость.",
-            "Ваша активность и энергия помогут в поддержании отличной физической формы.",
-            "Время для участия в спортивных мероприятиях или соревнованиях.",
-            "Ваша решительность поможет в достижении любых спортивных целей.",
-            "Новые возможности для занятий спортом появятся в неожиданных местах.",
-            "Ваша энергия поможет в преодолении любых физических вызовов.",
-            "Время для создания системы регулярных тренировок и физической активности.",
-            "Ваша смелость поможет в освоении новых видов спорта и активностей.",
-            "Новые возможности для укрепления здоровья появятся через активную деятельность.",
-            "Ваша инициативность поможет в создании здорового образа жизни.",
-            "Время для инвестиций в собственное здоровье и физическое развитие.",
-            "Ваша решительность поможет в достижении любых спортивных целей.",
-            "Новые возможности для активного отдыха появятся через друзей и знакомых.",
-            "Ваша энергия и оптимизм помогут в поддержании отличного самочувствия."
-        ],
-        "general": [
-            "День активности и достижений. Не торопитесь, но будьте решительны.",
-            "Ваша энергия заразительна. Вдохновляйте окружающих на великие дела.",
-            "Время для новых начинаний. Ваша смелость откроет множество возможностей.",
-            "Лидерские качества проявятся в полной мере. Не бойтесь брать на себя ответственность.",
-            "Оптимизм и энтузиазм помогут преодолеть любые препятствия.",
-            "Сегодняшний день принесет много интересных событий и встреч.",
-            "Будьте открыты новым идеям и возможностям, они уже близко.",
-            "Ваша интуиция подскажет правильный путь в сложных ситуациях.",
-            "Время для саморазвития и обучения. Расширяйте свои горизонты.",
-            "Возможно, вы найдете новый источник вдохновения.",
-            "Ваша смелость поможет в решении любых жизненных задач.",
-            "Время для проявления лидерских качеств в повседневной жизни.",
-            "Ваша энергия поможет в достижении любых поставленных целей.",
-            "Новые возможности для роста и развития появятся неожиданно.",
-            "Ваша инициативность поможет в создании позитивных изменений.",
-            "Время для активного участия в общественной жизни и проектах.",
-            "Ваша решительность поможет в преодолении любых препятствий.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Ваша оптимизм и энергия помогут в решении любых жизненных вопросов.",
-            "Время для проявления лучших качеств и достижения новых высот."
-        ],
-        "advice": [
-            "Слушайте интуицию, но не игнорируйте логику. Баланс решительности и осторожности.",
-            "Ваша прямолинейность - это сила, но иногда нужна дипломатия.",
-            "Не распыляйтесь на слишком много дел одновременно. Сосредоточьтесь на главном.",
-            "Информация - это сила, но важно уметь её фильтровать.",
-            "Баланс между общением и уединением важен для душевного равновесия.",
-            "Будьте открыты новым идеям, но не забывайте про свои принципы.",
-            "Ваша гибкость - это сила, но не забывайте про стабильность.",
-            "Не бойтесь просить о помощи, если это необходимо.",
-            "Время для саморефлексии и анализа своих поступков.",
-            "Доверяйте себе и своим решениям, но будьте готовы к изменениям.",
-            "Ваша смелость - это дар, но используйте её мудро.",
-            "Время для развития терпения и понимания к окружающим.",
-            "Ваша энергия - это сила, но не забывайте про отдых.",
-            "Баланс между действием и размышлением важен для успеха.",
-            "Ваша честность - это достоинство, но иногда нужна тактичность.",
-            "Время для развития эмпатии и понимания чувств других.",
-            "Ваша уверенность - это сила, но не забывайте про скромность.",
-            "Баланс между лидерством и сотрудничеством важен для гармонии.",
-            "Ваша решительность - это дар, но не забывайте про компромиссы.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для лидерства появятся в неожиданных местах.",
-            "Время для участия в амбициозных проектах и инициативах.",
-            "Ваша энергия поможет в реализации любых планов и целей.",
-            "Сетевые связи откроют множество интересных возможностей.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Новые знакомства могут привести к интересным проектам.",
-            "Возможности для укрепления финансового положения.",
-            "Ваша эмпатия поможет в установлении глубоких связей.",
-            "Время для создания уютной атмосферы дома.",
-            "Интуиция поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для участия в общественных инициативах и проектах.",
-            "Ваша смелость поможет в освоении новых областей деятельности.",
-            "Новые возможности для карьерного роста появятся через активность.",
-            "Время для инвестиций в собственное развитие и рост.",
-            "Ваша инициативность поможет в создании новых возможностей.",
-            "Новые возможности для путешествий и изучения мира появятся неожиданно.",
-            "Время для участия в спортивных мероприятиях и соревнованиях.",
-            "Ваша энергия поможет в достижении любых поставленных целей.",
-            "Новые возможности для личностного роста появятся через саморазвитие."
-        ]
-    }
-}
-
-# 2. ТЕЛЕЦ - Стабильность, практичность, надежность
-TAURUS_PREDICTIONS = {
-    "sign": "Телец",
-    "predictions": {
-        "love": [
-            "Романтические ужины и теплые разговоры укрепят ваши отношения.",
-            "Время для проявления заботы и нежности к близким людям.",
-            "Стабильность в отношениях принесет душевное спокойствие.",
-            "Семейные ценности и традиции помогут в укреплении связей.",
-            "Ваша надежность и преданность будут высоко оценены партнером.",
-            "Время для создания уютной и романтической атмосферы дома.",
-            "Терпение и понимание помогут в решении любых проблем в отношениях.",
-            "Ваша чувственность и нежность сделают отношения особенными.",
-            "Время для планирования совместного будущего с любимым человеком.",
-            "Ваша верность и преданность - основа крепких отношений.",
-            "Новые возможности для любви появятся через старых друзей.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша практичность поможет в решении бытовых вопросов в отношениях.",
-            "Время для создания семейного уюта и гармонии.",
-            "Ваша терпеливость поможет в преодолении любых трудностей в любви.",
-            "Новые возможности для романтики появятся через домашние дела.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша надежность создаст прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша преданность и верность будут высоко оценены партнером."
-        ],
-        "career": [
-            "Стабильность в работе. Хорошее время для планирования карьеры.",
-            "Ваша надежность и трудолюбие будут высоко оценены начальством.",
-            "Время для работы над долгосрочными проектами.",
-            "Терпение и настойчивость помогут в достижении профессиональных целей.",
-            "Ваша практичность поможет в решении сложных рабочих задач.",
-            "Время для инвестиций в профессиональное развитие.",
-            "Стабильный доход и надежная работа принесут финансовую безопасность.",
-            "Ваша организованность поможет в повышении эффективности работы.",
-            "Время для создания прочной основы для будущего карьерного роста.",
-            "Ваша надежность - ключ к успеху в любой профессиональной деятельности.",
-            "Новые возможности для стабильной работы появятся в неожиданных местах.",
-            "Время для развития практических навыков и компетенций.",
-            "Ваша терпеливость поможет в достижении долгосрочных карьерных целей.",
-            "Время для создания надежной репутации в профессиональной сфере.",
-            "Ваша практичность поможет в оптимизации рабочих процессов.",
-            "Новые возможности для карьерного роста появятся через упорный труд.",
-            "Время для инвестиций в профессиональные связи и отношения.",
-            "Ваша организованность поможет в повышении продуктивности.",
-            "Новые возможности для стабильного дохода появятся через практические навыки.",
-            "Ваша надежность и трудолюбие будут вознаграждены признанием и продвижением."
-        ],
-        "finance": [
-            "Финансовая стабильность. Хорошее время для планирования бюджета.",
-            "Возможны неожиданные поступления денег. Будьте разумны в тратах.",
-            "Время для консервативных инвестиций. Терпение принесет плоды.",
-            "Ваша практичность поможет в принятии правильных финансовых решений.",
-            "Новые источники дохода могут появиться из неожиданных мест.",
-            "Сегодняшний день благоприятен для крупных покупок или инвестиций.",
-            "Будьте внимательны к своим расходам, это поможет сэкономить.",
-            "Ваша интуиция подскажет правильный путь в финансовых вопросах.",
-            "Время для создания финансовой подушки безопасности.",
-            "Возможно, вы получите выгодное предложение или скидку.",
-            "Новые возможности для стабильного дохода появятся через практические навыки.",
-            "Время для инвестиций в недвижимость или другие стабильные активы.",
-            "Ваша терпеливость поможет в достижении долгосрочных финансовых целей.",
-            "Время для создания системы сбережений и накоплений.",
-            "Ваша практичность поможет в оптимизации финансовых расходов.",
-            "Новые возможности для заработка появятся через домашние дела.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша организованность поможет в ведении семейного бюджета.",
-            "Новые возможности для финансовой стабильности появятся через терпение.",
-            "Ваша надежность поможет в создании прочной финансовой основы."
-        ],
-        "health": [
-            "Обратите внимание на питание и отдых. Время для восстановления сил.",
-            "Физические нагрузки принесут пользу. Займитесь спортом.",
-            "Время для создания здоровых привычек. Ваша дисциплина поможет.",
-            "Душевное равновесие важно для физического здоровья.",
-            "Новые методы оздоровления могут принести отличные результаты.",
-            "Сегодняшний день благоприятен для начала диеты или тренировок.",
-            "Будьте внимательны к своему телу, оно подскажет, что ему нужно.",
-            "Ваша энергия сегодня на высоте, используйте это для активного отдыха.",
-            "Время для медитации и расслабления. Найдите время для себя.",
-            "Возможно, вы найдете новый способ улучшить свое самочувствие.",
-            "Новые возможности для укрепления здоровья появятся через домашние процедуры.",
-            "Время для создания комфортной среды для отдыха и восстановления.",
-            "Ваша терпеливость поможет в поддержании здорового образа жизни.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша практичность поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для занятий спортом появятся через друзей.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша организованность поможет в планировании здорового образа жизни.",
-            "Новые возможности для релаксации появятся через домашние процедуры.",
-            "Ваша надежность поможет в поддержании регулярных здоровых привычек."
-        ],
-        "general": [
-            "День стабильности и комфорта. Цените то, что имеете.",
-            "Ваша надежность - источник силы для окружающих.",
-            "Время для создания уюта и гармонии в доме.",
-            "Терпение и настойчивость помогут в достижении любых целей.",
-            "Стабильность в жизни принесет душевное спокойствие.",
-            "Сегодняшний день благоприятен для планирования будущего.",
-            "Будьте благодарны за то, что имеете, и работайте над улучшением.",
-            "Ваша практичность поможет в решении повседневных задач.",
-            "Время для заботы о близких и создания семейного уюта.",
-            "Ваша надежность - основа крепких отношений с окружающими.",
-            "Новые возможности для стабильности появятся через терпение.",
-            "Время для создания прочной основы для будущего развития.",
-            "Ваша практичность поможет в решении любых жизненных вопросов.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Ваша организованность поможет в повышении качества жизни.",
-            "Новые возможности для комфорта появятся через домашние дела.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша терпеливость поможет в преодолении любых жизненных трудностей.",
-            "Новые возможности для гармонии появятся через создание уюта.",
-            "Ваша надежность и преданность будут высоко оценены окружающими."
-        ],
-        "advice": [
-            "Проявите гибкость в принятии решений, но не забывайте про стабильность.",
-            "Ваша надежность - это сила, но иногда нужна спонтанность.",
-            "Не бойтесь изменений, но делайте их постепенно и обдуманно.",
-            "Терпение - это добродетель, но не забывайте про активность.",
-            "Баланс между стабильностью и новизной важен для роста.",
-            "Будьте открыты новому опыту, но не забывайте про свои ценности.",
-            "Ваша практичность - это сила, но не забывайте про мечты.",
-            "Не бойтесь просить о помощи, если это необходимо.",
-            "Время для саморефлексии и анализа своих потребностей.",
-            "Доверяйте себе и своим решениям, но будьте готовы к компромиссам.",
-            "Ваша терпеливость - это дар, но используйте её мудро.",
-            "Время для развития гибкости и адаптивности к изменениям.",
-            "Ваша практичность - это сила, но не забывайте про творчество.",
-            "Баланс между комфортом и ростом важен для развития.",
-            "Ваша надежность - это достоинство, но иногда нужна спонтанность.",
-            "Время для развития открытости к новым возможностям.",
-            "Ваша организованность - это сила, но не забывайте про гибкость.",
-            "Баланс между стабильностью и изменениями важен для прогресса.",
-            "Ваша преданность - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Возможность укрепить финансовое положение.",
-            "Время для инвестиций в недвижимость или стабильные активы.",
-            "Ваша практичность поможет в выборе правильных возможностей.",
-            "Семейные связи откроют новые возможности для роста.",
-            "Время для создания прочной основы для будущего.",
-            "Новые возможности для заработка через практические навыки.",
-            "Возможности для укрепления отношений с близкими.",
-            "Ваша надежность поможет в установлении долгосрочных партнерств.",
-            "Время для создания уютного дома и семейного счастья.",
-            "Интуиция поможет в выборе стабильных и надежных возможностей.",
-            "Новые возможности для стабильного дохода появятся через терпение.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша практичность поможет в выборе подходящих возможностей.",
-            "Новые возможности для карьерного роста появятся через упорный труд.",
-            "Время для создания надежной основы для будущего развития.",
-            "Ваша организованность поможет в планировании долгосрочных целей.",
-            "Новые возможности для комфорта появятся через домашние дела.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Ваша терпеливость поможет в достижении любых поставленных целей.",
-            "Новые возможности для стабильности появятся через практические навыки."
-        ]
-    }
-}
-
-# 3. БЛИЗНЕЦЫ - Коммуникация, любознательность, гибкость
-GEMINI_PREDICTIONS = {
-    "sign": "Близнецы",
-    "predictions": {
-        "love": [
-            "Общение принесет удовольствие. Не бойтесь проявлять инициативу в знакомствах.",
-            "Время для интересных разговоров и новых знакомств. Ваша коммуникабельность - ваш козырь.",
-            "Новые знакомства через общение и социальные сети принесут радость.",
-            "Ваша любознательность и интеллект привлекают интересных людей.",
-            "Время для романтических разговоров и обмена идеями с партнером.",
-            "Ваша гибкость поможет в решении любых проблем в отношениях.",
-            "Новые возможности для любви появятся через общение и знакомства.",
-            "Время для проявления внимания и заботы к близким людям.",
-            "Ваша коммуникабельность поможет в укреплении существующих отношений.",
-            "Время для планирования совместных мероприятий и развлечений.",
-            "Новые знакомства через учебу или работу принесут интересные возможности.",
-            "Время для проявления творчества и оригинальности в отношениях.",
-            "Ваша любознательность поможет в изучении потребностей партнера.",
-            "Время для создания атмосферы легкости и веселья в отношениях.",
-            "Ваша гибкость поможет в адаптации к потребностям партнера.",
-            "Новые возможности для романтики появятся через общение и знакомства.",
-            "Время для проявления юмора и позитивного настроения в отношениях.",
-            "Ваша коммуникабельность поможет в решении любых конфликтов.",
-            "Время для инвестиций в общение и развитие отношений.",
-            "Ваша любознательность и интеллект будут высоко оценены партнером."
-        ],
-        "career": [
-            "Обучение и коммуникация. Новые знания откроют двери.",
-            "Возможности для работы в сфере коммуникаций или образования.",
-            "Ваша любознательность поможет в изучении новых областей.",
-            "Сетевые связи откроют множество интересных возможностей.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Новые знакомства могут привести к интересным проектам.",
-            "Возможности для укрепления финансового положения.",
-            "Ваша эмпатия поможет в установлении глубоких связей.",
-            "Время для создания уютной атмосферы дома.",
-            "Интуиция поможет в выборе правильных возможностей.",
-            "Новые возможности для карьерного роста появятся через общение.",
-            "Время для развития навыков коммуникации и презентации.",
-            "Ваша любознательность поможет в изучении новых технологий.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша гибкость поможет в адаптации к новым условиям работы.",
-            "Новые возможности для творческой работы появятся через знакомства.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша коммуникабельность поможет в установлении деловых связей.",
-            "Новые возможности для самореализации появятся через общение.",
-            "Ваша любознательность и интеллект помогут в достижении любых карьерных целей."
-        ],
-        "finance": [
-            "Время для изучения новых способов заработка через общение.",
-            "Ваша коммуникабельность поможет в поиске новых источников дохода.",
-            "Новые возможности для заработка появятся через знакомства и связи.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша любознательность поможет в изучении финансовых инструментов.",
-            "Новые возможности для заработка через творчество или хобби.",
-            "Время для создания системы управления финансами.",
-            "Ваша гибкость поможет в адаптации к изменяющимся финансовым условиям.",
-            "Новые возможности для заработка появятся через общение и знакомства.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Ваша коммуникабельность поможет в поиске выгодных предложений.",
-            "Время для изучения новых способов инвестирования и сбережения.",
-            "Ваша любознательность поможет в изучении финансовых рынков.",
-            "Новые возможности для заработка через социальные сети или интернет.",
-            "Время для создания дополнительных источников дохода.",
-            "Ваша гибкость поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через творческие проекты.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша коммуникабельность поможет в поиске новых возможностей для заработка.",
-            "Время для создания системы пассивного дохода и инвестиций."
-        ],
-        "health": [
-            "Время для занятий, которые сочетают физическую активность с общением.",
-            "Ваша любознательность поможет в изучении новых методов оздоровления.",
-            "Новые возможности для занятий спортом появятся через знакомства.",
-            "Время для создания системы здорового образа жизни.",
-            "Ваша гибкость поможет в выборе подходящих физических нагрузок.",
-            "Новые возможности для укрепления здоровья появятся через общение.",
-            "Время для изучения новых методов релаксации и снятия стресса.",
-            "Ваша коммуникабельность поможет в поиске партнеров для занятий спортом.",
-            "Новые возможности для оздоровления появятся через групповые занятия.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша любознательность поможет в изучении новых способов поддержания здоровья.",
-            "Время для участия в групповых занятиях спортом или фитнесом.",
-            "Ваша гибкость поможет в адаптации к новым видам физической активности.",
-            "Новые возможности для занятий спортом появятся через друзей.",
-            "Время для создания системы регулярных физических упражнений.",
-            "Ваша коммуникабельность поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через общение.",
-            "Время для изучения новых способов поддержания психического здоровья.",
-            "Ваша любознательность поможет в освоении новых видов спорта.",
-            "Время для создания баланса между физической активностью и общением."
-        ],
-        "general": [
-            "День общения и новых знакомств. Будьте открыты новым возможностям.",
-            "Ваша коммуникабельность поможет в решении любых вопросов.",
-            "Время для изучения нового и расширения кругозора.",
-            "Новые знакомства принесут интересные возможности.",
-            "Время для участия в общественных мероприятиях и событиях.",
-            "Ваша любознательность поможет в изучении новых областей.",
-            "Время для проявления творчества и оригинальности.",
-            "Новые возможности для роста появятся через общение.",
-            "Время для инвестиций в образование и саморазвитие.",
-            "Ваша гибкость поможет в адаптации к новым условиям.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша коммуникабельность поможет в установлении важных связей.",
-            "Время для проявления юмора и позитивного настроения.",
-            "Новые возможности для путешествий появятся через знакомства.",
-            "Время для изучения новых языков или культур.",
-            "Ваша любознательность поможет в освоении новых навыков.",
-            "Время для создания атмосферы легкости и веселья.",
-            "Новые возможности для личностного роста появятся через общение.",
-            "Время для проявления лучших качеств и достижения новых высот."
-        ],
-        "advice": [
-            "Развивайте терпение, но не забывайте про активность в общении.",
-            "Ваша гибкость - это сила, но иногда нужна стабильность.",
-            "Не распыляйтесь на слишком много дел одновременно. Сосредоточьтесь на главном.",
-            "Информация - это сила, но важно уметь её фильтровать.",
-            "Баланс между общением и уединением важен для душевного равновесия.",
-            "Будьте открыты новым идеям, но не забывайте про свои принципы.",
-            "Ваша любознательность - это дар, но не забывайте про глубину.",
-            "Не бойтесь просить о помощи, если это необходимо.",
-            "Время для саморефлексии и анализа своих потребностей.",
-            "Доверяйте себе и своим решениям, но будьте готовы к изменениям.",
-            "Ваша коммуникабельность - это сила, но используйте её мудро.",
-            "Время для развития глубины и концентрации в общении.",
-            "Ваша гибкость - это дар, но не забывайте про постоянство.",
-            "Баланс между поверхностностью и глубиной важен для роста.",
-            "Ваша любознательность - это достоинство, но иногда нужна сосредоточенность.",
-            "Время для развития терпения и настойчивости в достижении целей.",
-            "Ваша коммуникабельность - это сила, но не забывайте про качество общения.",
-            "Баланс между количеством и качеством связей важен для гармонии.",
-            "Ваша гибкость - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в общении и отношениях."
-        ],
-        "opportunities": [
-            "Новые возможности для обучения и развития появятся через общение.",
-            "Время для участия в образовательных программах и курсах.",
-            "Ваша коммуникабельность поможет в установлении важных связей.",
-            "Новые знакомства откроют двери для интересных проектов.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для творческой работы появятся через знакомства.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша любознательность поможет в изучении новых областей.",
-            "Новые возможности для путешествий появятся через друзей.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через общение.",
-            "Время для развития навыков презентации и публичных выступлений.",
-            "Ваша гибкость поможет в адаптации к новым возможностям.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для участия в профессиональных сообществах и ассоциациях.",
-            "Ваша коммуникабельность поможет в поиске новых возможностей.",
-            "Новые возможности для заработка появятся через социальные сети.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша любознательность поможет в освоении новых областей деятельности.",
-            "Новые возможности для личностного роста появятся через общение и обучение."
-        ]
-    }
-}
-
-# 4. РАК - Эмоциональность, интуиция, забота
-CANCER_PREDICTIONS = {
-    "sign": "Рак",
-    "predictions": {
-        "love": [
-            "Время для проявления заботы и нежности к близким людям.",
-            "Ваша интуиция поможет в понимании потребностей партнера.",
-            "Семейные ценности и традиции укрепят ваши отношения.",
-            "Время для создания уютной и романтической атмосферы дома.",
-            "Ваша эмоциональность поможет в создании глубоких связей.",
-            "Новые возможности для любви появятся через заботу о других.",
-            "Время для проявления материнской/отцовской заботы в отношениях.",
-            "Ваша чувствительность поможет в понимании чувств партнера.",
-            "Время для планирования семейного будущего с любимым человеком.",
-            "Ваша преданность и верность будут высоко оценены партнером.",
-            "Новые знакомства через семью или близких друзей принесут радость.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша интуиция подскажет правильный момент для важных решений в любви.",
-            "Время для создания семейного уюта и гармонии.",
-            "Ваша эмоциональная глубина поможет в укреплении отношений.",
-            "Новые возможности для романтики появятся через домашние дела.",
-            "Время для проявления благодарности и любви к близким.",
-            "Ваша заботливость создаст прочную основу для долгосрочных отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша преданность и верность будут высоко оценены партнером."
-        ],
-        "career": [
-            "Время для работы в сфере заботы о людях или образования.",
-            "Ваша интуиция поможет в принятии правильных профессиональных решений.",
-            "Новые возможности для карьерного роста появятся через заботу о других.",
-            "Время для развития навыков эмпатии и понимания людей.",
-            "Ваша чувствительность поможет в работе с людьми.",
-            "Новые возможности для заработка появятся через домашние дела.",
-            "Время для создания комфортной рабочей атмосферы.",
-            "Ваша заботливость поможет в установлении доверительных отношений с коллегами.",
-            "Новые возможности для карьерного роста появятся через семью.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша интуиция поможет в выборе подходящих возможностей.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша эмоциональная глубина поможет в понимании клиентов или коллег.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи в работе.",
-            "Ваша заботливость поможет в создании позитивной рабочей атмосферы.",
-            "Новые возможности для карьерного роста появятся через семью и близких.",
-            "Время для инвестиций в отношения с коллегами и начальством.",
-            "Ваша преданность поможет в создании долгосрочных профессиональных связей.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для создания системы сбережений и накоплений.",
-            "Ваша интуиция поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через заботу о других.",
-            "Время для инвестиций в семью и близких людей.",
-            "Ваша заботливость поможет в планировании семейного бюджета.",
-            "Новые возможности для стабильного дохода появятся через домашние дела.",
-            "Время для создания финансовой подушки безопасности для семьи.",
-            "Ваша интуиция подскажет правильный момент для инвестиций.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для инвестиций в образование или профессиональное развитие.",
-            "Ваша заботливость поможет в создании системы финансовой поддержки семьи.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Ваша интуиция поможет в выборе подходящих финансовых инструментов.",
-            "Новые возможности для заработка появятся через заботу о других.",
-            "Время для создания системы финансовой помощи близким.",
-            "Ваша заботливость поможет в планировании долгосрочных финансовых целей.",
-            "Новые возможности для стабильного дохода появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша преданность поможет в создании прочной финансовой основы.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для создания комфортной среды для отдыха и восстановления.",
-            "Ваша интуиция поможет в понимании потребностей вашего тела.",
-            "Новые возможности для укрепления здоровья появятся через домашние процедуры.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша заботливость поможет в создании системы здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через семью.",
-            "Время для создания системы мониторинга здоровья и самочувствия.",
-            "Ваша интуиция подскажет правильный момент для обращения к врачу.",
-            "Новые возможности для оздоровления появятся через заботу о других.",
-            "Время для изучения новых способов поддержания здоровья и долголетия.",
-            "Ваша заботливость поможет в создании комфортной среды для здоровья.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Ваша интуиция поможет в выборе подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через семью.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша заботливость поможет в планировании здорового образа жизни.",
-            "Новые возможности для занятий спортом появятся через близких.",
-            "Время для инвестиций в отношения с врачами и специалистами.",
-            "Ваша преданность поможет в поддержании регулярных здоровых привычек.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День заботы и внимания к близким. Цените семейные узы.",
-            "Ваша интуиция поможет в принятии важных жизненных решений.",
-            "Время для создания уюта и гармонии в доме.",
-            "Новые возможности для роста появятся через заботу о других.",
-            "Время для проявления материнской/отцовской заботы к окружающим.",
-            "Ваша чувствительность поможет в понимании потребностей близких.",
-            "Время для инвестиций в отношения и семейные связи.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи близким.",
-            "Ваша заботливость поможет в создании позитивной атмосферы.",
-            "Новые возможности для личностного роста появятся через семью.",
-            "Время для развития навыков эмпатии и понимания людей.",
-            "Ваша интуиция поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для создания системы поддержки и помощи в жизни.",
-            "Ваша заботливость поможет в создании гармоничной атмосферы.",
-            "Новые возможности для роста появятся через семью и близких.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша преданность поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств в заботе о близких."
-        ],
-        "advice": [
-            "Развивайте уверенность в себе, но не забывайте про заботу о других.",
-            "Ваша чувствительность - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять эмоции, но не забывайте про логику.",
-            "Баланс между заботой о других и заботой о себе важен для гармонии.",
-            "Ваша интуиция - это сила, но не забывайте про анализ.",
-            "Время для развития уверенности в принятии решений.",
-            "Ваша заботливость - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между эмоциональностью и рациональностью важен для успеха.",
-            "Ваша преданность - это дар, но не забывайте про гибкость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша чувствительность - это сила, но используйте её с умом.",
-            "Время для развития уверенности в собственных силах.",
-            "Ваша интуиция - это дар, но не забывайте про логическое мышление.",
-            "Баланс между заботой о других и заботой о себе важен для роста.",
-            "Ваша эмоциональность - это достоинство, но иногда нужна сдержанность.",
-            "Время для развития навыков самозащиты и установления границ.",
-            "Ваша заботливость - это сила, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша преданность - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для заботы о других появятся в неожиданных местах.",
-            "Время для участия в волонтерских программах и благотворительности.",
-            "Ваша интуиция поможет в выборе правильных возможностей.",
-            "Новые знакомства через семью откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через заботу о других.",
-            "Время для участия в семейных мероприятиях и событиях.",
-            "Ваша заботливость поможет в установлении важных связей.",
-            "Новые возможности для самореализации появятся через семью.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через заботу о других.",
-            "Время для развития навыков работы с людьми и их потребностями.",
-            "Ваша интуиция поможет в выборе подходящих возможностей.",
-            "Новые возможности для заработка появятся через семью и близких.",
-            "Время для участия в программах поддержки и помощи.",
-            "Ваша заботливость поможет в создании новых возможностей.",
-            "Новые возможности для самореализации появятся через заботу о других.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша преданность поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через заботу о близких."
-        ]
-    }
-}
+# Данные знаков лежат в core/sign_predictions/ и строятся при первом обращении:
+# ARIES_PREDICTIONS ... LEO_PREDICTIONS и UNIVERSAL_PREDICTIONS по-прежнему
+# доступны как атрибуты модуля (PEP 562).
 
-# 5. ЛЕВ - Лидерство, творчество, щедрость
-LEO_PREDICTIONS = {
-    "sign": "Лев",
-    "predictions": {
-        "love": [
-            "Ваша харизма и обаяние привлекают внимание. Не бойтесь проявлять инициативу в любви!",
-            "Время для романтических жестов и проявления щедрости к партнеру.",
-            "Новые знакомства через творческие мероприятия принесут интересные возможности.",
-            "Ваша уверенность и оптимизм создают магнетическое притяжение.",
-            "Время для проявления заботы и внимания к близким людям.",
-            "Ваша щедрость и великодушие будут высоко оценены партнером.",
-            "Новые возможности для любви появятся через творчество и искусство.",
-            "Время для планирования романтических сюрпризов и подарков.",
-            "Ваша страсть и энтузиазм помогут в укреплении отношений.",
-            "Время для проявления лидерских качеств в отношениях.",
-            "Новые знакомства через друзей или коллег принесут радость.",
-            "Время для проявления творчества и оригинальности в отношениях.",
-            "Ваша уверенность поможет в решении любых проблем в любви.",
-            "Время для создания особенной атмосферы для романтических встреч.",
-            "Ваша щедрость поможет в создании незабываемых моментов.",
-            "Новые возможности для романтики появятся через творческие проекты.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Ваша харизма поможет в укреплении существующих отношений.",
-            "Время для инвестиций в отношения и их развитие.",
-            "Ваша страсть и энтузиазм будут высоко оценены партнером."
-        ],
-        "career": [
-            "Лидерские качества помогут в продвижении по карьерной лестнице.",
-            "Время для проявления творчества и оригинальности в работе.",
-            "Новые возможности для карьерного роста появятся через творческие проекты.",
-            "Ваша харизма поможет в установлении важных деловых связей.",
-            "Время для участия в творческих конкурсах и соревнованиях.",
-            "Новые возможности для заработка появятся через искусство и творчество.",
-            "Время для создания собственного бизнеса или творческого проекта.",
-            "Ваша уверенность поможет в решении любых профессиональных задач.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для инвестиций в профессиональное развитие и обучение.",
-            "Ваша щедрость поможет в создании позитивной рабочей атмосферы.",
-            "Время для развития навыков лидерства и управления командой.",
-            "Новые возможности для карьерного роста появятся через творческие проекты.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша харизма поможет в установлении важных профессиональных связей.",
-            "Новые возможности для заработка появятся через творчество и искусство.",
-            "Время для создания портфолио или демонстрации ваших достижений.",
-            "Ваша уверенность поможет в преодолении любых профессиональных препятствий.",
-            "Новые возможности для самореализации появятся через творческие проекты.",
-            "Время для проявления лучших качеств в профессиональной деятельности."
-        ],
-        "finance": [
-            "Время для инвестиций в творческие проекты и начинания.",
-            "Ваша щедрость поможет в создании новых источников дохода.",
-            "Новые возможности для заработка появятся через творчество и искусство.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Ваша уверенность поможет в принятии правильных финансовых решений.",
-            "Новые возможности для заработка появятся через творческие проекты.",
-            "Время для создания системы управления финансами.",
-            "Ваша харизма поможет в поиске новых возможностей для заработка.",
-            "Новые возможности для инвестиций появятся через творческие начинания.",
-            "Время для изучения новых способов заработка в творческой сфере.",
-            "Ваша щедрость поможет в создании системы финансовой поддержки.",
-            "Время для развития навыков управления финансами.",
-            "Новые возможности для заработка появятся через искусство и творчество.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша уверенность поможет в достижении любых финансовых целей.",
-            "Новые возможности для заработка появятся через творческие проекты.",
-            "Время для создания системы пассивного дохода и инвестиций.",
-            "Ваша харизма поможет в поиске новых возможностей для заработка.",
-            "Новые возможности для инвестиций появятся через творческие начинания.",
-            "Время для проявления лучших качеств в управлении финансами."
-        ],
-        "health": [
-            "Время для занятий творческими видами спорта или активностями.",
-            "Ваша уверенность поможет в достижении любых спортивных целей.",
-            "Новые возможности для укрепления здоровья появятся через творчество.",
-            "Время для создания системы здорового образа жизни.",
-            "Ваша щедрость поможет в создании позитивной атмосферы для здоровья.",
-            "Новые возможности для занятий спортом появятся через друзей.",
-            "Время для изучения новых методов поддержания здоровья и долголетия.",
-            "Ваша харизма поможет в поиске подходящих методов оздоровления.",
-            "Новые возможности для укрепления здоровья появятся через творческие проекты.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша уверенность поможет в поддержании регулярных здоровых привычек.",
-            "Время для развития навыков релаксации и снятия стресса.",
-            "Новые возможности для занятий спортом появятся через творческие мероприятия.",
-            "Время для создания системы здорового питания и режима.",
-            "Ваша щедрость поможет в создании комфортной среды для здоровья.",
-            "Новые возможности для укрепления здоровья появятся через творчество.",
-            "Время для участия в спортивных мероприятиях или соревнованиях.",
-            "Ваша харизма поможет в поиске партнеров для занятий спортом.",
-            "Новые возможности для оздоровления появятся через творческие проекты.",
-            "Время для проявления лучших качеств в заботе о собственном здоровье."
-        ],
-        "general": [
-            "День творчества и самовыражения. Не бойтесь проявлять свою индивидуальность.",
-            "Ваша харизма поможет в решении любых жизненных вопросов.",
-            "Время для проявления лидерских качеств в повседневной жизни.",
-            "Новые возможности для роста появятся через творчество и искусство.",
-            "Время для участия в творческих мероприятиях и событиях.",
-            "Ваша уверенность поможет в достижении любых поставленных целей.",
-            "Время для проявления щедрости и великодушия к окружающим.",
-            "Новые возможности для самореализации появятся через творческие проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Ваша харизма поможет в установлении важных связей.",
-            "Новые возможности для личностного роста появятся через творчество.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша щедрость поможет в создании позитивной атмосферы.",
-            "Новые возможности для самореализации появятся через искусство.",
-            "Время для проявления творчества и оригинальности в жизни.",
-            "Ваша уверенность поможет в преодолении любых жизненных препятствий.",
-            "Новые возможности для роста появятся через творческие проекты.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Ваша харизма поможет в создании прочной основы для будущего.",
-            "Время для проявления лучших качеств и достижения новых высот."
-        ],
-        "advice": [
-            "Развивайте скромность, но не забывайте про уверенность в себе.",
-            "Ваша щедрость - это дар, но используйте её мудро.",
-            "Не бойтесь проявлять лидерство, но не забывайте про сотрудничество.",
-            "Баланс между уверенностью и скромностью важен для гармонии.",
-            "Ваша харизма - это сила, но не забывайте про глубину.",
-            "Время для развития эмпатии и понимания чувств других.",
-            "Ваша щедрость - это достоинство, но не забывайте про собственные потребности.",
-            "Баланс между лидерством и сотрудничеством важен для успеха.",
-            "Ваша уверенность - это дар, но не забывайте про гибкость.",
-            "Время для развития мудрости и зрелости в отношениях.",
-            "Ваша харизма - это сила, но используйте её с умом.",
-            "Время для развития навыков слушания и понимания других.",
-            "Ваша щедрость - это дар, но не забывайте про собственные интересы.",
-            "Баланс между жертвенностью и самосохранением важен для здоровья.",
-            "Ваша уверенность - это достоинство, но иногда нужна сдержанность.",
-            "Время для развития навыков компромисса и дипломатии.",
-            "Ваша харизма - это сила, но не забывайте про качество общения.",
-            "Баланс между количеством и качеством связей важен для гармонии.",
-            "Ваша щедрость - это дар, но не забывайте про собственные потребности.",
-            "Время для развития мудрости и зрелости в принятии решений."
-        ],
-        "opportunities": [
-            "Новые возможности для творчества и самовыражения появятся в неожиданных местах.",
-            "Время для участия в творческих конкурсах и соревнованиях.",
-            "Ваша харизма поможет в установлении важных связей.",
-            "Новые знакомства через искусство откроют интересные проекты.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые возможности для заработка появятся через творчество и искусство.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Ваша уверенность поможет в выборе правильных возможностей.",
-            "Новые возможности для самореализации появятся через творческие проекты.",
-            "Время для инвестиций в отношения и профессиональные связи.",
-            "Новые возможности для карьерного роста появятся через творчество.",
-            "Время для развития навыков лидерства и управления командой.",
-            "Ваша щедрость поможет в создании новых возможностей.",
-            "Новые возможности для заработка появятся через искусство и творчество.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша харизма поможет в поиске новых возможностей.",
-            "Новые возможности для самореализации появятся через творческие проекты.",
-            "Время для инвестиций в образование или новые навыки.",
-            "Ваша уверенность поможет в создании долгосрочных возможностей.",
-            "Новые возможности для личностного роста появятся через творчество и искусство."
-        ]
-    }
-}
+_LAZY_NAMES = (
+    "ARIES_PREDICTIONS", "TAURUS_PREDICTIONS", "GEMINI_PREDICTIONS",
+    "CANCER_PREDICTIONS", "LEO_PREDICTIONS", "UNIVERSAL_PREDICTIONS",
+)
 
-# Продолжение для остальных 7 знаков зодиака...
-# (ДЕВА, ВЕСЫ, СКОРПИОН, СТРЕЛЕЦ, КОЗЕРОГ, ВОДОЛЕЙ, РЫБЫ)
 
-# =============================================================================
-# УНИВЕРСАЛЬНАЯ БАЗА ДАННЫХ (40% вероятность)
-# =============================================================================
-
-UNIVERSAL_PREDICTIONS = {
-    "sign": "universal",
-    "predictions": {
-        "love": [
-            "Сегодня звезды благоприятствуют романтическим встречам. Будьте открыты новым знакомствам.",
-            "Время для искренних разговоров с близкими. Ваша открытость будет оценена по достоинству.",
-            "Романтическая энергия в воздухе. Не бойтесь проявлять свои чувства.",
-            "Старые связи могут возобновиться в неожиданный момент. Будьте готовы к сюрпризам.",
-            "Новые знакомства через общие интересы принесут интересные возможности.",
-            "Время для романтических жестов и проявления заботы о партнере.",
-            "Семейные узы укрепляются. Цените моменты близости с родными.",
-            "Ваша харизма привлекает внимание противоположного пола. Используйте это время.",
-            "Глубокие разговоры помогут укрепить существующие отношения.",
-            "Спонтанные романтические поступки принесут неожиданные результаты.",
-            "Время для прощения и примирения. Старые обиды могут быть забыты.",
-            "Новые знакомства через друзей или коллег принесут радость.",
-            "Романтическое путешествие или поездка может укрепить отношения.",
-            "Ваша интуиция подскажет правильный момент для признания в любви.",
-            "Время для создания романтической атмосферы дома.",
-            "Неожиданная встреча может изменить вашу личную жизнь.",
-            "Время для проявления нежности и заботы о близких.",
-            "Романтические письма или сообщения принесут радость.",
-            "Время для планирования совместного будущего с партнером.",
-            "Ваша искренность в отношениях будет высоко оценена.",
-            "Время для романтических сюрпризов и неожиданных жестов.",
-            "Новые знакомства через социальные сети или приложения принесут интересные встречи.",
-            "Время для укрепления эмоциональной связи с партнером.",
-            "Ваша чувствительность поможет в понимании потребностей близких.",
-            "Время для романтических ужинов и особенных моментов.",
-            "Неожиданное признание в любви может изменить вашу жизнь.",
-            "Время для проявления заботы и внимания к партнеру.",
-            "Новые знакомства через хобби или увлечения принесут радость.",
-            "Время для планирования романтического отпуска или поездки.",
-            "Ваша открытость к новому опыту принесет интересные встречи.",
-            "Время для проявления благодарности и любви к близким.",
-            "Новые знакомства через работу или учебу принесут радость.",
-            "Время для создания особенных воспоминаний с партнером.",
-            "Ваша интуиция поможет в выборе правильного момента для важных решений.",
-            "Время для проявления терпения и понимания в отношениях.",
-            "Новые знакомства через общие друзья принесут интересные возможности.",
-            "Время для романтических подарков и сюрпризов.",
-            "Ваша эмпатия поможет в понимании чувств партнера.",
-            "Время для планирования совместных проектов и целей.",
-            "Неожиданная встреча может привести к серьезным отношениям."
-        ],
-        "career": [
-            "Новые возможности для карьерного роста появятся неожиданно. Будьте готовы к изменениям.",
-            "Ваша инициативность будет замечена начальством. Не бойтесь предлагать новые идеи.",
-            "Время для обучения и развития профессиональных навыков.",
-            "Сетевые связи помогут в продвижении по карьерной лестнице.",
-            "Творческий подход к работе принесет отличные результаты.",
-            "Время для участия в профессиональных мероприятиях и конференциях.",
-            "Ваша настойчивость поможет в решении сложных рабочих задач.",
-            "Новые проекты потребуют вашего внимания и креативности.",
-            "Время для поиска дополнительных источников дохода.",
-            "Ваша репутация в профессиональной сфере укрепится.",
-            "Время для инвестиций в собственное профессиональное развитие.",
-            "Новые технологии помогут оптимизировать рабочий процесс.",
-            "Время для создания собственного бизнеса или побочного проекта.",
-            "Ваша коммуникабельность поможет в установлении важных деловых связей.",
-            "Время для участия в конкурсах и соревнованиях в вашей области.",
-            "Новые знания и навыки откроют двери для карьерного роста.",
-            "Время для наставничества или обучения других.",
-            "Ваша креативность поможет в решении нестандартных задач.",
-            "Время для работы в команде над амбициозными проектами.",
-            "Ваша трудолюбие будет вознаграждено признанием и продвижением.",
-            "Время для поиска новых возможностей в смежных областях.",
-            "Ваша экспертность в определенной области будет высоко оценена.",
-            "Время для участия в профессиональных ассоциациях и сообществах.",
-            "Новые знакомства в профессиональной сфере принесут интересные возможности.",
-            "Время для публикации статей или выступлений на конференциях.",
-            "Ваша способность к адаптации поможет в новых условиях работы.",
-            "Время для изучения новых технологий и инструментов.",
-            "Новые возможности для работы удаленно или в гибридном формате.",
-            "Время для создания портфолио или демонстрации ваших достижений.",
-            "Ваша лидерская способность поможет в управлении проектами.",
-            "Время для поиска ментора или наставника в вашей области.",
-            "Новые возможности для работы в международных компаниях.",
-            "Время для развития навыков презентации и публичных выступлений.",
-            "Ваша способность к решению проблем будет востребована.",
-            "Время для участия в профессиональных конкурсах и хакатонах.",
-            "Новые возможности для работы в стартапах или инновационных проектах.",
-            "Время для изучения новых языков программирования или инструментов.",
-            "Ваша способность к командной работе будет высоко оценена.",
-            "Время для создания личного бренда в профессиональной сфере.",
-            "Новые возможности для работы в сфере консалтинга или фриланса."
-        ],
-        "finance": [
-            "Финансовая стабильность поможет в реализации долгосрочных планов.",
-            "Время для разумных инвестиций и планирования бюджета.",
-            "Новые источники дохода могут появиться в неожиданных местах.",
-            "Ваша практичность поможет в принятии правильных финансовых решений.",
-            "Время для накопления и создания финансовой подушки безопасности.",
-            "Инвестиции в образование или новые навыки принесут долгосрочную прибыль.",
-            "Время для консультации с финансовыми экспертами.",
-            "Ваша дисциплина в тратах поможет достичь финансовых целей.",
-            "Время для поиска дополнительных источников заработка.",
-            "Финансовая грамотность поможет в принятии важных решений.",
-            "Время для инвестиций в недвижимость или другие стабильные активы.",
-            "Ваша терпеливость в финансовых вопросах окупится.",
-            "Время для создания долгосрочного финансового плана.",
-            "Новые возможности для заработка появятся через хобби или увлечения.",
-            "Время для изучения новых способов инвестирования.",
-            "Ваша осторожность в финансовых решениях защитит от рисков.",
-            "Время для консультации с налоговыми специалистами.",
-            "Ваша организованность поможет в ведении семейного бюджета.",
-            "Время для инвестиций в здоровье и саморазвитие.",
-            "Финансовая стабильность принесет душевное спокойствие.",
-            "Время для изучения новых финансовых инструментов и технологий.",
-            "Новые возможности для пассивного дохода появятся в неожиданных местах.",
-            "Время для создания резервного фонда на случай непредвиденных обстоятельств.",
-            "Ваша способность к анализу поможет в выборе правильных инвестиций.",
-            "Время для изучения основ финансового планирования и управления рисками.",
-            "Новые возможности для заработка через онлайн-платформы и фриланс.",
-            "Время для инвестиций в собственное здоровье и благополучие.",
-            "Ваша способность к экономии поможет в достижении финансовых целей.",
-            "Время для изучения новых способов сбережения и накопления.",
-            "Новые возможности для заработка через творчество или хобби.",
-            "Время для создания диверсифицированного инвестиционного портфеля.",
-            "Ваша способность к планированию поможет в достижении финансовой независимости.",
-            "Время для изучения новых способов заработка в цифровой экономике.",
-            "Новые возможности для инвестиций в экологически чистые технологии.",
-            "Время для создания системы автоматических сбережений.",
-            "Ваша способность к адаптации поможет в изменяющихся экономических условиях.",
-            "Время для изучения новых способов защиты от инфляции.",
-            "Новые возможности для заработка через социальные сети и контент.",
-            "Время для создания долгосрочной стратегии накопления капитала."
-        ],
-        "health": [
-            "Время для создания здоровых привычек и регулярного режима дня.",
-            "Физическая активность поможет поддерживать отличную форму и настроение.",
-            "Время для занятий спортом или другими активными видами деятельности.",
-            "Правильное питание и достаточный отдых важны для поддержания здоровья.",
-            "Время для профилактических медицинских осмотров.",
-            "Медитация или другие практики релаксации помогут снять стресс.",
-            "Время для занятий на свежем воздухе и общения с природой.",
-            "Регулярные физические упражнения укрепят иммунитет.",
-            "Время для занятий йогой или другими оздоровительными практиками.",
-            "Достаточный сон и отдых важны для восстановления сил.",
-            "Время для занятий танцами или другими социальными видами спорта.",
-            "Позитивное мышление и оптимизм укрепляют здоровье.",
-            "Время для занятий плаванием или другими водными видами спорта.",
-            "Регулярные прогулки на свежем воздухе улучшат самочувствие.",
-            "Время для занятий командными видами спорта.",
-            "Здоровое питание и отказ от вредных привычек укрепят организм.",
-            "Время для занятий единоборствами или другими боевыми искусствами.",
-            "Регулярные медицинские осмотры помогут предотвратить проблемы со здоровьем.",
-            "Время для занятий велоспортом или другими циклическими видами спорта.",
-            "Баланс между работой и отдыхом важен для поддержания здоровья.",
-            "Время для изучения новых способов поддержания здоровья и долголетия.",
-            "Новые возможности для занятий спортом появятся в неожиданных местах.",
-            "Время для создания сбалансированного рациона питания.",
-            "Ваша способность к самодисциплине поможет в поддержании здорового образа жизни.",
-            "Время для изучения новых методов релаксации и снятия стресса.",
-            "Новые возможности для занятий фитнесом или спортом появятся через друзей.",
-            "Время для создания комфортной среды для отдыха и восстановления.",
-            "Ваша способность к адаптации поможет в выборе подходящих физических нагрузок.",
-            "Время для изучения новых способов укрепления иммунитета.",
-            "Новые возможности для занятий спортом на природе появятся в хорошую погоду.",
-            "Время для создания системы мониторинга здоровья и самочувствия.",
-            "Ваша способность к планированию поможет в создании здорового распорядка дня.",
-            "Время для изучения новых способов поддержания психического здоровья.",
-            "Новые возможности для занятий спортом в группе появятся через знакомых.",
-            "Время для создания системы здорового питания и режима приема пищи.",
-            "Ваша способность к мотивации поможет в поддержании регулярных тренировок.",
-            "Время для изучения новых способов улучшения качества сна.",
-            "Новые возможности для занятий спортом дома появятся через онлайн-платформы.",
-            "Время для создания системы профилактики заболеваний и укрепления здоровья."
-        ],
-        "general": [
-            "Сегодня звезды благоприятствуют новым начинаниям. Не бойтесь перемен.",
-            "Время для саморазвития и изучения новых навыков.",
-            "Ваша интуиция поможет в принятии важных решений.",
-            "Время для планирования будущего и постановки новых целей.",
-            "Новые возможности появятся в неожиданных местах. Будьте открыты.",
-            "Время для общения с друзьями и близкими.",
-            "Ваша креативность поможет в решении повседневных задач.",
-            "Время для путешествий и изучения новых мест.",
-            "Новые знакомства принесут интересные возможности.",
-            "Время для занятий любимыми хобби и увлечениями.",
-            "Ваша настойчивость поможет в достижении поставленных целей.",
-            "Время для размышлений и медитации.",
-            "Новые знания помогут в личном и профессиональном развитии.",
-            "Время для проявления благодарности и доброты к окружающим.",
-            "Ваша открытость новому опыту принесет неожиданные результаты.",
-            "Время для занятий творчеством и самовыражения.",
-            "Новые технологии помогут оптимизировать повседневную жизнь.",
-            "Время для занятий спортом и поддержания физической формы.",
-            "Ваша терпеливость поможет в решении сложных ситуаций.",
-            "Время для создания уюта и гармонии в доме.",
-            "Сегодня день благоприятствует новым открытиям и исследованиям.",
-            "Время для изучения новых культур и традиций.",
-            "Ваша способность к адаптации поможет в новых условиях.",
-            "Время для создания позитивной атмосферы в окружении.",
-            "Новые идеи и вдохновение придут в неожиданный момент.",
-            "Время для проявления инициативы и лидерских качеств.",
-            "Ваша способность к анализу поможет в решении сложных задач.",
-            "Время для создания системы личной эффективности и продуктивности.",
-            "Новые возможности для самореализации появятся через творчество.",
-            "Время для изучения новых языков или культур.",
-            "Ваша способность к эмпатии поможет в понимании окружающих.",
-            "Время для создания системы личного развития и роста.",
-            "Новые возможности для путешествий и изучения мира появятся неожиданно.",
-            "Время для проявления благодарности за то, что имеете.",
-            "Ваша способность к планированию поможет в достижении долгосрочных целей.",
-            "Время для изучения новых способов решения повседневных задач.",
-            "Новые возможности для саморазвития появятся через образование.",
-            "Время для создания системы мотивации и вдохновения.",
-            "Ваша способность к креативности поможет в нестандартных ситуациях."
-        ],
-        "advice": [
-            "Доверяйте своей интуиции, но не игнорируйте логику.",
-            "Не бойтесь просить помощи у близких и друзей.",
-            "Баланс между работой и отдыхом важен для успеха.",
-            "Не забывайте про собственные потребности и желания.",
-            "Открытость к новому опыту поможет в личном развитии.",
-            "Не бойтесь совершать ошибки - они учат нас.",
-            "Время для прощения и примирения с прошлым.",
-            "Не забывайте про благодарность за то, что имеете.",
-            "Терпение и настойчивость помогут в достижении целей.",
-            "Не бойтесь выходить из зоны комфорта.",
-            "Время для заботы о своем физическом и психическом здоровье.",
-            "Не забывайте про важность общения с близкими.",
-            "Творческий подход поможет в решении нестандартных задач.",
-            "Не бойтесь выражать свои чувства и эмоции.",
-            "Время для планирования и постановки реалистичных целей.",
-            "Не забывайте про важность отдыха и восстановления сил.",
-            "Позитивное мышление поможет преодолеть любые препятствия.",
-            "Не бойтесь просить совета у опытных людей.",
-            "Время для занятий тем, что приносит радость и удовлетворение.",
-            "Не забывайте про важность саморазвития и обучения.",
-            "Время для создания системы личных ценностей и приоритетов.",
-            "Не бойтесь быть уязвимыми и открытыми с близкими людьми.",
-            "Время для изучения новых способов решения проблем.",
-            "Не забывайте про важность качественного сна и отдыха.",
-            "Время для создания системы мотивации и вдохновения.",
-            "Не бойтесь экспериментировать с новыми подходами к жизни.",
-            "Время для развития навыков эмоционального интеллекта.",
-            "Не забывайте про важность физической активности и движения.",
-            "Время для создания системы личной эффективности и продуктивности.",
-            "Не бойтесь делегировать задачи и просить о помощи.",
-            "Время для изучения новых способов управления стрессом.",
-            "Не забывайте про важность регулярного самоанализа и рефлексии.",
-            "Время для создания системы личного развития и роста.",
-            "Не бойтесь менять свои планы при появлении новых возможностей.",
-            "Время для изучения новых способов коммуникации и общения.",
-            "Не забывайте про важность создания резервов и подушки безопасности.",
-            "Время для развития навыков критического мышления и анализа.",
-            "Не бойтесь быть аутентичными и оставаться верными себе."
-        ],
-        "opportunities": [
-            "Новые возможности для личного и профессионального роста появятся неожиданно.",
-            "Время для участия в образовательных программах и курсах.",
-            "Новые знакомства откроют двери для интересных проектов.",
-            "Время для инвестиций в собственное развитие и обучение.",
-            "Новые технологии помогут в решении повседневных задач.",
-            "Время для участия в конкурсах и соревнованиях.",
-            "Новые хобби и увлечения принесут радость и удовлетворение.",
-            "Время для путешествий и изучения новых культур.",
-            "Новые возможности для заработка появятся через творчество.",
-            "Время для участия в волонтерских программах.",
-            "Новые знания и навыки откроют двери для карьерного роста.",
-            "Время для создания собственного бизнеса или проекта.",
-            "Новые возможности для самореализации появятся через искусство.",
-            "Время для участия в спортивных мероприятиях.",
-            "Новые возможности для заработка появятся через интернет.",
-            "Время для участия в культурных мероприятиях и выставках.",
-            "Новые возможности для путешествий появятся через работу.",
-            "Время для участия в научных исследованиях и экспериментах.",
-            "Новые возможности для творчества появятся через сотрудничество.",
-            "Время для участия в экологических и социальных проектах.",
-            "Новые возможности для изучения языков и культур появятся через онлайн-платформы.",
-            "Время для участия в международных программах обмена и сотрудничества.",
-            "Новые возможности для заработка через фриланс и удаленную работу.",
-            "Время для участия в стартап-инкубаторах и акселераторах.",
-            "Новые возможности для саморазвития появятся через онлайн-образование.",
-            "Время для участия в профессиональных сообществах и ассоциациях.",
-            "Новые возможности для творчества появятся через социальные сети.",
-            "Время для участия в хакатонах и технологических конкурсах.",
-            "Новые возможности для путешествий появятся через программы культурного обмена.",
-            "Время для участия в исследовательских проектах и научных экспедициях.",
-            "Новые возможности для заработка через создание контента и медиа.",
-            "Время для участия в экологических инициативах и проектах устойчивого развития.",
-            "Новые возможности для самореализации появятся через благотворительность.",
-            "Время для участия в международных конференциях и симпозиумах.",
-            "Новые возможности для творчества появятся через коллаборации с другими людьми.",
-            "Время для участия в программах менторства и наставничества.",
-            "Новые возможности для заработка через создание собственных продуктов и услуг.",
-            "Время для участия в программах профессионального развития и карьерного роста.",
-            "Новые возможности для саморазвития появятся через изучение новых технологий.",
-            "Время для участия в программах культурного обмена и международного сотрудничества."
-        ]
-    }
-}
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        return get_prediction_catalog().get_by_attribute(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # =============================================================================
 # СИСТЕМА ВЫБОРА ПРЕДСКАЗАНИЙ
@@ -1129,36 +39,18 @@ def get_prediction(sign, category):
     40% - универсальные предсказания
     60% - персонализированные предсказания
     """
+    catalog = get_prediction_catalog()
     if random.random() < 0.4:  # 40% chance for universal
-        return random.choice(UNIVERSAL_PREDICTIONS["predictions"][category])
+        return random.choice(catalog.get_universal_pool(category))
     else:
-        # Получаем персонализированное предсказание для знака
-        from .remaining_zodiac_predictions import (
-            VIRGO_PREDICTIONS, LIBRA_PREDICTIONS, SCORPIO_PREDICTIONS,
-            SAGITTARIUS_PREDICTIONS, CAPRICORN_PREDICTIONS, AQUARIUS_PREDICTIONS,
-            PISCES_PREDICTIONS
-        )
-        
-        sign_predictions = {
-            "Овен": ARIES_PREDICTIONS,
-            "Телец": TAURUS_PREDICTIONS,
-            "Близнецы": GEMINI_PREDICTIONS,
-            "Рак": CANCER_PREDICTIONS,
-            "Лев": LEO_PREDICTIONS,
-            "Дева": VIRGO_PREDICTIONS,
-            "Весы": LIBRA_PREDICTIONS,
-            "Скорпион": SCORPIO_PREDICTIONS,
-            "Стрелец": SAGITTARIUS_PREDICTIONS,
-            "Козерог": CAPRICORN_PREDICTIONS,
-            "Водолей": AQUARIUS_PREDICTIONS,
-            "Рыбы": PISCES_PREDICTIONS,
-        }
+        # Получаем персонализированное предсказание для знака (строится лениво)
+        pool = catalog.get_pool(sign, category)
         
-        if sign in sign_predictions:
-            return random.choice(sign_predictions[sign]["predictions"][category])
+        if pool is not None:
+            return random.choice(pool)
         else:
             # Fallback на универсальные предсказания
-            return random.choice(UNIVERSAL_PREDICTIONS["predictions"][category])
+            return random.choice(catalog.get_universal_pool(category))
 
 # Функции для каждой категории
 def get_love_prediction(sign):
@@ -3,28 +3,84 @@
 """
 ZODI - Система персонального профиля пользователя
 Сохранение и загрузка данных пользователя с шифрованием
+
+Избранное и история совместимости при автосохранении дописываются в
+зашифрованный журнал (см. profile_journal); остальные изменения и
+компакция журнала сохраняют профиль целиком.
+
+Отложенное сохранение (save_delay > 0). Изменения личных данных и
+настроек помечают профиль как изменённый; фоновый таймер сохраняет его
+один раз не позже чем через save_delay секунд после первого
+несохранённого изменения, объединяя все изменения за это время.
+Гарантии:
+- запись в журнал (избранное, история) попадает на диск сразу;
+- остальные изменения на диске не позже чем через save_delay секунд,
+  после flush() или при нормальном завершении интерпретатора;
+- при аварийном завершении теряются только изменения последних
+  save_delay секунд; файл профиля при этом остаётся целым (атомарная запись).
+save_delay = 0 - прежнее поведение: сохранение при каждом изменении.
 """
 
+import atexit
 import json
 import os
+import threading
+import weakref
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 try:
     from .encryption import EncryptionManager
+    from .atomic_write import atomic_write_text, backup_path, read_first_valid
+    from .profile_journal import ProfileJournal
+    from .bounded_history import BoundedHistory, COMPATIBILITY_FIELDS, FAVORITE_FIELDS
 except ImportError:
     from encryption import EncryptionManager
+    from atomic_write import atomic_write_text, backup_path, read_first_valid
+    from profile_journal import ProfileJournal
+    from bounded_history import BoundedHistory, COMPATIBILITY_FIELDS, FAVORITE_FIELDS
+
+# Сколько прошлых удачных версий профиля хранить рядом с файлом
+PROFILE_BACKUPS = 1
+
+FAVORITES_LIMIT = 50
+HISTORY_LIMIT = 100
+
+# Списки профиля в кольцевых буферах: ключ -> (лимит, поля записи)
+HISTORY_KEYS = {
+    'favorite_predictions': (FAVORITES_LIMIT, FAVORITE_FIELDS),
+    'compatibility_history': (HISTORY_LIMIT, COMPATIBILITY_FIELDS),
+}
+
+# Окно объединения изменений при автосохранении, секунды
+DEFAULT_SAVE_DELAY = 1.0
+
+
+def _flush_at_exit(profile_ref):
+    """Сохранить несохранённые изменения при выходе из интерпретатора"""
+    profile = profile_ref()
+    if profile is not None:
+        profile.flush()
+
 
 class UserProfile:
     """Класс для управления персональным профилем пользователя"""
     
-    def __init__(self):
+    def __init__(self, save_delay: float = DEFAULT_SAVE_DELAY, data_dir: Optional[str] = None):
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        
         # Создаем директорию data если не существует
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
         os.makedirs(data_dir, exist_ok=True)
         
         self.profile_file = os.path.join(data_dir, 'user_profile.json')
         self.encryption_manager = EncryptionManager()
+        self.journal = ProfileJournal(os.path.join(data_dir, 'user_profile.journal'),
+                                      self.encryption_manager)
         
         # Структура данных пользователя
         self.user_data = {
@@ -38,8 +94,8 @@ class UserProfile:
             'zodiac_sign': '',
             'element': '',
             'ruling_planet': '',
-            'favorite_predictions': [],
-            'compatibility_history': [],
+            'favorite_predictions': BoundedHistory(FAVORITES_LIMIT, FAVORITE_FIELDS),
+            'compatibility_history': BoundedHistory(HISTORY_LIMIT, COMPATIBILITY_FIELDS),
             'settings': {
                 'notifications': True,
                 'theme': 'dark',
@@ -54,19 +110,33 @@ class UserProfile:
         
         # Загружаем существующий профиль или создаем новый
         self.load_profile()
+        atexit.register(_flush_at_exit, weakref.ref(self))
     
     def load_profile(self) -> bool:
-        """Загрузить профиль из файла"""
+        """Загрузить профиль из файла (при повреждении - из резервной копии)
+
+        После снимка применяются записи журнала, которых в нём ещё нет.
+        """
+        loaded = self._load_snapshot()
+        if not loaded:
+            # Если загрузка не удалась, создаем новый профиль
+            self._initialize_new_profile()
+        journal_seq = self.user_data.pop('journal_seq', 0)
+        self._replay_journal(journal_seq)
+        return loaded
+    
+    def _load_snapshot(self) -> bool:
+        """Загрузить снимок профиля"""
         try:
-            if os.path.exists(self.profile_file):
+            if os.path.exists(self.profile_file) or os.path.exists(backup_path(self.profile_file)):
                 print(f"Загрузка профиля из {self.profile_file}")
-                with open(self.profile_file, 'r', encoding='utf-8') as f:
-                    encrypted_data = f.read()
-                
-                # Расшифровываем данные
-                decrypted_data = self.encryption_manager.decrypt(encrypted_data)
-                if decrypted_data:
-                    self.user_data = json.loads(decrypted_data)
+                user_data, source = read_first_valid(
+                    self.profile_file, PROFILE_BACKUPS, self._decode_profile
+                )
+                if user_data is not None:
+                    self.user_data = self._restore_histories(user_data)
+                    if source != self.profile_file:
+                        print(f"Профиль восстановлен из резервной копии {source}")
                     print("Профиль успешно загружен")
                     return True
                 else:
@@ -75,28 +145,128 @@ class UserProfile:
                 print("Файл профиля не найден, создается новый")
         except Exception as e:
             print(f"Ошибка загрузки профиля: {e}")
-        
-        # Если загрузка не удалась, создаем новый профиль
-        self._initialize_new_profile()
         return False
     
+    def _replay_journal(self, journal_seq: int):
+        """Применить записи журнала с номером больше journal_seq"""
+        replayed = 0
+        for _, op, entry in self.journal.replay(journal_seq):
+            self._apply_operation(op, entry)
+            replayed += 1
+        if replayed:
+            print(f"Из журнала профиля применено записей: {replayed}")
+    
+    def _apply_operation(self, op: str, entry: Dict[str, Any]):
+        """Применить одну операцию журнала к данным профиля"""
+        if op == 'favorite':
+            self.user_data['favorite_predictions'].append(entry)
+        elif op == 'compatibility':
+            self.user_data['compatibility_history'].append(entry)
+        else:
+            print(f"Неизвестная операция журнала профиля: {op}")
+            return
+        self.user_data['last_updated'] = entry.get('date', self.user_data['last_updated'])
+    
+    @staticmethod
+    def _restore_histories(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Заменить списки избранного и истории кольцевыми буферами
+
+        Понимает и компактный формат, и прежние списки словарей.
+        """
+        for key, (limit, fields) in HISTORY_KEYS.items():
+            data[key] = BoundedHistory.from_serialized(data.get(key), limit, fields)
+        return data
+    
+    def _serializable_data(self, compact: bool) -> Dict[str, Any]:
+        """Данные профиля для JSON: истории компактно или обычными списками"""
+        data = dict(self.user_data)
+        for key in HISTORY_KEYS:
+            history = data[key]
+            data[key] = history.to_compact() if compact else history.to_list()
+        return data
+    
+    def _record_operation(self, op: str, entry: Dict[str, Any]):
+        """Применить операцию и при автосохранении дописать её в журнал"""
+        with self._lock:
+            self._apply_operation(op, entry)
+            if not self.user_data['settings']['auto_save']:
+                return
+            # Запись сначала попадает в журнал; если дописать не удалось или журнал
+            # пора сжать, снимок сохраняется сразу, а не по таймеру save_delay
+            appended = self.journal.append(op, entry)
+            if not appended or self.journal.needs_compaction():
+                self.save_profile()
+    
+    def _auto_save(self):
+        """Автосохранение: сразу или отложенно (см. save_delay)"""
+        if self.save_delay <= 0:
+            self.save_profile()
+            return
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                # Таймер не перезапускается: задержка от первого изменения ограничена
+                self._save_timer = threading.Timer(self.save_delay, self._save_from_timer)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def _save_from_timer(self):
+        with self._lock:
+            self._save_timer = None
+            if self._dirty:
+                self.save_profile()
+    
+    def flush(self) -> bool:
+        """Немедленно сохранить отложенные изменения (пауза / остановка приложения)
+
+        Returns:
+            False, если сохранение не удалось; True, если всё уже на диске
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                return self.save_profile()
+        return True
+    
+    def has_unsaved_changes(self) -> bool:
+        """Есть ли изменения, ещё не записанные на диск"""
+        return self._dirty
+    
+    def _decode_profile(self, encrypted_data: str) -> Optional[Dict[str, Any]]:
+        """Расшифровать и разобрать содержимое файла профиля"""
+        decrypted_data = self.encryption_manager.decrypt(encrypted_data)
+        if not decrypted_data:
+            return None
+        return json.loads(decrypted_data)
+    
     def save_profile(self) -> bool:
         """Сохранить профиль в файл"""
+        with self._lock:
+            saved = self._write_profile()
+            if saved:
+                self._dirty = False
+            return saved
+    
+    def _write_profile(self) -> bool:
+        """Зашифровать и атомарно записать снимок профиля"""
         try:
             print("Сохранение профиля...")
             # Обновляем время последнего изменения
             self.user_data['last_updated'] = datetime.now().isoformat()
             
-            # Шифруем данные
-            json_data = json.dumps(self.user_data, ensure_ascii=False, indent=2)
+            # Шифруем данные; journal_seq - последняя запись журнала, уже вошедшая в снимок
+            snapshot = self._serializable_data(compact=True)
+            snapshot['journal_seq'] = self.journal.last_seq
+            json_data = json.dumps(snapshot, ensure_ascii=False, separators=(',', ':'))
             encrypted_data = self.encryption_manager.encrypt(json_data)
             
             if encrypted_data:
-                # Создаем директорию если не существует
-                os.makedirs(os.path.dirname(self.profile_file), exist_ok=True)
-                
-                with open(self.profile_file, 'w', encoding='utf-8') as f:
-                    f.write(encrypted_data)
+                # Атомарная запись: при сбое остаётся прежний файл и его резервная копия
+                atomic_write_text(self.profile_file, encrypted_data, backups=PROFILE_BACKUPS)
+                # Снимок содержит все записи журнала - журнал больше не нужен
+                self.journal.truncate()
                 print(f"Профиль сохранен в {self.profile_file}")
                 return True
             else:
@@ -116,27 +286,29 @@ class UserProfile:
     def set_personal_info(self, name: str, birth_day: int, birth_month: int, 
                          birth_year: int = 0, birth_place: str = ''):
         """Установить персональную информацию"""
-        self.user_data['name'] = name
-        self.user_data['birth_date'] = {
-            'day': birth_day,
-            'month': birth_month,
-            'year': birth_year
-        }
-        self.user_data['birth_place'] = birth_place
-        
-        # Автоматически сохраняем если включена автозапись
-        if self.user_data['settings']['auto_save']:
-            self.save_profile()
+        with self._lock:
+            self.user_data['name'] = name
+            self.user_data['birth_date'] = {
+                'day': birth_day,
+                'month': birth_month,
+                'year': birth_year
+            }
+            self.user_data['birth_place'] = birth_place
+            
+            # Автоматически сохраняем если включена автозапись
+            if self.user_data['settings']['auto_save']:
+                self._auto_save()
     
     def set_zodiac_info(self, zodiac_sign: str, element: str = '', ruling_planet: str = ''):
         """Установить астрологическую информацию"""
-        self.user_data['zodiac_sign'] = zodiac_sign
-        self.user_data['element'] = element
-        self.user_data['ruling_planet'] = ruling_planet
-        
-        # Автоматически сохраняем если включена автозапись
-        if self.user_data['settings']['auto_save']:
-            self.save_profile()
+        with self._lock:
+            self.user_data['zodiac_sign'] = zodiac_sign
+            self.user_data['element'] = element
+            self.user_data['ruling_planet'] = ruling_planet
+            
+            # Автоматически сохраняем если включена автозапись
+            if self.user_data['settings']['auto_save']:
+                self._auto_save()
     
     def add_favorite_prediction(self, prediction_type: str, prediction_text: str):
         """Добавить предсказание в избранное"""
@@ -146,14 +318,8 @@ class UserProfile:
             'date': datetime.now().isoformat()
         }
         
-        # Ограничиваем количество избранных предсказаний
-        if len(self.user_data['favorite_predictions']) >= 50:
-            self.user_data['favorite_predictions'].pop(0)  # Удаляем самое старое
-        
-        self.user_data['favorite_predictions'].append(favorite)
-        
-        if self.user_data['settings']['auto_save']:
-            self.save_profile()
+        # Количество избранных ограничено FAVORITES_LIMIT
+        self._record_operation('favorite', favorite)
     
     def add_compatibility_result(self, sign1: str, sign2: str, relationship_type: str, 
                                score: int, description: str):
@@ -167,22 +333,17 @@ class UserProfile:
             'date': datetime.now().isoformat()
         }
         
-        # Ограничиваем количество записей в истории
-        if len(self.user_data['compatibility_history']) >= 100:
-            self.user_data['compatibility_history'].pop(0)  # Удаляем самую старую
-        
-        self.user_data['compatibility_history'].append(result)
-        
-        if self.user_data['settings']['auto_save']:
-            self.save_profile()
+        # Количество записей в истории ограничено HISTORY_LIMIT
+        self._record_operation('compatibility', result)
     
     def update_setting(self, setting_name: str, value: Any):
         """Обновить настройку"""
-        if setting_name in self.user_data['settings']:
-            self.user_data['settings'][setting_name] = value
-            
-            if self.user_data['settings']['auto_save']:
-                self.save_profile()
+        with self._lock:
+            if setting_name in self.user_data['settings']:
+                self.user_data['settings'][setting_name] = value
+                
+                if self.user_data['settings']['auto_save']:
+                    self._auto_save()
     
     def get_setting(self, setting_name: str, default_value: Any = None) -> Any:
         """Получить значение настройки"""
@@ -206,11 +367,11 @@ class UserProfile:
     
     def get_favorite_predictions(self, limit: int = 10) -> list:
         """Получить избранные предсказания"""
-        return self.user_data['favorite_predictions'][-limit:]
+        return self.user_data['favorite_predictions'].last(limit)
     
     def get_compatibility_history(self, limit: int = 10) -> list:
         """Получить историю совместимости"""
-        return self.user_data['compatibility_history'][-limit:]
+        return self.user_data['compatibility_history'].last(limit)
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Получить все настройки"""
@@ -229,8 +390,8 @@ class UserProfile:
         self.user_data['zodiac_sign'] = ''
         self.user_data['element'] = ''
         self.user_data['ruling_planet'] = ''
-        self.user_data['favorite_predictions'] = []
-        self.user_data['compatibility_history'] = []
+        self.user_data['favorite_predictions'].clear()
+        self.user_data['compatibility_history'].clear()
         
         # Сохраняем очищенный профиль
         self.save_profile()
@@ -239,7 +400,7 @@ class UserProfile:
         """Экспортировать профиль в файл"""
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.user_data, f, ensure_ascii=False, indent=2)
+                json.dump(self._serializable_data(compact=False), f, ensure_ascii=False, indent=2)
             return True
         except Exception as e:
             print(f"Ошибка экспорта профиля: {e}")
@@ -253,7 +414,7 @@ class UserProfile:
             
             # Проверяем структуру данных
             if self._validate_profile_structure(imported_data):
-                self.user_data = imported_data
+                self.user_data = self._restore_histories(imported_data)
                 self.save_profile()
                 return True
         except Exception as e:
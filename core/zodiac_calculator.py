@@ -2,47 +2,113 @@
 # -*- coding: utf-8 -*-
 """
 Калькулятор знаков зодиака
+
+Знак определяется по заранее построенной таблице: день года (366 дней,
+29 февраля включено) -> номер знака. Несуществующие даты (31 февраля,
+31 апреля и т.п.) дают "Не определено".
 """
 
+from array import array
+from typing import List, Sequence
+
+from .zodiac_data import ZODIAC_SIGNS
+
+UNKNOWN_SIGN = "Не определено"
+
+# Порядок знаков = номера в таблицах
+ZODIAC_SIGN_NAMES = tuple(ZODIAC_SIGNS)
+
+# Первый день каждого знака: (месяц, день, номер знака)
+SIGN_STARTS = (
+    (1, 20, 10), (2, 19, 11), (3, 21, 0), (4, 20, 1), (5, 21, 2), (6, 21, 3),
+    (7, 23, 4), (8, 23, 5), (9, 23, 6), (10, 23, 7), (11, 22, 8), (12, 22, 9),
+)
+
+# Дней в месяце без учёта года (29 февраля допустимо)
+DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+INVALID_ORDINAL = -1
+
+
+def _build_day_of_year_table() -> array:
+    """Номер знака для каждого из 366 дней года"""
+    table = array('b')
+    sign = 9  # 1-19 января - Козерог
+    starts = {(month, day): ordinal for month, day, ordinal in SIGN_STARTS}
+    for month in range(1, 13):
+        for day in range(1, DAYS_IN_MONTH[month] + 1):
+            sign = starts.get((month, day), sign)
+            table.append(sign)
+    return table
+
+
+def _build_date_table(day_of_year: array) -> array:
+    """Плоская таблица [месяц * 32 + день] -> номер знака или -1"""
+    table = array('b', [INVALID_ORDINAL]) * (13 * 32)
+    position = 0
+    for month in range(1, 13):
+        for day in range(1, DAYS_IN_MONTH[month] + 1):
+            table[month * 32 + day] = day_of_year[position]
+            position += 1
+    return table
+
+
+DAY_OF_YEAR_SIGNS = _build_day_of_year_table()
+_DATE_SIGNS = _build_date_table(DAY_OF_YEAR_SIGNS)
+_SIGN_NAMES_OR_UNKNOWN = ZODIAC_SIGN_NAMES + (UNKNOWN_SIGN,)  # индекс -1 -> "Не определено"
+# То же по названиям: [месяц * 32 + день] -> знак или "Не определено"
+_DATE_NAMES = tuple(_SIGN_NAMES_OR_UNKNOWN[ordinal] for ordinal in _DATE_SIGNS)
+
+
+def get_zodiac_ordinal(day: int, month: int) -> int:
+    """
+    Номер знака зодиака (индекс в ZODIAC_SIGN_NAMES) или -1 для неверной даты
+    """
+    if 0 < month < 13 and 0 < day < 32:
+        return _DATE_SIGNS[month * 32 + day]
+    return INVALID_ORDINAL
+
+
 def get_zodiac_sign(day: int, month: int) -> str:
     """
     Определяет знак зодиака по дате рождения
-    
+
     Args:
         day: День рождения (1-31)
         month: Месяц рождения (1-12)
-    
+
     Returns:
         str: Название знака зодиака на русском языке
+             ("Не определено" для несуществующей даты)
+    """
+    if 0 < month < 13 and 0 < day < 32:
+        return _DATE_NAMES[month * 32 + day]
+    return UNKNOWN_SIGN
+
+
+def get_zodiac_ordinals(days: Sequence[int], months: Sequence[int]) -> array:
+    """
+    Номера знаков для набора дат (списки, кортежи или array)
+
+    Returns:
+        array('b') номеров знаков; -1 для неверных дат
+    """
+    if len(days) != len(months):
+        raise ValueError("Длины days и months не совпадают")
+    table = _DATE_SIGNS
+    return array('b', [table[m * 32 + d] if 0 < m < 13 and 0 < d < 32 else INVALID_ORDINAL
+                       for d, m in zip(days, months)])
+
+
+def get_zodiac_signs(days: Sequence[int], months: Sequence[int]) -> List[str]:
+    """
+    Знаки зодиака для набора дат (списки, кортежи или array)
+
+    Returns:
+        Список названий знаков; "Не определено" для неверных дат
     """
-    # Проверка валидности даты
-    if not (1 <= day <= 31 and 1 <= month <= 12):
-        return "Не определено"
-    
-    # Определение знака зодиака
-    if (month == 3 and day >= 21) or (month == 4 and day <= 19):
-        return "Овен"
-    elif (month == 4 and day >= 20) or (month == 5 and day <= 20):
-        return "Телец"
-    elif (month == 5 and day >= 21) or (month == 6 and day <= 20):
-        return "Близнецы"
-    elif (month == 6 and day >= 21) or (month == 7 and day <= 22):
-        return "Рак"
-    elif (month == 7 and day >= 23) or (month == 8 and day <= 22):
-        return "Лев"
-    elif (month == 8 and day >= 23) or (month == 9 and day <= 22):
-        return "Дева"
-    elif (month == 9 and day >= 23) or (month == 10 and day <= 22):
-        return "Весы"
-    elif (month == 10 and day >= 23) or (month == 11 and day <= 21):
-        return "Скорпион"
-    elif (month == 11 and day >= 22) or (month == 12 and day <= 21):
-        return "Стрелец"
-    elif (month == 12 and day >= 22) or (month == 1 and day <= 19):
-        return "Козерог"
-    elif (month == 1 and day >= 20) or (month == 2 and day <= 18):
-        return "Водолей"
-    elif (month == 2 and day >= 19) or (month == 3 and day <= 20):
-        return "Рыбы"
-    else:
-        return "Не определено"
\ No newline at end of file
+    if len(days) != len(months):
+        raise ValueError("Длины days и months не совпадают")
+    table = _DATE_NAMES
+    return [table[m * 32 + d] if 0 < m < 13 and 0 < d < 32 else UNKNOWN_SIGN
+            for d, m in zip(days, months)]
@@ -204,4 +204,122 @@ ZODIAC_DATA = {
         "lucky_numbers": [7, 16, 25, 34],
         "lucky_days": ["Четверг", "Пятница"]
     }
-}
\ No newline at end of file
+}
+
+# Тематические фразы для ежедневного гороскопа (horoscope_engine)
+THEMES_TO_PHRASES = {
+    "Любовь": [
+        "Искренний разговор сблизит вас с партнёром.",
+        "Небольшой знак внимания скажет больше долгих объяснений.",
+        "Одиноким стоит чаще бывать среди людей: новое знакомство возможно.",
+        "Не торопите события - чувства раскроются в своё время.",
+        "Совместные планы на выходные укрепят отношения.",
+        "Прислушайтесь к настроению близкого человека и поддержите его.",
+        "Старая обида потеряет силу, если вы первыми сделаете шаг навстречу.",
+        "Романтический вечер удастся даже без особых приготовлений.",
+    ],
+    "Карьера": [
+        "Хороший день для того, чтобы предложить руководству свою идею.",
+        "Доведите до конца давно начатое дело - это заметят.",
+        "Коллега может попросить о помощи: ваш опыт окажется кстати.",
+        "Не берите на себя лишние обязательства, сосредоточьтесь на главном.",
+        "Переговоры пройдут успешно, если заранее продумать аргументы.",
+        "Рутинная работа сегодня даётся легко - используйте это.",
+        "Новая задача откроет перспективы, о которых вы не думали.",
+        "Проверьте документы внимательнее обычного: мелочи важны.",
+    ],
+    "Финансы": [
+        "Удачный день для планирования бюджета на месяц.",
+        "Воздержитесь от спонтанных покупок.",
+        "Возможен небольшой, но приятный доход.",
+        "Старый долг может вернуться неожиданно.",
+        "Вложения в обучение окупятся быстрее, чем кажется.",
+        "Сравните предложения, прежде чем принимать финансовое решение.",
+        "Не одалживайте крупные суммы без гарантий.",
+        "Экономия на мелочах сегодня принесёт ощутимый результат.",
+    ],
+    "Здоровье": [
+        "Прогулка на свежем воздухе вернёт силы.",
+        "Ложитесь спать пораньше - организму нужен отдых.",
+        "Лёгкая зарядка утром задаст тон всему дню.",
+        "Пейте больше воды и меньше кофе.",
+        "Не игнорируйте усталость: сделайте паузу.",
+        "Хороший день, чтобы начать новую полезную привычку.",
+        "Спокойная музыка поможет снять напряжение.",
+        "Уделите внимание осанке и разминке при сидячей работе.",
+    ],
+    "Совет дня": [
+        "Доверьтесь интуиции в сомнительной ситуации.",
+        "Начните с самого сложного дела - дальше будет легче.",
+        "Скажите спасибо тем, кто вам помогает.",
+        "Оставьте немного времени только для себя.",
+        "Не бойтесь просить о помощи.",
+        "Запишите идеи, которые придут сегодня, - они пригодятся.",
+        "Улыбка откроет больше дверей, чем настойчивость.",
+        "Завершите старое, прежде чем браться за новое.",
+    ],
+}
+
+# Варианты общего гороскопа на день по знакам (HoroscopeGenerator)
+DAILY_HOROSCOPES = {
+    "Овен": [
+        "Энергия бьёт ключом: направьте её на дело, которое давно откладывали.",
+        "Ваша решительность поможет сдвинуть с места застоявшийся вопрос.",
+        "День подходит для смелых шагов, но не забывайте о тех, кто рядом.",
+    ],
+    "Телец": [
+        "Стабильность и терпение сегодня - ваши главные союзники.",
+        "Хороший день, чтобы навести порядок в делах и финансах.",
+        "Простые радости принесут больше удовольствия, чем громкие события.",
+    ],
+    "Близнецы": [
+        "Общение откроет новые возможности: не отказывайтесь от встреч.",
+        "Любопытство приведёт вас к полезной информации.",
+        "Постарайтесь не распыляться - выберите одно главное дело.",
+    ],
+    "Рак": [
+        "Дом и близкие подарят чувство опоры и спокойствия.",
+        "Интуиция подскажет верное решение в личном вопросе.",
+        "Позаботьтесь о себе так же, как заботитесь о других.",
+    ],
+    "Лев": [
+        "Ваша уверенность вдохновит окружающих.",
+        "Творческие идеи сегодня особенно удачны - воплощайте их.",
+        "Признание заслуг уже близко, продолжайте в том же духе.",
+    ],
+    "Дева": [
+        "Внимание к деталям принесёт заметный результат.",
+        "Хороший день для планирования и наведения порядка.",
+        "Не требуйте от себя совершенства - достаточно хорошо тоже хорошо.",
+    ],
+    "Весы": [
+        "Гармония в отношениях поможет и в делах.",
+        "Умение договариваться сегодня особенно ценно.",
+        "Прекрасный день для встреч, искусства и красоты.",
+    ],
+    "Скорпион": [
+        "Сосредоточенность поможет довести до конца сложную задачу.",
+        "Доверьтесь своей проницательности - она не подведёт.",
+        "Перемены к лучшему начинаются с честного взгляда на ситуацию.",
+    ],
+    "Стрелец": [
+        "Новые горизонты зовут: день подходит для планов и поездок.",
+        "Оптимизм поможет найти выход из запутанной ситуации.",
+        "Учёба и новые знания принесут удовольствие и пользу.",
+    ],
+    "Козерог": [
+        "Упорство приближает вас к цели шаг за шагом.",
+        "Хороший день для серьёзных решений и долгосрочных планов.",
+        "Не забывайте отдыхать - силы понадобятся для важного рывка.",
+    ],
+    "Водолей": [
+        "Необычная идея может оказаться удачной - не отбрасывайте её.",
+        "Друзья и единомышленники поддержат ваши начинания.",
+        "Свобода действий сегодня принесёт лучшие результаты.",
+    ],
+    "Рыбы": [
+        "Творчество и интуиция помогут найти нестандартное решение.",
+        "Прислушайтесь к своим чувствам - они подскажут верный путь.",
+        "Спокойный день для мечтаний и тихих радостей.",
+    ],
+}
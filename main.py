@@ -24,7 +24,7 @@ from ui.screens.profile_screen import ProfileScreen
 
 # Импорты core модулей
 from core.zodiac_calculator import get_zodiac_sign
-from core.daily_manager import get_daily_general_prediction
+from core.daily_manager import get_daily_general_prediction, get_daily_bundle
 from core.compatibility_calculator import CompatibilityCalculator
 from core.user_profile import UserProfile
 from core.notification_system import NotificationSystem
@@ -69,6 +69,15 @@ class ZodiMobileApp(App):
         # Переход к главному экрану через 3 секунды
         Clock.schedule_once(self.goto_main_screen, 3)
     
+    def on_pause(self):
+        """Приложение уходит в фон: сохраняем отложенные изменения профиля"""
+        self.user_profile.flush()
+        return True
+    
+    def on_stop(self):
+        """Завершение приложения: сохраняем отложенные изменения профиля"""
+        self.user_profile.flush()
+    
     def goto_main_screen(self, dt):
         """Переход к главному экрану"""
         if self.user_profile.has_profile():
@@ -101,16 +110,9 @@ class ZodiMobileApp(App):
     def get_detailed_predictions(self, zodiac_sign):
         """Получить детальные предсказания"""
         try:
-            # Здесь будет логика получения детальных предсказаний
-            return {
-                'love': 'В любви вас ждут приятные моменты.',
-                'career': 'Карьера развивается в положительном направлении.',
-                'health': 'Здоровье требует внимания.',
-                'finance': 'Финансы стабильны.',
-                'advice': 'Слушайте свою интуицию.',
-                'opportunities': 'Новые возможности на горизонте.',
-                'warnings': 'Будьте осторожны с важными решениями.'
-            }
+            bundle = get_daily_bundle(zodiac_sign)
+            bundle.pop('general', None)
+            return bundle
         except Exception as e:
             print(f"Ошибка получения детальных предсказаний: {e}")
             return {}
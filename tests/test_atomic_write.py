@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Тесты атомарной записи: прерванная запись не портит файл."""
+
+import json
+import os
+
+import pytest
+
+from core import atomic_write
+from core.atomic_write import atomic_write_text, backup_path, read_first_valid
+
+
+def _leftover_tmp(directory):
+    return [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+
+def test_write_replaces_content(tmp_path):
+    target = tmp_path / 'data.json'
+    atomic_write_text(str(target), 'первая версия')
+    atomic_write_text(str(target), 'вторая версия')
+    assert target.read_text(encoding='utf-8') == 'вторая версия'
+    assert _leftover_tmp(tmp_path) == []
+
+
+def test_failed_replace_keeps_old_file(tmp_path, monkeypatch):
+    target = tmp_path / 'data.json'
+    target.write_text('старое', encoding='utf-8')
+
+    def broken_replace(src, dst):
+        raise OSError('сбой при подмене файла')
+
+    monkeypatch.setattr(atomic_write.os, 'replace', broken_replace)
+    with pytest.raises(OSError):
+        atomic_write_text(str(target), 'новое')
+
+    assert target.read_text(encoding='utf-8') == 'старое'
+    assert _leftover_tmp(tmp_path) == []
+
+
+def test_failed_write_keeps_old_file(tmp_path, monkeypatch):
+    target = tmp_path / 'data.json'
+    target.write_text('старое', encoding='utf-8')
+
+    def broken_fsync(fd):
+        raise OSError('диск отключён')
+
+    monkeypatch.setattr(atomic_write.os, 'fsync', broken_fsync)
+    with pytest.raises(OSError):
+        atomic_write_text(str(target), 'новое')
+
+    assert target.read_text(encoding='utf-8') == 'старое'
+    assert _leftover_tmp(tmp_path) == []
+
+
+def test_backups_rotate(tmp_path):
+    target = str(tmp_path / 'profile.json')
+    for version in ('v1', 'v2', 'v3'):
+        atomic_write_text(target, version, backups=2)
+    with open(target, encoding='utf-8') as f:
+        assert f.read() == 'v3'
+    with open(backup_path(target, 1), encoding='utf-8') as f:
+        assert f.read() == 'v2'
+    with open(backup_path(target, 2), encoding='utf-8') as f:
+        assert f.read() == 'v1'
+
+
+def test_read_first_valid_falls_back_to_backup(tmp_path):
+    target = str(tmp_path / 'profile.json')
+    atomic_write_text(target, json.dumps({'version': 1}), backups=1)
+    atomic_write_text(target, json.dumps({'version': 2}), backups=1)
+    # Основной файл повреждён (например, обрезан при сбое)
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write('{"version": ')
+
+    result, source = read_first_valid(target, 1, json.loads)
+    assert result == {'version': 1}
+    assert source == backup_path(target, 1)
+
+
+def test_read_first_valid_nothing_valid(tmp_path):
+    target = str(tmp_path / 'missing.json')
+    assert read_first_valid(target, 2, json.loads) == (None, None)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Тесты разбора дат рождения и классификации строк CSV."""
+
+import pytest
+
+from core.birthdate_classifier import classify_chunk, parse_day_month
+from core.zodiac_calculator import UNKNOWN_SIGN
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('1990-05-25', (25, 5)),
+    ('1990-05-25T10:30:00', (25, 5)),
+    ('25-05-1990', (25, 5)),
+    ('25.05.1990', (25, 5)),
+    ('25/05/1990', (25, 5)),
+    (' 01.12.2000 ', (1, 12)),
+    ('90-05-25', (0, 0)),
+    ('2000', (0, 0)),
+    ('', (0, 0)),
+    ('дата', (0, 0)),
+])
+def test_parse_day_month(value, expected):
+    assert parse_day_month(value) == expected
+
+
+def test_classify_chunk_day_first_with_dashes():
+    rows = classify_chunk([['Анна', '25-05-1990'], ['Иван', '1990-05-25'], ['Олег', '??']], 1)
+    assert rows[0][2] == 'Близнецы'
+    assert rows[1][2] == 'Близнецы'
+    assert rows[2][2] == UNKNOWN_SIGN
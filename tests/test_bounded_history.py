@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Тесты кольцевой истории профиля и её компактной сериализации."""
+
+import json
+from datetime import datetime
+
+from core.bounded_history import (COMPATIBILITY_FIELDS, FAVORITE_FIELDS, LEGACY_EPOCH_FORMAT,
+                                  BoundedHistory)
+
+ENTRIES = [
+    {'sign1': 'Овен', 'sign2': 'Рыбы', 'relationship_type': 'romantic', 'score': 87,
+     'description': 'Хорошая совместимость.', 'date': '2024-03-31T02:30:15.123456'},
+    {'sign1': 'Дева', 'sign2': 'Лев', 'relationship_type': 'business', 'score': 40,
+     'description': 'Умеренная совместимость.', 'date': '2024-10-27T03:00:00'},
+    # Не сжимаемые значения сохраняются как есть
+    {'sign1': 'Дракон', 'sign2': 'Лев', 'relationship_type': 'family', 'score': 50,
+     'description': '', 'date': '2024-05-01T10:00:00+03:00'},
+    {'sign1': 'Рак', 'sign2': 'Рак', 'relationship_type': 'family', 'score': 90,
+     'description': '', 'date': 'вчера'},
+]
+
+
+def test_bounded_length():
+    history = BoundedHistory(3, FAVORITE_FIELDS)
+    for i in range(5):
+        history.append({'type': 'general', 'text': f'fav{i}', 'date': ''})
+    assert [entry['text'] for entry in history] == ['fav2', 'fav3', 'fav4']
+    assert [entry['text'] for entry in history.last(2)] == ['fav3', 'fav4']
+    assert history.last(0) == []
+
+
+def test_compact_round_trip_is_lossless():
+    history = BoundedHistory(10, COMPATIBILITY_FIELDS, ENTRIES)
+    compact = json.loads(json.dumps(history.to_compact(), ensure_ascii=False))
+    assert compact['rows'][0][:2] == [0, 11]
+    assert isinstance(compact['rows'][0][-1], int)
+
+    restored = BoundedHistory.from_serialized(compact, 10, COMPATIBILITY_FIELDS)
+    assert restored.to_list() == ENTRIES
+
+
+def test_reads_legacy_list_of_dicts():
+    restored = BoundedHistory.from_serialized(ENTRIES + ['мусор'], 2, COMPATIBILITY_FIELDS)
+    assert restored.to_list() == ENTRIES[-2:]
+
+
+def test_reads_first_compact_format():
+    stamp = int(datetime(2024, 1, 2, 3, 4, 5).timestamp())
+    data = {'format': LEGACY_EPOCH_FORMAT, 'fields': ['type', 'text', 'date'],
+            'rows': [['general', 'текст', stamp]]}
+    restored = BoundedHistory.from_serialized(data, 5, FAVORITE_FIELDS)
+    assert restored.to_list() == [{'type': 'general', 'text': 'текст', 'date': '2024-01-02T03:04:05'}]
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Тесты баллов совместимости и ранжирования партнёров."""
+
+import pytest
+
+from core.compatibility_calculator import CompatibilityCalculator
+
+
+@pytest.fixture(scope='module')
+def calculator():
+    return CompatibilityCalculator()
+
+
+@pytest.mark.parametrize('sign1, sign2, relationship_type, expected', [
+    # база 80 + парная поправка JSON 8 (вместо общей 5) + элементы 10
+    ('Овен', 'Водолей', 'friendship', 98),
+    # база 30 + парная поправка JSON -5 + элементы -5
+    ('Овен', 'Козерог', 'business', 20),
+    # пары нет в relationship_adjustments: общая поправка семьи 10
+    ('Овен', 'Близнецы', 'family', 90),
+    ('Овен', 'Близнецы', 'romantic', 80),
+])
+def test_pinned_scores(calculator, sign1, sign2, relationship_type, expected):
+    result = calculator.calculate_compatibility(sign1, sign2, relationship_type)
+    assert result['score'] == expected
+    row = calculator.all_pairs_matrix(relationship_type)[calculator.get_all_signs().index(sign1)]
+    assert row[calculator.get_all_signs().index(sign2)] == expected
+
+
+def test_ranking_orders_capped_scores(calculator):
+    ranked = calculator.rank_partners('Овен', 'romantic', 3)
+    # У всех троих балл 100, но суммы до ограничения разные: 125, 115, 100
+    assert ranked == [('Стрелец', 100), ('Лев', 100), ('Овен', 100)]
+
+
+def test_ranking_is_sorted_and_complete(calculator):
+    ranked = calculator.rank_partners('Рак', 'business')
+    assert len(ranked) == 12
+    scores = [score for _, score in ranked]
+    assert scores == sorted(scores, reverse=True)
+    assert calculator.rank_partners('Дракон') == []
+    assert calculator.rank_partners('Рак', 'unknown') == []
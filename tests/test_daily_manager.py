@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Тесты календаря ежедневных предсказаний и наборов дня."""
+
+import json
+from datetime import date
+
+import pytest
+
+from core import daily_manager
+from core.daily_manager import BUNDLE_CATEGORIES, DailyPredictionManager
+
+
+class Clock:
+    """Подменяемая «сегодняшняя» дата для модуля daily_manager."""
+
+    today_value = date(2030, 1, 1)
+
+
+class FakeDate(date):
+    @classmethod
+    def today(cls):
+        return Clock.today_value
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    cache = tmp_path / 'daily_predictions.json'
+    monkeypatch.setattr(daily_manager, 'CACHE_PATH', str(cache))
+    monkeypatch.setattr(daily_manager, 'BUNDLES_PATH', str(tmp_path / 'daily_bundles.json'))
+    monkeypatch.setattr(daily_manager, 'date', FakeDate)
+    monkeypatch.setattr(Clock, 'today_value', date(2030, 1, 1))
+    return cache
+
+
+def _cached_days(cache):
+    with open(cache, encoding='utf-8') as f:
+        return sorted(json.load(f)['days'])
+
+
+def test_daily_precompute_does_not_grow_cache(paths):
+    manager = DailyPredictionManager()
+    assert manager.precompute(days=3) == 3
+    assert _cached_days(paths) == ['2030-01-01', '2030-01-02', '2030-01-03']
+
+    Clock.today_value = date(2030, 1, 3)
+    manager.precompute(days=3)
+    assert _cached_days(paths) == ['2030-01-03', '2030-01-04', '2030-01-05']
+
+    # Новый экземпляр (следующий запуск приложения) тоже не тянет прошлые дни
+    Clock.today_value = date(2030, 1, 5)
+    DailyPredictionManager().precompute(days=1)
+    assert _cached_days(paths) == ['2030-01-05']
+
+
+def test_precomputed_days_match_on_demand(paths):
+    manager = DailyPredictionManager()
+    manager.precompute(days=2)
+    # Сохранённый день совпадает с расчётом по требованию
+    assert DailyPredictionManager().get_day(date(2030, 1, 2)) == manager._generate_full_day('2030-01-02')
+
+
+def test_bundle_has_all_sections_and_rolls_over(paths):
+    manager = DailyPredictionManager()
+    first = manager.get_bundle('Лев')
+    assert tuple(first) == BUNDLE_CATEGORIES
+    assert all(first.values())
+    assert first['general'] == manager.get_general_for_sign('Лев')
+
+    Clock.today_value = date(2030, 1, 2)
+    assert manager.get_bundle('Лев') == manager.get_bundle('Лев', for_date=date(2030, 1, 2))
+    assert manager.get_bundle('Лев') != first
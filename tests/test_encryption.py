@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Тесты общего кеша шифров EncryptionManager."""
+
+import os
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+from core import encryption
+from core.encryption import EncryptionManager, invalidate_cipher_cache
+
+
+@pytest.fixture
+def key_file(tmp_path):
+    path = str(tmp_path / '.zodi_key')
+    yield path
+    with encryption._cipher_lock:
+        encryption._cipher_cache.pop(os.path.realpath(path), None)
+
+
+def test_instances_share_cipher(key_file):
+    first = EncryptionManager(key_file)
+    second = EncryptionManager(key_file)
+    assert first.cipher_suite is second.cipher_suite
+    assert second.decrypt(first.encrypt('секрет')) == 'секрет'
+
+
+def test_operations_do_not_stat_key_file(key_file, monkeypatch):
+    manager = EncryptionManager(key_file)
+    calls = []
+    monkeypatch.setattr(encryption, '_key_stamp', lambda path: calls.append(path))
+    for i in range(10):
+        assert manager.decrypt(manager.encrypt(f'запись {i}')) == f'запись {i}'
+    assert calls == []
+
+
+def test_unreadable_key_change_keeps_loaded_key(key_file):
+    manager = EncryptionManager(key_file)
+    token = manager.encrypt('профиль')
+    with open(key_file, 'rb') as f:
+        original_key = f.read()
+
+    # Файл ключа переписывается другим процессом и пока обрезан
+    with open(key_file, 'wb') as f:
+        f.write(original_key[:10])
+    invalidate_cipher_cache(key_file)
+
+    assert manager.decrypt(token) == 'профиль'
+    assert EncryptionManager(key_file).decrypt(token) == 'профиль'
+    with open(key_file, 'rb') as f:
+        assert f.read() == original_key[:10]
+
+
+def test_replaced_key_is_picked_up_after_invalidation(key_file):
+    manager = EncryptionManager(key_file)
+    old_cipher = manager.cipher_suite
+    with open(key_file, 'wb') as f:
+        f.write(encryption.Fernet.generate_key() + b'\n')
+
+    # Новый экземпляр сверяет файл сам, прежний - после явного сброса
+    assert EncryptionManager(key_file).cipher_suite is not old_cipher
+    invalidate_cipher_cache(key_file)
+    assert manager.cipher_suite is not old_cipher
+
+
+def test_restore_corrupt_backup_keeps_key(key_file, tmp_path):
+    manager = EncryptionManager(key_file)
+    token = manager.encrypt('профиль')
+    with open(key_file, 'rb') as f:
+        original_key = f.read()
+    backup = tmp_path / 'broken.key'
+    backup.write_bytes(b'not a fernet key')
+
+    assert manager.restore_key(str(backup)) is False
+    assert manager.decrypt(token) == 'профиль'
+    assert EncryptionManager(key_file).decrypt(token) == 'профиль'
+    with open(key_file, 'rb') as f:
+        assert f.read() == original_key
+
+
+def test_restore_valid_backup_switches_all_instances(key_file, tmp_path):
+    manager = EncryptionManager(key_file)
+    other = EncryptionManager(key_file)
+    backup = tmp_path / 'backup.key'
+    backup.write_bytes(encryption.Fernet.generate_key())
+
+    assert manager.restore_key(str(backup)) is True
+    token = manager.encrypt('профиль')
+    assert other.decrypt(token) == 'профиль'
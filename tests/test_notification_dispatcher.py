@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Тесты массовой рассылки на FakeTransport (без FCM/APNs)."""
+
+import pytest
+
+from core.notification_dispatcher import (FakeTransport, NotificationDispatcher,
+                                          NotificationTransport, Recipient)
+from core.zodiac_data import ZODIAC_SIGNS
+
+
+def _render(sign):
+    return {'title': f'{sign} - сегодня', 'content': f'Предсказание для знака {sign}'}
+
+
+def _recipients(count):
+    for i in range(count):
+        yield Recipient(f'token{i}', 'android' if i % 3 else 'ios', ZODIAC_SIGNS[i % 12])
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        NotificationTransport()
+
+
+def test_batches_and_renders_once_per_sign():
+    transport = FakeTransport(latency=0.002)
+    dispatcher = NotificationDispatcher(transport, _render, batch_size=50, max_workers=4, retry_delay=0)
+    report = dispatcher.dispatch(_recipients(6000))
+
+    assert report.sent == 6000
+    assert report.failed == 0
+    # Среди получателей все 12 знаков; текст строится ровно один раз на знак
+    assert report.rendered == 12
+    # 24 пары (знак, платформа) по 250 токенов - 5 пачек по 50
+    assert report.batches == transport.calls == 24 * 5
+    assert len(transport.delivered) == 6000
+    platform, title, content = transport.delivered['token13']
+    assert platform == 'android'
+    assert content == _render(ZODIAC_SIGNS[1])['content']
+    assert 1 <= transport.max_concurrency <= dispatcher.max_workers
+
+
+def test_retries_injected_failures():
+    flaky = ['token1', 'token5', 'token42']
+    transport = FakeTransport(fail_tokens=flaky + ['token7'], fail_attempts=1)
+    dispatcher = NotificationDispatcher(transport, _render, batch_size=10, max_workers=2,
+                                        max_retries=2, retry_delay=0)
+    report = dispatcher.dispatch(_recipients(100))
+
+    assert report.sent == 100
+    assert report.failed == 0
+    assert report.retries >= 1
+    assert all(token in transport.delivered for token in flaky)
+
+
+def test_permanent_failures_reported():
+    transport = FakeTransport(fail_tokens=['token3'], fail_attempts=None)
+    dispatcher = NotificationDispatcher(transport, _render, batch_size=10, max_retries=2, retry_delay=0)
+    report = dispatcher.dispatch(_recipients(30))
+
+    assert report.sent == 29
+    assert report.failed_tokens == ['token3']
+    assert 'token3' not in transport.delivered
+
+
+def test_unknown_sign_or_platform_skipped():
+    transport = FakeTransport()
+    dispatcher = NotificationDispatcher(transport, _render)
+    report = dispatcher.dispatch([
+        Recipient('a', 'android', 'Дракон'),
+        Recipient('b', 'web', ZODIAC_SIGNS[0]),
+        Recipient('c', 'ios', ZODIAC_SIGNS[0]),
+    ])
+
+    assert report.skipped == 2
+    assert report.sent == 1
+    assert report.rendered == 1
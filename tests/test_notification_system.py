@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Тесты кеша текстов уведомлений NotificationSystem."""
+
+import pytest
+
+from core import daily_manager
+from core.notification_system import NotificationSystem
+
+
+@pytest.fixture
+def system(tmp_path, monkeypatch):
+    monkeypatch.setattr(daily_manager, 'CACHE_PATH', str(tmp_path / 'daily_predictions.json'))
+    monkeypatch.setattr(daily_manager, 'BUNDLES_PATH', str(tmp_path / 'daily_bundles.json'))
+    return NotificationSystem()
+
+
+def test_content_is_cached_per_sign(system):
+    first = system.get_notification_content('Лев')
+    assert system.get_notification_content('Лев') is first
+    general = system.daily_manager.get_bundle('Лев')['general']
+    assert general in first['content']
+
+
+def test_fallback_content_is_not_cached(system, monkeypatch):
+    real_save = system.daily_manager._save_bundles
+    failures = [OSError('диск недоступен')]
+
+    def flaky_save():
+        if failures:
+            raise failures.pop()
+        real_save()
+
+    monkeypatch.setattr(system.daily_manager, '_save_bundles', flaky_save)
+    fallback = system.get_notification_content('Лев')
+    content = system.get_notification_content('Лев')
+
+    assert content != fallback
+    assert system.daily_manager.get_bundle('Лев')['general'] in content['content']
+    assert system.get_notification_content('Лев') is content
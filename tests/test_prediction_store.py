@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Тесты скомпилированного хранилища предсказаний (.zdb)."""
+
+import json
+import os
+
+from core.prediction_store import (compile_store, compiled_path_for, invalidate_compiled_store,
+                                   open_compiled_store)
+
+
+def _write_source(path, text):
+    data = {'metadata': {'categories': ['love']},
+            'predictions': {'Овен': {'love': [text, 'Второе предсказание']}}}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def test_compiled_store_matches_source(tmp_path):
+    source = str(tmp_path / 'db.json')
+    _write_source(source, 'Первое предсказание')
+    compile_store(source)
+
+    store = open_compiled_store(source)
+    assert store is not None
+    assert list(store['Овен']['love']) == ['Первое предсказание', 'Второе предсказание']
+    assert open_compiled_store(source) is store
+
+
+def test_close_evicts_shared_store(tmp_path):
+    source = str(tmp_path / 'db.json')
+    _write_source(source, 'Первое предсказание')
+    compile_store(source)
+
+    store = open_compiled_store(source)
+    store.close()
+    reopened = open_compiled_store(source)
+    assert reopened is not store
+    assert reopened.get_text('Овен', 'love', 0) == 'Первое предсказание'
+
+
+def test_same_size_edit_makes_store_stale(tmp_path):
+    source = str(tmp_path / 'db.json')
+    _write_source(source, 'Первое предсказание: Лев')
+    compile_store(source)
+    size = os.path.getsize(source)
+
+    # Замена одной кириллической буквы другой не меняет размер файла
+    _write_source(source, 'Первое предсказание: Лес')
+    assert os.path.getsize(source) == size
+    invalidate_compiled_store(source)
+
+    assert open_compiled_store(source) is None
+
+    compile_store(source)
+    store = open_compiled_store(source)
+    assert store is not None
+    assert store.get_text('Овен', 'love', 0) == 'Первое предсказание: Лес'
+    assert os.path.exists(compiled_path_for(source))
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Тесты событийного планировщика ежедневных задач."""
+
+import threading
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+import pytest
+
+from core.scheduler import DailyScheduler, next_fire_time, parse_time
+
+
+def make_clock(start):
+    """Часы, идущие от start со скоростью реального времени."""
+    origin = time.monotonic()
+    return lambda: start + timedelta(seconds=time.monotonic() - origin)
+
+
+def test_parse_time():
+    assert parse_time('07:30') == dt_time(7, 30)
+    assert parse_time('23:59:59') == dt_time(23, 59, 59)
+    with pytest.raises(ValueError):
+        parse_time('7')
+
+
+def test_next_fire_time():
+    now = datetime(2030, 1, 1, 8, 0)
+    assert next_fire_time(dt_time(9, 0), now) == datetime(2030, 1, 1, 9, 0)
+    assert next_fire_time(dt_time(8, 0), now) == datetime(2030, 1, 2, 8, 0)
+
+
+def test_fires_at_scheduled_time():
+    fired = threading.Event()
+    scheduler = DailyScheduler('07:00', fired.set,
+                               now_func=make_clock(datetime(2030, 1, 1, 6, 59, 59, 800000)))
+    scheduler.start()
+    try:
+        assert fired.wait(5)
+        assert scheduler.next_run is not None
+    finally:
+        scheduler.cancel(wait=True)
+
+
+def test_cancel_stops_immediately():
+    calls = []
+    scheduler = DailyScheduler('07:00', calls.append, 'запуск',
+                               now_func=make_clock(datetime(2030, 1, 1, 8, 0)))
+    scheduler.start()
+    assert scheduler.is_running()
+
+    started = time.monotonic()
+    scheduler.cancel(wait=True)
+    assert time.monotonic() - started < 1
+    assert not scheduler.is_running()
+    assert calls == []
+
+
+def test_reschedule_wakes_sleeping_thread():
+    fired = threading.Event()
+    scheduler = DailyScheduler('12:00', fired.set,
+                               now_func=make_clock(datetime(2030, 1, 1, 6, 59, 59, 800000)))
+    scheduler.start()
+    try:
+        assert not fired.wait(0.3)
+        assert scheduler.next_run == datetime(2030, 1, 1, 12, 0)
+        scheduler.reschedule('07:00:01')
+        assert fired.wait(5)
+    finally:
+        scheduler.cancel(wait=True)
+
+
+def test_restart_after_cancel():
+    fired = threading.Event()
+    scheduler = DailyScheduler('07:00', fired.set,
+                               now_func=make_clock(datetime(2030, 1, 1, 6, 59, 59, 500000)))
+    scheduler.start()
+    scheduler.cancel()
+    scheduler.start()
+    try:
+        assert scheduler.is_running()
+        assert fired.wait(5)
+    finally:
+        scheduler.cancel(wait=True)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Тесты отложенного сохранения профиля (save_delay, flush)."""
+
+import json
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+from core import user_profile
+from core.profile_journal import JOURNAL_COMPACT_EVERY
+from core.user_profile import FAVORITES_LIMIT, UserProfile
+
+
+class PlainEncryption:
+    """Заглушка EncryptionManager: данные хранятся без шифрования."""
+
+    def encrypt(self, data):
+        return data
+
+    def decrypt(self, data):
+        return data
+
+
+@pytest.fixture
+def make_profile(tmp_path, monkeypatch):
+    monkeypatch.setattr(user_profile, 'EncryptionManager', PlainEncryption)
+    created = []
+
+    def make(save_delay):
+        profile = UserProfile(save_delay=save_delay, data_dir=str(tmp_path))
+        writes = []
+        real_write = profile._write_profile
+
+        def counting_write():
+            writes.append(1)
+            return real_write()
+
+        profile._write_profile = counting_write
+        created.append(profile)
+        return profile, writes
+
+    yield make
+    for profile in created:
+        timer = profile._save_timer
+        if timer is not None:
+            timer.cancel()
+
+
+def _saved_data(tmp_path):
+    with open(tmp_path / 'user_profile.json', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_changes_within_window_saved_once(make_profile, tmp_path):
+    profile, writes = make_profile(save_delay=0.2)
+    for i in range(5):
+        profile.update_setting('theme', f'theme{i}')
+    timer = profile._save_timer
+    assert timer is not None
+    assert writes == []
+    assert profile.has_unsaved_changes()
+
+    timer.join(timeout=5)
+    assert len(writes) == 1
+    assert not profile.has_unsaved_changes()
+    assert _saved_data(tmp_path)['settings']['theme'] == 'theme4'
+
+
+def test_flush_persists_and_clears_dirty(make_profile, tmp_path):
+    profile, writes = make_profile(save_delay=60)
+    profile.set_zodiac_info('Лев', 'Огонь', 'Солнце')
+    assert profile.has_unsaved_changes()
+
+    assert profile.flush()
+    assert len(writes) == 1
+    assert not profile.has_unsaved_changes()
+    assert profile._save_timer is None
+    assert _saved_data(tmp_path)['zodiac_sign'] == 'Лев'
+
+    # Повторный flush без изменений ничего не пишет
+    assert profile.flush()
+    assert len(writes) == 1
+
+
+def test_zero_delay_saves_immediately(make_profile, tmp_path):
+    profile, writes = make_profile(save_delay=0)
+    profile.update_setting('theme', 'light')
+    assert len(writes) == 1
+    assert profile._save_timer is None
+    assert not profile.has_unsaved_changes()
+    assert _saved_data(tmp_path)['settings']['theme'] == 'light'
+
+
+# ------------------------- журнал и снимок -------------------------
+
+def _favorite_texts(profile):
+    return [entry['text'] for entry in profile.get_favorite_predictions(limit=1000)]
+
+
+def _crash(profile):
+    """Имитация аварийного завершения: отложенное сохранение не происходит."""
+    timer = profile._save_timer
+    if timer is not None:
+        timer.cancel()
+    profile._save_timer = None
+    profile._dirty = False
+
+
+def test_journal_replayed_without_snapshot(make_profile, tmp_path):
+    profile, writes = make_profile(save_delay=60)
+    for i in range(3):
+        profile.add_favorite_prediction('general', f'fav{i}')
+    assert writes == []
+    _crash(profile)
+    assert not (tmp_path / 'user_profile.json').exists()
+
+    restored, _ = make_profile(save_delay=60)
+    assert _favorite_texts(restored) == ['fav0', 'fav1', 'fav2']
+
+
+def test_journal_compacted_at_threshold(make_profile, tmp_path):
+    profile, writes = make_profile(save_delay=60)
+    for i in range(JOURNAL_COMPACT_EVERY):
+        profile.add_favorite_prediction('general', f'fav{i}')
+    # Запись, на которой журнал достиг порога, сохраняет снимок сразу
+    assert len(writes) == 1
+    assert not (tmp_path / 'user_profile.journal').exists()
+    assert _saved_data(tmp_path)['journal_seq'] == JOURNAL_COMPACT_EVERY
+
+    profile.add_favorite_prediction('general', 'after')
+    _crash(profile)
+    restored, _ = make_profile(save_delay=60)
+    expected = [f'fav{i}' for i in range(JOURNAL_COMPACT_EVERY)] + ['after']
+    assert _favorite_texts(restored) == expected[-FAVORITES_LIMIT:]
+
+
+def test_replay_skips_entries_already_in_snapshot(make_profile, monkeypatch):
+    profile, _ = make_profile(save_delay=60)
+    profile.add_favorite_prediction('general', 'old')
+    # Сбой между записью снимка и очисткой журнала
+    monkeypatch.setattr(profile.journal, 'truncate', lambda: None)
+    assert profile.save_profile()
+    profile.add_favorite_prediction('general', 'new')
+    _crash(profile)
+
+    restored, _ = make_profile(save_delay=60)
+    assert _favorite_texts(restored) == ['old', 'new']
+
+
+def test_torn_last_journal_line(make_profile, tmp_path):
+    profile, _ = make_profile(save_delay=60)
+    profile.add_favorite_prediction('general', 'first')
+    _crash(profile)
+    with open(tmp_path / 'user_profile.journal', 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "op": "favor')
+
+    restored, _ = make_profile(save_delay=60)
+    assert _favorite_texts(restored) == ['first']
+    restored.add_favorite_prediction('general', 'second')
+    _crash(restored)
+
+    again, _ = make_profile(save_delay=60)
+    assert _favorite_texts(again) == ['first', 'second']